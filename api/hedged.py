@@ -0,0 +1,236 @@
+"""Hedged / failover geocoding across several providers (Kakao, VWorld).
+
+    provider = HedgedGeocodingProvider([KakaoGeocodingProvider(...), VWorldGeocodingProvider(...)])
+
+- 첫 번째(열린 회로가 아닌) provider에 먼저 보내고, 최근 응답 시간의 p95가 지나도 답이 없으면
+  다음 provider에 같은 주소를 한 번 더 보냅니다(hedge). 먼저 온 유효한 답(None이 아닌 결과)을 씁니다.
+  p95를 넘는 호출에만 두 번째 요청이 나가므로 평균 호출량은 5% 안팎만 늘어납니다.
+- 오류(네트워크/HTTP, 호출 한도)나 결과 없음(None)이면 기다리지 않고 바로 다음 provider로 넘깁니다
+  (Kakao와 VWorld는 주소 커버리지가 달라서 한 쪽에 없는 주소가 다른 쪽에 있기도 함).
+- provider마다 CircuitBreaker: 연속 failure_threshold번 오류면 reset_timeout_s 동안 건너뛰고,
+  그 뒤 한 번만 시험 호출해서 성공하면 다시 씁니다. 호출 한도 초과는 provider 장애가 아니므로 세지 않습니다
+  (한도는 core.utils.quota가 호스트 단위로 막음).
+- 늦게 끝난 요청은 취소하지 않고 백그라운드에서 끝내되, 응답 시간/회로 상태 기록에는 반영합니다.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import requests
+
+from api.adapters import GeocodingProvider
+from core.config import settings
+from core.exceptions import QuotaExceededError
+from core.models import LocationResult
+from core.utils import metrics
+
+_STATE_VALUES = {"closed": 0, "open": 1, "half_open": 2}
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 회로 차단기 (closed → open → half_open → closed/open). thread-safe."""
+
+    def __init__(self, name: str, *, failure_threshold: int = 5, reset_timeout_s: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        metrics.CIRCUIT_STATE.set(self.name, value=_STATE_VALUES[state])
+
+    def allow(self) -> bool:
+        """지금 호출해도 되는지. open이 끝났으면 half_open으로 바꾸고 시험 호출 하나만 허용."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout_s:
+                self._set_state("half_open")
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            if self.state != "closed":
+                self._set_state("closed")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._set_state("open")
+
+    def release(self) -> None:
+        """성공도 실패도 아닌 결과(호출 한도 초과 등). 시험 호출 중이었으면 다시 open으로 돌려
+        reset_timeout_s 뒤에 새 시험 호출을 허용 (half_open에 멈춰 영영 막히지 않도록)."""
+        with self._lock:
+            if self.state == "half_open":
+                self.opened_at = time.monotonic()
+                self._set_state("open")
+
+
+class LatencyWindow:
+    """최근 응답 시간 (초) 고정 길이 창. 분위수는 정렬해서 계산 (창이 작아서 충분히 쌈)."""
+
+    def __init__(self, size: int = 200):
+        self._values: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._values.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        with self._lock:
+            values = sorted(self._values)
+        if not values:
+            return None
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # 동시 요청(API 스레드풀 크기)마다 원래 호출 + hedge 하나가 대기 없이 돌 수 있게
+                _executor = ThreadPoolExecutor(
+                    max_workers=2 * settings.api_max_concurrency, thread_name_prefix="geocode-hedge"
+                )
+    return _executor
+
+
+def _provider_name(provider: GeocodingProvider) -> str:
+    return getattr(provider, "name", type(provider).__name__)
+
+
+class HedgedGeocodingProvider:
+    """여러 provider를 하나처럼: 느리면 hedge, 실패하면 failover, 계속 실패하면 회로 차단."""
+
+    name = "hedged"
+
+    def __init__(
+        self,
+        providers: list[GeocodingProvider],
+        *,
+        hedge_quantile: float = 0.95,
+        initial_delay_s: float = 0.3,
+        min_delay_s: float = 0.05,
+        max_delay_s: float = 2.0,
+        min_samples: int = 20,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        executor: ThreadPoolExecutor | None = None,
+    ):
+        self.providers = list(providers)
+        self.names = [_provider_name(p) for p in self.providers]
+        self.hedge_quantile = hedge_quantile
+        self.initial_delay_s = initial_delay_s
+        self.min_delay_s = min_delay_s
+        self.max_delay_s = max_delay_s
+        self.min_samples = min_samples
+        self.latency = [LatencyWindow() for _ in self.providers]
+        self.breakers = [
+            CircuitBreaker(name, failure_threshold=failure_threshold, reset_timeout_s=reset_timeout_s)
+            for name in self.names
+        ]
+        self._executor = executor
+
+    def hedge_delay_s(self, i: int) -> float:
+        """provider i의 응답을 기다렸다가 다음 provider로 hedge할 시간 (최근 p95, 표본이 적으면 초기값)."""
+        window = self.latency[i]
+        if len(window) < self.min_samples:
+            return self.initial_delay_s
+        return min(self.max_delay_s, max(self.min_delay_s, window.quantile(self.hedge_quantile) or 0.0))
+
+    def _call(self, i: int, address: str, started: threading.Event) -> LocationResult | None:
+        started.set()
+        start = time.perf_counter()
+        try:
+            result = self.providers[i].geocode(address)
+        except QuotaExceededError:
+            self.breakers[i].release()
+            raise
+        except Exception:
+            self.breakers[i].record_failure()
+            raise
+        self.latency[i].observe(time.perf_counter() - start)
+        self.breakers[i].record_success()
+        return result
+
+    def geocode(self, address: str) -> LocationResult | None:
+        executor = self._executor or _shared_executor()
+        order = iter(range(len(self.providers)))
+        pending: dict[Future, int] = {}
+        started: dict[int, threading.Event] = {}
+
+        def launch_next() -> int | None:
+            for i in order:
+                if self.breakers[i].allow():
+                    # tracing span이 요청 Trace에 모이도록 호출 스레드의 context를 넘김
+                    ctx = contextvars.copy_context()
+                    started[i] = threading.Event()
+                    pending[executor.submit(ctx.run, self._call, i, address, started[i])] = i
+                    return i
+            return None
+
+        current = launch_next()
+        if current is None:
+            raise requests.ConnectionError("All geocoding providers are unavailable (circuit open)")
+
+        timeout: float | None = self.hedge_delay_s(current)
+        last_error: Exception | None = None
+        answered = False  # 어느 provider든 "결과 없음"으로 정상 응답했는지
+        while pending:
+            if timeout is not None:
+                # hedge 시간은 실제로 호출을 시작한 뒤부터 잼 (스레드풀 대기 시간을 "느림"으로 보지 않도록)
+                started[current].wait()
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # p95가 지나도록 답이 없음 → 다음 provider로 한 번 더 (이후로는 먼저 오는 답을 기다림)
+                hedged = launch_next()
+                if hedged is not None:
+                    metrics.GEOCODE_HEDGES.inc(self.names[hedged])
+                timeout = None
+                continue
+            for future in done:
+                i = pending.pop(future)
+                try:
+                    result = future.result()
+                except QuotaExceededError as exc:
+                    metrics.UPSTREAM_FAILOVERS.inc(exc.key)
+                    last_error = exc
+                    continue
+                except Exception as exc:
+                    last_error = exc
+                    continue
+                if result:
+                    return result
+                answered = True
+            if not pending:
+                # 진행 중인 요청이 모두 실패/결과 없음 → 기다리지 않고 다음 provider
+                current = launch_next()
+                if current is not None:
+                    timeout = self.hedge_delay_s(current)
+        # 한 곳이라도 정상적으로 "없음"이라고 답했으면 오류보다 그 답을 우선
+        if last_error is not None and not answered:
+            raise last_error
+        return None
@@ -1,19 +1,40 @@
 from __future__ import annotations
 
 import requests
+
+from api.metered import MeteredHTTPAdapter
+from core.config import settings
 from core.models import LocationResult
 
+DEFAULT_HEADERS = {"User-Agent": "okssangimong/1.0 (kakao-geocoder)"}
+
+
+def _build_session(pool_maxsize: int = 32) -> requests.Session:
+    # 커넥션 풀을 재사용해서 요청마다 TLS 핸드셰이크를 하지 않도록 합니다.
+    adapter = MeteredHTTPAdapter(
+        "kakao_geocode", quota_key="kakao", pool_connections=4, pool_maxsize=pool_maxsize
+    )
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class KakaoGeocodingProvider:
     """Kakao local API: address search.
 
     Docs: https://developers.kakao.com/docs/latest/ko/local/dev-guide#address-coord
     """
 
-    BASE_URL = "https://dapi.kakao.com/v2/local/search/address.json"
+    name = "kakao"
+    PATH = "/v2/local/search/address.json"
 
-    def __init__(self, api_key: str, timeout_s: float = 5.0):
+    def __init__(self, api_key: str, timeout_s: float = 5.0, base_url: str | None = None):
         self.api_key = api_key
+        self.url = (base_url or settings.kakao_base_url).rstrip("/") + self.PATH
         self.timeout_s = timeout_s
+        self.session = _build_session()
 
     def geocode(self, address: str) -> LocationResult | None:
         address = (address or "").strip()
@@ -21,7 +42,7 @@ class KakaoGeocodingProvider:
             return None
 
         headers = {"Authorization": f"KakaoAK {self.api_key}"}
-        resp = requests.get(self.BASE_URL, headers=headers, params={"query": address}, timeout=self.timeout_s)
+        resp = self.session.get(self.url, headers=headers, params={"query": address}, timeout=self.timeout_s)
         resp.raise_for_status()
         data = resp.json()
         docs = data.get("documents") or []
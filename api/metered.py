@@ -0,0 +1,64 @@
+"""requests HTTPAdapter that records upstream call metrics (core.utils.metrics).
+
+세션마다 mount 하면 호출 수/상태 코드/urllib3 재시도 횟수/지연 시간을 upstream 이름별로 남깁니다.
+quota_key를 주면 보내기 전에 호스트 공유 토큰 버킷(core.utils.quota)에서 토큰을 꺼내고,
+429를 받으면 Retry-After 동안 키 전체를 막은 뒤 QuotaExceededError를 냅니다 (재시도 대신 다음 provider로).
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.exceptions import QuotaExceededError
+from core.utils import metrics
+from core.utils.quota import get_quota_manager
+from core.utils.tracing import span
+
+# Retry-After가 없거나 날짜 형식일 때 키를 막아 둘 시간 (초)
+DEFAULT_RETRY_AFTER_S = 1.0
+
+
+def _retry_after_s(resp: requests.Response) -> float:
+    try:
+        return max(0.0, float(resp.headers.get("Retry-After", "")))
+    except ValueError:
+        return DEFAULT_RETRY_AFTER_S
+
+
+class MeteredHTTPAdapter(HTTPAdapter):
+    def __init__(self, upstream: str, *, quota_key: str | None = None, **kwargs: Any):
+        self.upstream = upstream
+        self.quota_key = quota_key
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        quota = get_quota_manager() if self.quota_key else None
+        if quota is not None:
+            with span("quota.acquire"):
+                quota.acquire(self.quota_key)
+        start = perf_counter()
+        try:
+            resp = super().send(request, **kwargs)
+        except requests.RequestException:
+            metrics.UPSTREAM_REQUESTS.inc(self.upstream, "error")
+            raise
+        finally:
+            metrics.UPSTREAM_LATENCY.observe(self.upstream, value=perf_counter() - start)
+        # urllib3 Retry는 최종 응답에 지금까지의 재시도 이력을 남깁니다
+        history = getattr(getattr(resp.raw, "retries", None), "history", ())
+        if history:
+            metrics.UPSTREAM_RETRIES.inc(self.upstream, amount=len(history))
+            if quota is not None:
+                quota.charge(self.quota_key, len(history))
+        metrics.UPSTREAM_REQUESTS.inc(self.upstream, str(resp.status_code))
+        if resp.status_code == 429 and self.quota_key:
+            retry_after = _retry_after_s(resp)
+            if quota is not None:
+                quota.penalize(self.quota_key, retry_after)
+            resp.close()
+            raise QuotaExceededError(self.quota_key, retry_after_s=retry_after)
+        return resp
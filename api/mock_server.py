@@ -0,0 +1,440 @@
+"""Local stand-in for the VWorld / Kakao endpoints (latency, error and throughput injection).
+
+실서비스 대신 이 서버를 띄우고 settings의 base URL을 돌려 두면 오프라인에서
+재시도/캐시/동시성 동작을 부하 테스트·벤치마크할 수 있습니다.
+
+    python -m api.mock_server --port 8099 --latency lognormal:80,0.6 --error-rate 0.05
+    OKSSANGIMONG_VWORLD_BASE_URL=http://127.0.0.1:8099 OKSSANGIMONG_KAKAO_BASE_URL=http://127.0.0.1:8099 \\
+        VWORLD_API_KEY=mock streamlit run app.py
+
+제공 엔드포인트 (실서비스와 같은 경로/응답 형식):
+- GET /req/wfs                       VWorld WFS GetFeature (lt_c_bldginfo, GeoJSON)
+- GET /req/address                   VWorld 지오코더 getcoord
+- GET /v2/local/search/address.json  Kakao 주소 검색
+- GET /__stats                       엔드포인트/상태 코드별 응답 수 (JSON)
+
+데이터: 기본은 합성 도시 (약 30m 격자 칸마다 결정적으로 만든 직사각형 건물, 어느 bbox를 물어도 응답).
+--fixtures로 녹화한 응답 JSON({"features": [...], "addresses": {주소: {"lat", "lon", "normalized"} | null}})을
+주면 해당 건물/주소를 우선 사용합니다 (주소 값이 null이면 "찾을 수 없음").
+
+장애 주입:
+- --latency: fixed:MS | uniform:LO,HI | normal:MEAN,SD | lognormal:MEDIAN,SIGMA (ms)
+- --error-rate / --error-mix: 요청 중 비율만큼 429/500/502/503/504 또는 "exception"
+  (HTTP 200 + ServiceExceptionReport XML) 응답. 기본 비율은 429:0.4,503:0.3,500:0.1,exception:0.2
+- --fail-first N: 처음 N개 요청은 무조건 오류 (재시도 동작 확인용)
+- --max-rps: 초당 처리량 한도 (토큰 버킷). 넘치면 429 + Retry-After
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+from urllib.parse import parse_qs, urlparse
+
+# 합성 도시 격자 (약 30m 칸, 위도 37.5° 기준)
+_CELL_DLAT = 30.0 / 111_320.0
+_CELL_DLON = 30.0 / (111_320.0 * math.cos(math.radians(37.5)))
+# 주소 해시로 좌표를 만들 때 쓰는 영역 (서울 도심 일대)
+_GEOCODE_BOX = (37.45, 126.85, 37.65, 127.15)
+_MAX_CELLS = 20_000
+
+DEFAULT_ERROR_MIX: dict[str, float] = {"429": 0.4, "503": 0.3, "500": 0.1, "exception": 0.2}
+
+SERVICE_EXCEPTION_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<ServiceExceptionReport version="1.2.0">'
+    '<ServiceException code="OperationProcessingFailed">mock service exception</ServiceException>'
+    "</ServiceExceptionReport>"
+)
+
+
+def parse_latency(spec: str | None) -> tuple[str, tuple[float, ...]]:
+    """"lognormal:80,0.6" → ("lognormal", (80.0, 0.6)). 빈 값이면 지연 없음."""
+    if not spec:
+        return "fixed", (0.0,)
+    kind, _, args = spec.partition(":")
+    params = tuple(float(v) for v in args.split(",") if v) if args else ()
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+    if kind not in expected or len(params) != expected[kind]:
+        raise ValueError(f"invalid latency spec: {spec!r} (fixed:MS | uniform:LO,HI | normal:MEAN,SD | lognormal:MEDIAN,SIGMA)")
+    return kind, params
+
+
+def parse_error_mix(spec: str | None) -> dict[str, float]:
+    """"429:0.5,503:0.5" → {"429": 0.5, "503": 0.5}."""
+    if not spec:
+        return dict(DEFAULT_ERROR_MIX)
+    mix = {}
+    for item in spec.split(","):
+        kind, _, weight = item.partition(":")
+        if kind != "exception" and not kind.isdigit():
+            raise ValueError(f"invalid error kind: {kind!r}")
+        mix[kind] = float(weight or 1.0)
+    return mix
+
+
+@dataclass
+class MockConfig:
+    latency: tuple[str, tuple[float, ...]] = ("fixed", (0.0,))
+    error_rate: float = 0.0
+    error_mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_ERROR_MIX))
+    fail_first: int = 0
+    max_rps: float | None = None
+    seed: int = 0
+    # 합성 도시에서 칸에 건물이 있을 확률
+    building_density: float = 0.8
+    fixtures: dict[str, Any] = field(default_factory=dict)
+
+
+class _TokenBucket:
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+
+# ---------------------------------------------------------------------------
+# 응답 데이터
+# ---------------------------------------------------------------------------
+def _cell_rng(ix: int, iy: int, seed: int) -> random.Random:
+    return random.Random((ix * 73_856_093) ^ (iy * 19_349_663) ^ (seed * 83_492_791))
+
+
+def synthetic_buildings(bbox: tuple[float, float, float, float], *, seed: int = 0, density: float = 0.8) -> list[dict]:
+    """bbox(min_lon, min_lat, max_lon, max_lat)와 겹치는 합성 건물 feature (같은 칸은 항상 같은 건물)."""
+    min_lon, min_lat, max_lon, max_lat = bbox
+    ix0, ix1 = math.floor(min_lon / _CELL_DLON) - 1, math.floor(max_lon / _CELL_DLON) + 1
+    iy0, iy1 = math.floor(min_lat / _CELL_DLAT) - 1, math.floor(max_lat / _CELL_DLAT) + 1
+    if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > _MAX_CELLS:
+        return []
+    features = []
+    for ix in range(ix0, ix1 + 1):
+        for iy in range(iy0, iy1 + 1):
+            rng = _cell_rng(ix, iy, seed)
+            if rng.random() > density:
+                continue
+            # 칸 안쪽에 가로/세로 10~24m 직사각형
+            w, h = rng.uniform(0.33, 0.8), rng.uniform(0.33, 0.8)
+            x0 = (ix + rng.uniform(0.05, 0.95 - w)) * _CELL_DLON
+            y0 = (iy + rng.uniform(0.05, 0.95 - h)) * _CELL_DLAT
+            x1, y1 = x0 + w * _CELL_DLON, y0 + h * _CELL_DLAT
+            if x1 < min_lon or x0 > max_lon or y1 < min_lat or y0 > max_lat:
+                continue
+            floors = rng.randint(1, 25)
+            area = round(w * 30.0 * h * 30.0, 2)
+            building_id = f"mock-{ix}-{iy}"
+            features.append(
+                {
+                    "type": "Feature",
+                    "id": building_id,
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]],
+                    },
+                    "properties": {
+                        "bd_mgt_sn": building_id,
+                        "bld_nm": f"모의건물 {ix % 1000}-{iy % 1000}",
+                        "main_prpos_nm": rng.choice(("공동주택", "업무시설", "근린생활시설", "교육연구시설")),
+                        "grnd_flr": floors,
+                        "ugrnd_flr": rng.randint(0, 4),
+                        "height": round(floors * 3.2, 1),
+                        "archarea": area,
+                        "totalarea": round(area * floors, 2),
+                    },
+                }
+            )
+    return features
+
+
+def _feature_bbox(feature: dict) -> tuple[float, float, float, float]:
+    xs, ys = [], []
+
+    def walk(node: Any) -> None:
+        if node and isinstance(node[0], (int, float)):
+            xs.append(node[0])
+            ys.append(node[1])
+        else:
+            for child in node:
+                walk(child)
+
+    walk((feature.get("geometry") or {}).get("coordinates") or [])
+    return (min(xs), min(ys), max(xs), max(ys)) if xs else (0.0, 0.0, 0.0, 0.0)
+
+
+def parse_wfs_bbox(value: str) -> tuple[float, float, float, float] | None:
+    """WFS bbox 파라미터 → (min_lon, min_lat, max_lon, max_lat). EPSG:4326 위도 우선 순서도 처리."""
+    parts = [p for p in value.split(",") if p and not p.upper().startswith(("EPSG", "URN"))]
+    if len(parts) < 4:
+        return None
+    a, b, c, d = (float(p) for p in parts[:4])
+    if 30.0 <= a <= 45.0 and 120.0 <= b <= 135.0:  # (minLat, minLon, maxLat, maxLon)
+        return b, a, d, c
+    return a, b, c, d
+
+
+def geocode_point(address: str, fixtures: dict[str, Any]) -> dict[str, Any] | None:
+    """주소 → {"lat", "lon", "normalized"}. 픽스처에 없으면 주소 해시로 결정적인 좌표."""
+    addresses = fixtures.get("addresses") or {}
+    if address in addresses:
+        return addresses[address]
+    digest = hashlib.sha1(address.encode("utf-8")).digest()
+    u = int.from_bytes(digest[:4], "big") / 2**32
+    v = int.from_bytes(digest[4:8], "big") / 2**32
+    min_lat, min_lon, max_lat, max_lon = _GEOCODE_BOX
+    return {"lat": min_lat + u * (max_lat - min_lat), "lon": min_lon + v * (max_lon - min_lon), "normalized": address}
+
+
+# ---------------------------------------------------------------------------
+# 서버
+# ---------------------------------------------------------------------------
+class MockUpstream:
+    """ThreadingHTTPServer 기반 대역 서버. config는 실행 중에도 바꿀 수 있습니다."""
+
+    def __init__(self, config: MockConfig | None = None, *, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self.stats: Counter[tuple[str, str]] = Counter()
+        self._requests = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._bucket = _TokenBucket(self.config.max_rps) if self.config.max_rps else None
+        self._index: list[tuple[tuple[float, float, float, float], dict]] = []
+        self._index_key: Any = None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockUpstream":
+        # poll_interval: stop()(shutdown)이 기본 0.5초씩 기다리지 않도록
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="mock-upstream", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def _count(self, endpoint: str, status: str) -> None:
+        with self._lock:
+            self.stats[(endpoint, status)] += 1
+
+    # ---- 장애 주입 ----
+    def _latency_s(self) -> float:
+        kind, params = self.config.latency
+        with self._lock:
+            rng = self._rng
+            if kind == "uniform":
+                ms = rng.uniform(*params)
+            elif kind == "normal":
+                ms = rng.gauss(*params)
+            elif kind == "lognormal":
+                ms = params[0] * math.exp(rng.gauss(0.0, params[1]))
+            else:
+                ms = params[0]
+        return max(0.0, ms) / 1000.0
+
+    def _fault(self) -> str | None:
+        """이번 요청에 주입할 오류 ("429", "503", "exception", ...) 또는 None."""
+        config = self.config
+        with self._lock:
+            self._requests += 1
+            if self._requests <= config.fail_first:
+                return next(iter(config.error_mix), "503")
+            if config.error_rate <= 0 or self._rng.random() >= config.error_rate:
+                return None
+            kinds, weights = zip(*config.error_mix.items())
+            return self._rng.choices(kinds, weights=weights)[0]
+
+    # ---- 응답 ----
+    def _wfs(self, query: dict[str, str]) -> tuple[int, str, bytes]:
+        bbox = parse_wfs_bbox(query.get("bbox", ""))
+        if bbox is None or query.get("request", "").lower() != "getfeature":
+            return 200, "text/xml", SERVICE_EXCEPTION_XML.encode("utf-8")
+        min_lon, min_lat, max_lon, max_lat = bbox
+        recorded = [
+            f for b, f in self._fixture_index()
+            if b[0] <= max_lon and b[2] >= min_lon and b[1] <= max_lat and b[3] >= min_lat
+        ]
+        features = recorded or synthetic_buildings(bbox, seed=self.config.seed, density=self.config.building_density)
+        body = {"type": "FeatureCollection", "totalFeatures": len(features), "features": features}
+        return 200, "application/json;charset=UTF-8", json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    def _fixture_index(self) -> list[tuple[tuple[float, float, float, float], dict]]:
+        """녹화 feature와 bbox (fixtures가 바뀌면 다시 계산)."""
+        features = self.config.fixtures.get("features") or []
+        if self._index_key is not features:
+            self._index = [(_feature_bbox(f), f) for f in features]
+            self._index_key = features
+        return self._index
+
+    def _vworld_geocode(self, query: dict[str, str]) -> tuple[int, str, bytes]:
+        address = query.get("address", "").strip()
+        point = geocode_point(address, self.config.fixtures) if address else None
+        if point is None:
+            body = {"response": {"service": {"name": "address"}, "status": "NOT_FOUND"}}
+        else:
+            body = {
+                "response": {
+                    "service": {"name": "address", "operation": "getcoord"},
+                    "status": "OK",
+                    "input": {"type": query.get("type", "ROAD"), "address": address},
+                    "refined": {"text": point.get("normalized") or address},
+                    "result": {"crs": "EPSG:4326", "point": {"x": str(point["lon"]), "y": str(point["lat"])}},
+                }
+            }
+        return 200, "application/json;charset=UTF-8", json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    def _kakao_geocode(self, query: dict[str, str], headers: Any) -> tuple[int, str, bytes]:
+        if not (headers.get("Authorization") or "").startswith("KakaoAK "):
+            body = {"errorType": "AccessDeniedError", "message": "cannot find appkey"}
+            return 401, "application/json;charset=UTF-8", json.dumps(body).encode("utf-8")
+        address = query.get("query", "").strip()
+        point = geocode_point(address, self.config.fixtures) if address else None
+        docs = []
+        if point is not None:
+            name = point.get("normalized") or address
+            docs.append({"address_name": name, "address_type": "ROAD_ADDR", "x": str(point["lon"]), "y": str(point["lat"])})
+        body = {"documents": docs, "meta": {"total_count": len(docs), "pageable_count": len(docs), "is_end": True}}
+        return 200, "application/json;charset=UTF-8", json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    def _handle(self, path: str, query: dict[str, str], headers: Any) -> tuple[int, str, bytes, dict[str, str]]:
+        if path == "/__stats":
+            data = {f"{endpoint} {status}": n for (endpoint, status), n in sorted(self.stats.items())}
+            return 200, "application/json", json.dumps(data).encode("utf-8"), {}
+
+        routes = {"/req/wfs": "wfs", "/req/address": "vworld_geocode", "/v2/local/search/address.json": "kakao_geocode"}
+        endpoint = routes.get(path)
+        if endpoint is None:
+            return 404, "text/plain", b"not found", {}
+
+        time.sleep(self._latency_s())
+        if self._bucket is not None and not self._bucket.take():
+            self._count(endpoint, "429")
+            return 429, "text/plain", b"Too Many Requests", {"Retry-After": "1"}
+        fault = self._fault()
+        if fault == "exception":
+            self._count(endpoint, "exception")
+            return 200, "text/xml;charset=UTF-8", SERVICE_EXCEPTION_XML.encode("utf-8"), {}
+        if fault is not None:
+            self._count(endpoint, fault)
+            extra = {"Retry-After": "1"} if fault == "429" else {}
+            return int(fault), "text/plain", f"mock error {fault}".encode(), extra
+
+        if endpoint == "wfs":
+            status, ctype, body = self._wfs(query)
+        elif endpoint == "vworld_geocode":
+            status, ctype, body = self._vworld_geocode(query)
+        else:
+            status, ctype, body = self._kakao_geocode(query, headers)
+        self._count(endpoint, str(status))
+        return status, ctype, body, {}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive (클라이언트 커넥션 풀 동작을 실서비스와 같게)
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:  # noqa: N802
+                url = urlparse(self.path)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                status, ctype, body, extra = upstream._handle(url.path, query, self.headers)
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in extra.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+@contextmanager
+def serve_mock(config: MockConfig | None = None, **kwargs: Any) -> Iterator[MockUpstream]:
+    """백그라운드 스레드에서 대역 서버를 띄우고 MockUpstream을 yield (base_url로 접속)."""
+    upstream = MockUpstream(config, **kwargs).start()
+    try:
+        yield upstream
+    finally:
+        upstream.stop()
+
+
+def load_fixtures(path: str | Path | None) -> dict[str, Any]:
+    if not path:
+        return {}
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", default=None, help="fixed:MS | uniform:LO,HI | normal:MEAN,SD | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-mix", default=None, help="예: 429:0.5,503:0.3,exception:0.2")
+    parser.add_argument("--fail-first", type=int, default=0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--density", type=float, default=0.8, help="합성 도시 격자 칸당 건물 확률")
+    parser.add_argument("--fixtures", default=None, help="녹화한 features/addresses JSON")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        latency=parse_latency(args.latency),
+        error_rate=args.error_rate,
+        error_mix=parse_error_mix(args.error_mix),
+        fail_first=args.fail_first,
+        max_rps=args.max_rps,
+        seed=args.seed,
+        building_density=args.density,
+        fixtures=load_fixtures(args.fixtures),
+    )
+    upstream = MockUpstream(config, host=args.host, port=args.port)
+    print(f"mock VWorld/Kakao listening on {upstream.base_url}")
+    print(f"  OKSSANGIMONG_VWORLD_BASE_URL={upstream.base_url} OKSSANGIMONG_KAKAO_BASE_URL={upstream.base_url}")
+    try:
+        upstream.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
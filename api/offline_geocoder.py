@@ -0,0 +1,53 @@
+"""Offline geocoding from the local road-name address index (etl.addresses 출력).
+
+    provider = OfflineGeocodingProvider(AddressIndex(address_index_path()), fallback=KakaoGeocodingProvider(...))
+
+도로명주소로 들어온 입력은 로컬 색인(core.data_access.address_index)에서 바로 찾고(수 µs, 외부 호출 없음),
+색인에 없거나 도로명주소로 읽히지 않는 입력(지번 주소, 건물 이름 등)만 fallback provider(Kakao/VWorld)로 넘깁니다.
+- 정확 일치: 시도/시군구/도로명/건물번호 키가 같음 (서울시 ↔ 서울특별시, 띄어쓰기, 상세주소 차이는 정규화로 흡수)
+- 근사 일치: 시도/시군구를 빼거나 일부만 쓴 입력 ("세종대로 110", "중구 세종대로 110")은
+  도로명+건물번호가 같은 행 중 입력 지역과 어긋나지 않는 것이 하나뿐일 때만 씀 (여러 곳이면 fallback)
+"""
+
+from __future__ import annotations
+
+from api.adapters import GeocodingProvider
+from core.data_access.address_index import AddressIndex
+from core.models import GeoPoint, LocationResult
+from core.utils import metrics
+from core.utils.address import parse_road_address
+
+
+class OfflineGeocodingProvider:
+    """로컬 도로명주소 색인 우선, 없으면 fallback provider."""
+
+    name = "offline"
+
+    def __init__(self, index: AddressIndex, fallback: GeocodingProvider | None = None):
+        self.index = index
+        self.fallback = fallback
+
+    def lookup(self, address: str) -> LocationResult | None:
+        """로컬 색인만 조회 (fallback 없이). GeocodingService가 single-flight 전에 먼저 부릅니다."""
+        parsed = parse_road_address(address)
+        match = self.index.lookup(parsed) if parsed is not None else None
+        if match is None:
+            return None
+        metrics.OFFLINE_GEOCODES.inc("hit")
+        return LocationResult(
+            input_address=address,
+            normalized_address=match.address,
+            point=GeoPoint(lat=match.lat, lon=match.lon),
+            provider=self.name,
+            extra={"match": "exact" if match.exact else "road"},
+        )
+
+    def geocode(self, address: str) -> LocationResult | None:
+        address = (address or "").strip()
+        if not address:
+            return None
+        result = self.lookup(address)
+        if result is not None:
+            return result
+        metrics.OFFLINE_GEOCODES.inc("miss")
+        return self.fallback.geocode(address) if self.fallback is not None else None
@@ -3,9 +3,10 @@ from __future__ import annotations
 from urllib.parse import urlparse
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from api.metered import MeteredHTTPAdapter
+from core.config import settings
 from core.models import LocationResult
 
 DEFAULT_HEADERS = {"User-Agent": "okssangimong/1.0 (vworld-geocoder)"}
@@ -15,11 +16,15 @@ def _build_retry_session() -> requests.Session:
     retry = Retry(
         total=3,
         backoff_factor=0.4,
-        status_forcelist=(429, 500, 502, 503, 504),
+        # 429는 재시도하지 않음: MeteredHTTPAdapter가 키를 막고 QuotaExceededError로 알림 (core.utils.quota)
+        status_forcelist=(500, 502, 503, 504),
         allowed_methods=frozenset(["GET"]),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    # pool_maxsize: 동시 요청(여러 세션/API 워커)이 커넥션을 재사용할 수 있도록 여유 있게
+    adapter = MeteredHTTPAdapter(
+        "vworld_geocode", quota_key="vworld", max_retries=retry, pool_connections=4, pool_maxsize=32
+    )
 
     session = requests.Session()
     session.headers.update(DEFAULT_HEADERS)
@@ -44,10 +49,14 @@ class VWorldGeocodingProvider:
     실제 적용 시 공식 문서/샘플에 맞춰 조정하세요.
     """
 
-    BASE_URL = "https://api.vworld.kr/req/address"
+    name = "vworld"
+    PATH = "/req/address"
 
-    def __init__(self, api_key: str, *, domain: str | None = None, timeout_s: float = 5.0):
+    def __init__(
+        self, api_key: str, *, domain: str | None = None, timeout_s: float = 5.0, base_url: str | None = None
+    ):
         self.api_key = api_key
+        self.url = (base_url or settings.vworld_base_url).rstrip("/") + self.PATH
         self.domain = _normalize_domain(domain)
         self.timeout_s = timeout_s
         self.session = _build_retry_session()
@@ -72,7 +81,7 @@ class VWorldGeocodingProvider:
         return params
 
     def _request(self, params: dict) -> dict:
-        resp = self.session.get(self.BASE_URL, params=params, timeout=self.timeout_s)
+        resp = self.session.get(self.url, params=params, timeout=self.timeout_s)
         resp.raise_for_status()
         try:
             return resp.json()
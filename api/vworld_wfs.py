@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import logging
 import math
 import os
 import time
-from typing import Iterable, Optional
+from typing import Optional, Sequence
 from urllib.parse import urlparse
 
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-VWORLD_WFS_URL = "https://api.vworld.kr/req/wfs"
+from api.metered import MeteredHTTPAdapter
+from core.config import settings
+from core.exceptions import QuotaExceededError
+from core.footprint import Footprint, feature_attributes
+from core.utils.geometry import geojson_polygons, pack_geojson
+from core.utils.singleflight import SingleFlight
+from core.utils.spatial import PolygonIndex
+from core.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+VWORLD_WFS_URL = f"{settings.vworld_base_url}/req/wfs"
 
 DEFAULT_HEADERS = {"User-Agent": "okssangimong/1.0 (vworld-wfs)"}
 
@@ -19,11 +30,15 @@ def _build_retry_session() -> requests.Session:
     retry = Retry(
         total=3,
         backoff_factor=0.4,
-        status_forcelist=(429, 500, 502, 503, 504),
+        # 429는 재시도하지 않음: MeteredHTTPAdapter가 키를 막고 QuotaExceededError로 알림 (core.utils.quota)
+        status_forcelist=(500, 502, 503, 504),
         allowed_methods=frozenset(["GET"]),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    # pool_maxsize: 동시 요청(여러 세션/API 워커)이 커넥션을 재사용할 수 있도록 여유 있게
+    adapter = MeteredHTTPAdapter(
+        "vworld_wfs", quota_key="vworld", max_retries=retry, pool_connections=4, pool_maxsize=32
+    )
 
     session = requests.Session()
     session.headers.update(DEFAULT_HEADERS)
@@ -33,6 +48,9 @@ def _build_retry_session() -> requests.Session:
 
 
 _SESSION = _build_retry_session()
+_FLIGHT = SingleFlight(
+    "wfs_footprint", shared_dir=settings.singleflight_dir, dumps=Footprint.to_bytes, loads=Footprint.from_bytes
+)
 
 
 def _bbox_from_point(lat: float, lon: float, radius_m: float) -> tuple[float, float, float, float]:
@@ -43,40 +61,22 @@ def _bbox_from_point(lat: float, lon: float, radius_m: float) -> tuple[float, fl
     return (lon - dlon, lat - dlat, lon + dlon, lat + dlat)  # (minLon, minLat, maxLon, maxLat)
 
 
-def _point_in_polygon(point: tuple[float, float], polygon: Iterable[tuple[float, float]]) -> bool:
+def _point_in_polygon(point: tuple[float, float], polygon: Sequence[tuple[float, float]]) -> bool:
+    """단일 ring crossing-number 검사 (폴리곤 여러 개는 PolygonIndex 사용)."""
     x, y = point
-    inside = False
-    pts = list(polygon)
-    if len(pts) < 3:
+    n = len(polygon)
+    if n < 3:
         return False
-    j = len(pts) - 1
-    for i in range(len(pts)):
-        xi, yi = pts[i]
-        xj, yj = pts[j]
-        intersects = ((yi > y) != (yj > y)) and (
-            x < (xj - xi) * (y - yi) / (yj - yi + 1e-12) + xi
-        )
-        if intersects:
+    inside = False
+    xj, yj = polygon[-1]
+    for xi, yi in polygon:
+        # straddle이면 yi != yj 이므로 0으로 나누지 않음
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
             inside = not inside
-        j = i
+        xj, yj = xi, yi
     return inside
 
 
-def _extract_polygons(geometry: dict) -> list[list[tuple[float, float]]]:
-    if not geometry:
-        return []
-    geom_type = geometry.get("type")
-    coords = geometry.get("coordinates") or []
-    polygons: list[list[tuple[float, float]]] = []
-    if geom_type == "Polygon":
-        if coords:
-            polygons.append([(float(x), float(y)) for x, y in coords[0]])
-    elif geom_type == "MultiPolygon":
-        for poly in coords:
-            if poly:
-                polygons.append([(float(x), float(y)) for x, y in poly[0]])
-    return polygons
-
 def _normalize_domain(domain: Optional[str]) -> Optional[str]:
     if not domain:
         return None
@@ -87,7 +87,7 @@ def _normalize_domain(domain: Optional[str]) -> Optional[str]:
 
 
 
-def _fetch_polygon_once(
+def _fetch_footprint_once(
     *,
     lat: float,
     lon: float,
@@ -95,7 +95,7 @@ def _fetch_polygon_once(
     radius_m: float,
     timeout_s: float,
     domain: Optional[str],
-) -> Optional[list[tuple[float, float]]]:
+) -> Optional[Footprint]:
     min_lon, min_lat, max_lon, max_lat = _bbox_from_point(lat, lon, radius_m)
 
     # EPSG:4326 bbox 순서: (ymin,xmin,ymax,xmax) = (minLat,minLon,maxLat,maxLon)
@@ -114,58 +114,57 @@ def _fetch_polygon_once(
     if domain:
         params["domain"] = domain
 
-    resp = _SESSION.get(VWORLD_WFS_URL, params=params, timeout=timeout_s)
+    with span("wfs.request"):
+        resp = _SESSION.get(VWORLD_WFS_URL, params=params, timeout=timeout_s)
     ctype = resp.headers.get("Content-Type", "")
 
     # HTTP 에러
     if resp.status_code != 200:
-        # 필요하면 print 대신 logging으로 교체 추천
-        print("[VWORLD WFS] HTTP", resp.status_code, "| URL:", resp.url)
-        print("[VWORLD WFS] CT:", ctype)
-        print("[VWORLD WFS] BODY:", resp.text[:500])
+        logger.warning("VWorld WFS HTTP %s | CT: %s | BODY: %s", resp.status_code, ctype, resp.text[:500])
         return None
 
     # JSON이 아닌 경우(XML ServiceExceptionReport 등)
     if "json" not in ctype.lower():
         if "<ServiceException" in resp.text or "<ServiceExceptionReport" in resp.text:
-            print("[VWORLD WFS] ServiceExceptionReport returned")
-            print("[VWORLD WFS] URL:", resp.url)
-            print("[VWORLD WFS] CT:", ctype)
-            print("[VWORLD WFS] BODY:", resp.text[:500])
+            logger.warning("VWorld WFS ServiceExceptionReport | CT: %s | BODY: %s", ctype, resp.text[:500])
             return None
-        print("[VWORLD WFS] Non-JSON response | URL:", resp.url)
-        print("[VWORLD WFS] CT:", ctype)
-        print("[VWORLD WFS] BODY:", resp.text[:500])
+        logger.warning("VWorld WFS non-JSON response | CT: %s | BODY: %s", ctype, resp.text[:500])
         return None
 
     try:
         data = resp.json()
     except ValueError:
-        print("[VWORLD WFS] JSON decode failed | URL:", resp.url)
-        print("[VWORLD WFS] BODY:", resp.text[:500])
+        logger.warning("VWorld WFS JSON decode failed | BODY: %s", resp.text[:500])
         return None
     features = data.get("features") or []
     if not features:
         # 0건이면 그냥 None
         return None
 
-    polygons: list[list[tuple[float, float]]] = []
-    for f in features:
-        polygons.extend(_extract_polygons(f.get("geometry") or {}))
-
+    # GeoJSON 좌표를 ragged 배열로 바로 묶어서(구멍 포함) 한 번에 검사하고, 고른 폴리곤만 Footprint로 만든다
+    polygons: list = []
+    owners: list[int] = []
+    for i, f in enumerate(features):
+        for poly in geojson_polygons(f.get("geometry")):
+            polygons.append(poly)
+            owners.append(i)
     if not polygons:
         return None
-
-    # 점 포함 폴리곤 우선
-    point = (lon, lat)
-    for poly in polygons:
-        if _point_in_polygon(point, poly):
-            return poly
-
-    return polygons[0]
+    coords, ring_offsets, polygon_offsets = pack_geojson([{"type": "MultiPolygon", "coordinates": polygons}])
+
+    # 점 포함 폴리곤 우선, 없으면 경계가 가장 가까운 폴리곤 (bbox 사전 필터 + 벡터화 검사)
+    idx = PolygonIndex(coords, ring_offsets, polygon_offsets).locate(lon, lat)
+    idx = idx if idx is not None else 0
+    first_ring, last_ring = polygon_offsets[idx], polygon_offsets[idx + 1]
+    start = ring_offsets[first_ring]
+    return Footprint(
+        coords[start:ring_offsets[last_ring]].copy(),
+        ring_offsets[first_ring:last_ring + 1] - start,
+        **feature_attributes(features[owners[idx]]),
+    )
 
 
-def get_building_polygon(
+def get_building_footprint(
     coords: tuple[float, float],
     api_key: str,
     radius_m: float = 30.0,
@@ -173,11 +172,12 @@ def get_building_polygon(
     domain: Optional[str] = None,
     *,
     max_attempts: int = 3,
-) -> Optional[list[tuple[float, float]]]:
+) -> Optional[Footprint]:
     """
     coords는 (lat, lon)로 들어온다고 가정.
     (lon, lat)가 들어오는 경우가 많아서 대한민국 범위 기준 자동 보정.
     또한 radius를 늘려가며 재시도해서 "가끔 안 잡히는" 케이스를 줄임.
+    반환값은 구멍(내부 ring)과 lt_c_bldginfo 주요 속성을 담은 Footprint.
     """
     lat, lon = coords
 
@@ -185,6 +185,23 @@ def get_building_polygon(
     if not (33.0 <= lat <= 39.5 and 124.0 <= lon <= 132.5) and (33.0 <= lon <= 39.5 and 124.0 <= lat <= 132.5):
         lat, lon = lon, lat
 
+    # 같은 좌표(~0.1m)를 동시에 조회하는 세션들은 진행 중인 WFS 조회 하나를 공유
+    key = f"{lat:.6f},{lon:.6f},{radius_m:g},{max_attempts}"
+    return _FLIGHT.do(
+        key,
+        lambda: _fetch_footprint(lat, lon, api_key, radius_m, timeout_s, domain, max_attempts),
+    )
+
+
+def _fetch_footprint(
+    lat: float,
+    lon: float,
+    api_key: str,
+    radius_m: float,
+    timeout_s: float,
+    domain: Optional[str],
+    max_attempts: int,
+) -> Optional[Footprint]:
     domain = _normalize_domain(domain or os.getenv("VWORLD_DOMAIN"))
 
     # radius escalation: 30m -> 60m -> 120m (기본)
@@ -193,20 +210,42 @@ def get_building_polygon(
     for attempt in range(max_attempts):
         r = radii[min(attempt, len(radii) - 1)]
         try:
-            poly = _fetch_polygon_once(
-                lat=lat,
-                lon=lon,
-                api_key=api_key,
-                radius_m=r,
-                timeout_s=timeout_s,
-                domain=domain,
-            )
-            if poly:
-                return poly
+            with span("wfs.attempt"):
+                footprint = _fetch_footprint_once(
+                    lat=lat,
+                    lon=lon,
+                    api_key=api_key,
+                    radius_m=r,
+                    timeout_s=timeout_s,
+                    domain=domain,
+                )
+            if footprint is not None and len(footprint.exterior):
+                return footprint
+        except QuotaExceededError as e:
+            # 한도 초과는 반경을 늘려 다시 보내도 같은 키라 소용없음
+            logger.warning("VWorld WFS skipped: %s", e)
+            return None
         except requests.RequestException as e:
-            print("[VWORLD WFS] RequestException:", str(e))
+            logger.warning("VWorld WFS request failed (attempt %d, radius %.0fm): %s", attempt + 1, r, e)
 
         # backoff
-        time.sleep(0.2 * (2**attempt))
+        with span("wfs.backoff"):
+            time.sleep(0.2 * (2**attempt))
 
-    return None
\ No newline at end of file
+    return None
+
+
+def get_building_polygon(
+    coords: tuple[float, float],
+    api_key: str,
+    radius_m: float = 30.0,
+    timeout_s: float = 10.0,
+    domain: Optional[str] = None,
+    *,
+    max_attempts: int = 3,
+) -> Optional[list[tuple[float, float]]]:
+    """건물 외곽선만 [(lon, lat), ...]로 반환 (구멍/속성이 필요하면 get_building_footprint)."""
+    footprint = get_building_footprint(
+        coords, api_key, radius_m=radius_m, timeout_s=timeout_s, domain=domain, max_attempts=max_attempts
+    )
+    return footprint.exterior_list() if footprint is not None else None
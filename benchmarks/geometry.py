@@ -0,0 +1,100 @@
+"""Footprint area: local approximation vs pyproj TM projection.
+
+합성 건물 footprint N개(서울~동해안 경도 범위)에 대해
+- polygon_area_m2 파이썬 루프 (국지 근사)
+- polygon_areas_m2 배치 (국지 근사 / TM 투영)
+- 폴리곤마다 Transformer를 새로 만드는 순진한 TM 투영 (캐시 효과 비교용, 표본만)
+의 시간과, 측지(GRS80 타원체) 면적 대비 오차를 비교합니다.
+
+사용법:
+    python -m benchmarks.geometry
+    python -m benchmarks.geometry --n 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+
+def synthetic_footprints(n: int, seed: int = 0) -> list[list[tuple[float, float]]]:
+    """반지름 10~20m 내외의 볼록 다각형 (꼭짓점 4~11개)."""
+    rng = np.random.default_rng(seed)
+    polys = []
+    for _ in range(n):
+        lon = 126.0 + rng.random() * 3.4
+        lat = 34.8 + rng.random() * 3.0
+        k = int(rng.integers(4, 12))
+        ang = np.sort(rng.random(k)) * 2 * np.pi
+        rad = 0.0001 + rng.random(k) * 0.0001
+        polys.append(list(zip((lon + rad * np.cos(ang)).tolist(), (lat + rad * np.sin(ang)).tolist())))
+    return polys
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    from pyproj import Geod, Transformer
+
+    from core.utils.geometry import (
+        KOREA_TM_BELTS,
+        get_transformer,
+        pack_polygons,
+        polygon_area_m2,
+        polygon_areas_m2,
+        ring_signed_areas,
+    )
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--sample", type=int, default=2_000, help="측지 면적/순진한 TM 비교 표본 수")
+    args = parser.parse_args(argv)
+
+    polys = synthetic_footprints(args.n)
+    packed, pack_ms = _timed(lambda: pack_polygons(polys))
+    _, loop_ms = _timed(lambda: [polygon_area_m2(p) for p in polys])
+    approx, approx_ms = _timed(lambda: polygon_areas_m2(*packed))
+    for _, crs in KOREA_TM_BELTS:
+        get_transformer(crs)  # 변환기 생성(프로세스당 1회)은 측정에서 제외
+    precise, precise_ms = _timed(lambda: polygon_areas_m2(*packed, precise=True))
+
+    sample = polys[: args.sample]
+
+    def naive_tm():
+        out = []
+        for p in sample:
+            t = Transformer.from_crs("EPSG:4326", "EPSG:5186", always_xy=True)
+            x, y = t.transform(*map(np.asarray, zip(*p)))
+            out.append(abs(ring_signed_areas(np.column_stack([x, y]), np.array([0, len(p)]))[0]))
+        return out
+
+    _, naive_ms = _timed(naive_tm)
+
+    geod = Geod(ellps="GRS80")
+    truth = np.array([abs(geod.polygon_area_perimeter(*zip(*p))[0]) for p in sample])
+    err_approx = np.abs(approx[: len(sample)] - truth) / truth * 1e6
+    err_precise = np.abs(precise[: len(sample)] - truth) / truth * 1e6
+
+    n = args.n
+    print(f"footprints: {n:,}  vertices: {len(packed[0]):,}")
+    print(f"{'method':<40} {'ms':>9} {'µs/poly':>8}")
+    print(f"{'pack_polygons (python lists)':<40} {pack_ms:>9.1f} {pack_ms * 1000 / n:>8.2f}")
+    print(f"{'polygon_area_m2 loop (approx)':<40} {loop_ms:>9.1f} {loop_ms * 1000 / n:>8.2f}")
+    print(f"{'polygon_areas_m2 (approx)':<40} {approx_ms:>9.1f} {approx_ms * 1000 / n:>8.2f}")
+    print(f"{'polygon_areas_m2 (precise, cached TM)':<40} {precise_ms:>9.1f} {precise_ms * 1000 / n:>8.2f}")
+    print(f"{'naive TM (new Transformer per polygon)':<40} {naive_ms:>9.1f} {naive_ms * 1000 / len(sample):>8.2f}")
+    print()
+    print(f"error vs GRS80 geodesic area (ppm, n={len(sample):,})   median      p99      max")
+    print(f"{'  approx':<44} {np.median(err_approx):>8.1f} {np.percentile(err_approx, 99):>8.1f} {err_approx.max():>8.1f}")
+    print(f"{'  precise (TM belt)':<44} {np.median(err_precise):>8.1f} {np.percentile(err_precise, 99):>8.1f} {err_precise.max():>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+"""Cold-start import budget for app.py and each Streamlit page.
+
+각 페이지 스크립트의 최상위 import 문을 AST로 뽑아서
+`python -X importtime` 하위 프로세스로 실행하고,
+streamlit 자체 import 이후에 추가로 드는 시간(=우리 코드 몫)과 로드된 무거운 모듈을 확인합니다.
+
+사용법:
+    python -m benchmarks.importtime            # 표 출력 + 예산 초과 시 exit 1
+    python -m benchmarks.importtime --runs 5   # 중앙값 기준
+
+tests/test_import_budget.py는 무거운 모듈 import만 항상 확인하고, 시간 예산은
+OKSSANGIMONG_IMPORT_BUDGET=1일 때만 확인합니다 (기기 부하에 따라 흔들리는 wall-clock 값).
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# 페이지 import 시점에 로드되면 안 되는 무거운 모듈 (첫 사용 시 lazy import 대상)
+# NOTE: streamlit이 plotly 최상위 스텁(~1ms)은 직접 import 하므로 실제 무거운 graph_objs로 확인합니다.
+HEAVY_MODULES: tuple[str, ...] = ("pandas", "reportlab", "openpyxl", "plotly.graph_objs", "matplotlib")
+
+# streamlit import 이후 추가 import 시간 예산 (ms). 여유를 두고 잡아 CI 편차를 흡수합니다.
+DEFAULT_BUDGET_MS = 250.0
+BUDGETS_MS: dict[str, float] = {
+    "app.py": 250.0,
+    "pages/1_step1_condition_check.py": 250.0,
+    "pages/2_step2_planning.py": 250.0,
+    "pages/3_step3_result.py": 250.0,
+    "pages/4_step4_report.py": 250.0,
+}
+
+
+@dataclass
+class ImportReport:
+    target: str
+    incremental_ms: float
+    loaded_heavy: list[str] = field(default_factory=list)
+    budget_ms: float = DEFAULT_BUDGET_MS
+
+    @property
+    def ok(self) -> bool:
+        return self.incremental_ms <= self.budget_ms and not self.loaded_heavy
+
+
+def default_targets() -> list[str]:
+    pages = sorted(p.relative_to(ROOT).as_posix() for p in (ROOT / "pages").glob("*.py"))
+    return ["app.py", *pages]
+
+
+def script_imports(path: Path) -> list[str]:
+    """스크립트의 모듈 레벨 import 대상 모듈 이름 목록 (순서 유지, 중복 제거)."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    modules: list[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """`-X importtime` 출력 → [(level, cumulative_us, module)]"""
+    rows: list[tuple[int, int, str]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        name_field = parts[2]
+        level = (len(name_field) - len(name_field.lstrip()) - 1) // 2
+        rows.append((level, int(parts[1]), name_field.strip()))
+    return rows
+
+
+def measure_once(target: str) -> tuple[float, set[str]]:
+    modules = script_imports(ROOT / target)
+    code = "\n".join(["import streamlit", *(f"import {m}" for m in modules)])
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = _parse_importtime(proc.stderr)
+    loaded = {name for _, _, name in rows}
+
+    # streamlit(최상위) 이후에 나오는 최상위 항목들의 누적 시간 합 = 페이지가 추가로 쓰는 import 시간
+    incremental_us = 0
+    seen_streamlit = False
+    for level, cumulative_us, name in rows:
+        if level != 0:
+            continue
+        if name == "streamlit":
+            seen_streamlit = True
+            continue
+        if seen_streamlit:
+            incremental_us += cumulative_us
+    return incremental_us / 1000.0, loaded
+
+
+def measure(target: str, runs: int = 1) -> ImportReport:
+    samples: list[float] = []
+    loaded: set[str] = set()
+    for _ in range(max(1, runs)):
+        ms, loaded = measure_once(target)
+        samples.append(ms)
+    return ImportReport(
+        target=target,
+        incremental_ms=statistics.median(samples),
+        loaded_heavy=sorted(m for m in HEAVY_MODULES if m in loaded),
+        budget_ms=BUDGETS_MS.get(target, DEFAULT_BUDGET_MS),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", help="app.py / pages/*.py (기본: 전체)")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    reports = [measure(t, runs=args.runs) for t in (args.targets or default_targets())]
+    print(f"{'target':<40} {'import ms':>10} {'budget':>8}  heavy modules")
+    for r in reports:
+        flag = "" if r.ok else "  <-- OVER"
+        print(f"{r.target:<40} {r.incremental_ms:>10.1f} {r.budget_ms:>8.0f}  {','.join(r.loaded_heavy) or '-'}{flag}")
+    return 0 if all(r.ok for r in reports) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,382 @@
+"""Concurrent-session load harness for the Streamlit wizard.
+
+사용자 한 명 = AppTest 세션 하나가 마법사 전체를 지나갑니다 (st.switch_page를 AppTest가 그대로 따라감):
+    랜딩 주소 검색 → 면적 입력/적용 → 녹화 계획 슬라이더 드래그 여러 번 → 계획 저장 → 결과 → 리포트 → 이미지 다운로드
+외부 API는 api.mock_server 대역 서버로 돌리므로 (지연/오류 주입 가능) 네트워크 없이 재현됩니다.
+
+Streamlit 서버처럼 세션마다 스레드 하나를 쓰고, 세션들을 --procs 개 워커 프로세스에 나눠 담습니다.
+AppTest는 rerun마다 전역 Runtime을 갈아 끼우므로 한 프로세스 안 rerun은 락으로 한 번에 하나씩 돌립니다.
+지연은 락을 기다리는 시간부터 재므로, 한 서버 프로세스가 GIL 하나로 세션들을 처리할 때의 줄 서기가 그대로 보입니다
+(대역 서버 지연을 크게 주면 그 대기까지 직렬화되어 실제보다 비관적이니, 이때는 --procs를 늘리세요).
+각 워커는 측정 전에 여정 한 번으로 lazy import/캐시를 데우고, 그 뒤 CPU 시간(getrusage)만 셉니다.
+
+출력:
+- 단계(페이지 + 동작)별 p50/p95/p99 지연 (사용자가 클릭하고 화면이 다 그려질 때까지)
+- 워커 프로세스별 CPU 초, 최대 RSS
+- 코어당 감당 가능 세션 수: 여정 길이(CPU 초 + 동작마다 --estimate-think초 체류) / 여정당 CPU 초
+- --users를 여러 개(예: 4,8,16) 주면 단계별로 늘려 가며 실행하고, 전 단계 p95가 --slo-ms 안인 최대 동시 세션 수
+
+사용법:
+    python -m benchmarks.load --users 8 --procs 2
+    python -m benchmarks.load --users 4,8,16,32 --procs 4 --think 1.0 --slo-ms 1500
+    python -m benchmarks.load --users 8 --latency lognormal:80,0.5 --error-rate 0.05
+    python -m benchmarks.load --users 8 --metrics-dir /tmp/load-metrics   # 워커별 Prometheus 지표 덤프
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import os
+import random
+import resource
+import sys
+import threading
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_SLO_MS = 2_000.0
+# 코어당 세션 수 추정에 쓰는 동작 사이 평균 체류 시간 (초)
+DEFAULT_ESTIMATE_THINK_S = 3.0
+SLIDER_VALUES: tuple[int, ...] = (30, 45, 60, 75, 90, 80, 70, 55)
+
+Action = Callable[[Any], Any]
+
+
+# ---------------------------------------------------------------------------
+# 여정 (AppTest 조작)
+# ---------------------------------------------------------------------------
+def _click(label_prefix: str) -> Action:
+    # key가 없는 버튼도 있어서 라벨로 찾습니다 (benchmarks.payload와 같은 방식)
+    def action(at):
+        return next(b for b in at.button if b.label.startswith(label_prefix)).click()
+
+    return action
+
+
+def _search(address: str) -> Action:
+    def action(at):
+        at.text_input[0].set_value(address)
+        return _click("시뮬레이션 시작")(at)
+
+    return action
+
+
+def _set_area(value: str) -> Action:
+    def action(at):
+        at.text_input(key="roof_area_input").set_value(value)
+        return _click("값 적용")(at)
+
+    return action
+
+
+def _drag(value: int) -> Action:
+    return lambda at: at.slider(key="planning_slider").set_value(value)
+
+
+def journey(user: int, drags: int) -> list[tuple[str, Action | None]]:
+    """[(단계 이름, AppTest 조작)] — None은 첫 화면 로드 (조작 없이 run)."""
+    # 사용자마다 다른 주소 (지오코딩/footprint 캐시 적중이 아니라 실제 호출 경로를 타도록)
+    address = f"서울특별시 중구 세종대로 {100 + user}"
+    steps: list[tuple[str, Action | None]] = [
+        ("landing: 첫 화면", None),
+        ("landing: 주소 검색", _search(address)),
+        ("step1: 면적 적용", _set_area(str(800 + 10 * (user % 20)))),
+        ("step1: 다음", _click("다음")),
+    ]
+    steps += [("step2: 슬라이더 드래그", _drag(SLIDER_VALUES[i % len(SLIDER_VALUES)])) for i in range(drags)]
+    steps += [
+        ("step2: 계획 저장", _click("계획 저장")),
+        ("step2: 결과 확인", _click("결과 확인하기")),
+        ("step3: 리포트 보기", _click("상세 리포트 보기")),
+        ("step4: 이미지 다운로드", _click("🖼️ 이미지 저장")),
+    ]
+    return steps
+
+
+# ---------------------------------------------------------------------------
+# 워커 프로세스
+# ---------------------------------------------------------------------------
+@dataclass
+class WorkerReport:
+    worker: int
+    sessions: int = 0
+    errors: list[str] = field(default_factory=list)
+    samples: dict[str, list[float]] = field(default_factory=dict)  # 단계 → 지연 (초)
+    cpu_s: float = 0.0
+    wall_s: float = 0.0
+    max_rss_mb: float = 0.0
+    actions: int = 0  # 완료한 세션들의 단계 수 합
+
+
+def _quiet_streamlit() -> None:
+    # AppTest가 실행마다 streamlit 로그 레벨을 다시 설정하므로 레벨 대신 logger를 끔 (benchmarks.suite 참고)
+    for name in (
+        "streamlit.deprecation_util",
+        "streamlit.runtime.scriptrunner_utils.script_run_context",
+        "streamlit.elements.lib.policies",
+    ):
+        logging.getLogger(name).disabled = True
+
+
+def _run_session(
+    user: int, drags: int, think_s: float, record: Callable[[str, float], None] | None, run_lock: threading.Lock
+) -> int:
+    """여정 한 번 실행. 단계 수를 돌려줍니다. 단계 실패/예외는 RuntimeError."""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(user)
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+    steps = journey(user, drags)
+    for i, (name, action) in enumerate(steps):
+        if i and think_s > 0:
+            time.sleep(rng.expovariate(1.0 / think_s))
+        t0 = time.perf_counter()
+        with run_lock:
+            (action(at) if action is not None else at).run()
+        elapsed = time.perf_counter() - t0
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].message}")
+        errors = [e.value for e in at.error]
+        if errors:
+            raise RuntimeError(f"{name}: {errors[0]}")
+        if record is not None:
+            record(name, elapsed)
+    return len(steps)
+
+
+def _cpu_s() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _max_rss_mb() -> float:
+    # Linux는 KB, macOS는 bytes
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_worker(
+    worker: int,
+    users: list[int],
+    *,
+    base_url: str,
+    drags: int,
+    think_s: float,
+    warmup: bool = True,
+    metrics_dir: str | None = None,
+) -> WorkerReport:
+    """워커 프로세스 본체: users 각각을 스레드 하나로 동시에 돌립니다."""
+    # core.config가 import 되기 전에 대역 서버를 가리키도록 (spawn 프로세스라 아직 import 전)
+    os.environ["OKSSANGIMONG_VWORLD_BASE_URL"] = base_url
+    os.environ["OKSSANGIMONG_KAKAO_BASE_URL"] = base_url
+    os.environ.setdefault("VWORLD_API_KEY", "load-test")
+    os.environ.setdefault("KAKAO_REST_API_KEY", "load-test")
+    _quiet_streamlit()
+
+    report = WorkerReport(worker)
+    lock, run_lock = threading.Lock(), threading.Lock()
+    if warmup:
+        # 워밍업 사용자 번호는 측정 대상과 겹치지 않게 (캐시 적중 방지)
+        _run_session(-1 - worker, drags=1, think_s=0.0, record=None, run_lock=run_lock)
+
+    def record(name: str, seconds: float) -> None:
+        with lock:
+            report.samples.setdefault(name, []).append(seconds)
+
+    def session(user: int) -> None:
+        try:
+            actions = _run_session(user, drags, think_s, record, run_lock)
+        except Exception as exc:
+            with lock:
+                report.errors.append(f"user {user}: {exc}")
+            return
+        with lock:
+            report.sessions += 1
+            report.actions += actions
+
+    cpu0, wall0 = _cpu_s(), time.perf_counter()
+    threads = [threading.Thread(target=session, args=(u,), name=f"user-{u}") for u in users]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    report.cpu_s = _cpu_s() - cpu0
+    report.wall_s = time.perf_counter() - wall0
+    report.max_rss_mb = _max_rss_mb()
+
+    if metrics_dir:
+        from core.utils import metrics
+
+        Path(metrics_dir).mkdir(parents=True, exist_ok=True)
+        metrics.write_textfile(Path(metrics_dir) / f"worker-{worker}.prom")
+    return report
+
+
+# ---------------------------------------------------------------------------
+# 집계
+# ---------------------------------------------------------------------------
+def percentile(values: list[float], q: float) -> float:
+    """선형 보간 분위수 (q: 0~100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+@dataclass
+class LoadReport:
+    users: int
+    procs: int
+    workers: list[WorkerReport]
+    upstream_stats: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def sessions(self) -> int:
+        return sum(w.sessions for w in self.workers)
+
+    @property
+    def errors(self) -> list[str]:
+        return [e for w in self.workers for e in w.errors]
+
+    def samples(self) -> dict[str, list[float]]:
+        merged: dict[str, list[float]] = {}
+        for w in self.workers:
+            for name, values in w.samples.items():
+                merged.setdefault(name, []).extend(values)
+        return merged
+
+    def worst_p95_s(self) -> float:
+        return max((percentile(v, 95) for v in self.samples().values()), default=0.0)
+
+    def cpu_per_session_s(self) -> float:
+        return sum(w.cpu_s for w in self.workers) / max(1, self.sessions)
+
+    def sessions_per_core(self, think_s: float = DEFAULT_ESTIMATE_THINK_S) -> float:
+        """코어 하나를 100% 쓸 때 동시에 진행할 수 있는 세션 수.
+
+        사용자가 동작마다 think_s초 머문다고 보고, 여정 길이(CPU 초 + 체류 시간)를 여정당 CPU 초로 나눕니다.
+        """
+        cpu = self.cpu_per_session_s()
+        if not self.sessions or cpu <= 0:
+            return 0.0
+        actions = sum(w.actions for w in self.workers) / self.sessions
+        return (cpu + think_s * actions) / cpu
+
+
+def run_load(
+    users: int,
+    *,
+    procs: int,
+    base_url: str,
+    drags: int = 5,
+    think_s: float = 0.0,
+    warmup: bool = True,
+    metrics_dir: str | None = None,
+) -> LoadReport:
+    procs = max(1, min(procs, users))
+    shares = [list(range(users))[i::procs] for i in range(procs)]
+    # fork는 스레드(대역 서버)가 있는 부모를 복제하므로 spawn
+    with ProcessPoolExecutor(max_workers=procs, mp_context=get_context("spawn")) as pool:
+        futures = [
+            pool.submit(
+                run_worker, i, share, base_url=base_url, drags=drags, think_s=think_s,
+                warmup=warmup, metrics_dir=metrics_dir,
+            )
+            for i, share in enumerate(shares)
+        ]
+        workers = [f.result() for f in futures]
+    return LoadReport(users=users, procs=procs, workers=workers)
+
+
+def _ljust(text: str, width: int) -> str:
+    # 한글은 터미널에서 두 칸을 차지
+    cells = sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+    return text + " " * max(0, width - cells)
+
+
+def format_report(report: LoadReport, estimate_think_s: float = DEFAULT_ESTIMATE_THINK_S) -> str:
+    lines = [f"== {report.users} users / {report.procs} procs: {report.sessions} sessions, {len(report.errors)} errors"]
+    lines.append(f"{_ljust('step', 28)} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, values in report.samples().items():
+        p50, p95, p99 = (percentile(values, q) * 1000 for q in (50, 95, 99))
+        lines.append(f"{_ljust(name, 28)} {len(values):>5} {p50:>9.1f} {p95:>9.1f} {p99:>9.1f}")
+    lines.append(f"{'worker':<8} {'sessions':>8} {'cpu s':>8} {'wall s':>8} {'cpu %':>6} {'max RSS MB':>11}")
+    for w in report.workers:
+        util = 100 * w.cpu_s / w.wall_s if w.wall_s else 0.0
+        lines.append(f"{w.worker:<8} {w.sessions:>8} {w.cpu_s:>8.2f} {w.wall_s:>8.2f} {util:>6.0f} {w.max_rss_mb:>11.1f}")
+    lines.append(
+        f"cpu/session {report.cpu_per_session_s():.3f} s → ~{report.sessions_per_core(estimate_think_s):.1f} "
+        f"sessions per core (CPU-bound upper bound, {estimate_think_s:g} s think time per action)"
+    )
+    if report.upstream_stats:
+        lines.append("upstream: " + ", ".join(f"{k}={v}" for k, v in sorted(report.upstream_stats.items())))
+    for err in report.errors[:5]:
+        lines.append(f"  error: {err}")
+    return "\n".join(lines)
+
+
+def max_sustainable(reports: list[LoadReport], slo_s: float) -> LoadReport | None:
+    """오류 없이 모든 단계 p95가 slo_s 이하인 가장 큰 동시 세션 수 단계."""
+    ok = [r for r in reports if not r.errors and r.worst_p95_s() <= slo_s]
+    return max(ok, key=lambda r: r.users, default=None)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", default="8", help="동시 세션 수. 쉼표로 여러 개 주면 차례로 늘려 가며 실행")
+    parser.add_argument("--procs", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    parser.add_argument("--drags", type=int, default=5, help="세션당 슬라이더 드래그 횟수")
+    parser.add_argument("--think", type=float, default=0.0, help="동작 사이 평균 생각 시간 (초, 지수분포)")
+    parser.add_argument(
+        "--estimate-think", type=float, default=DEFAULT_ESTIMATE_THINK_S,
+        help="코어당 세션 수 추정에 쓸 동작당 체류 시간 (초)",
+    )
+    parser.add_argument("--slo-ms", type=float, default=DEFAULT_SLO_MS, help="단계 p95 목표 (ms)")
+    parser.add_argument("--no-warmup", action="store_true")
+    parser.add_argument("--metrics-dir", default=None, help="워커별 Prometheus 지표 파일을 쓸 디렉터리")
+    parser.add_argument("--latency", default=None, help="대역 서버 지연 (api.mock_server --latency 형식)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="대역 서버 오류 비율")
+    args = parser.parse_args(argv)
+
+    from api.mock_server import MockConfig, parse_latency, serve_mock
+
+    levels = [int(u) for u in args.users.split(",") if u.strip()]
+    config = MockConfig(latency=parse_latency(args.latency), error_rate=args.error_rate)
+    reports: list[LoadReport] = []
+    with serve_mock(config) as upstream:
+        for users in levels:
+            upstream.stats.clear()
+            report = run_load(
+                users, procs=args.procs, base_url=upstream.base_url, drags=args.drags, think_s=args.think,
+                warmup=not args.no_warmup, metrics_dir=args.metrics_dir,
+            )
+            report.upstream_stats = {f"{endpoint} {status}": n for (endpoint, status), n in upstream.stats.items()}
+            reports.append(report)
+            print(format_report(report, args.estimate_think), flush=True)
+
+    cores = min(args.procs, os.cpu_count() or 1)
+    best = max_sustainable(reports, args.slo_ms / 1000)
+    if len(reports) > 1:
+        if best is None:
+            print(f"no level kept every step p95 under {args.slo_ms:g} ms")
+        else:
+            print(
+                f"max sustainable: {best.users} concurrent sessions on {cores} core(s) "
+                f"(~{best.users / cores:.1f} per core, p95 ≤ {args.slo_ms:g} ms)"
+            )
+    return 1 if any(r.errors for r in reports) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+"""Bytes sent to the browser per Streamlit rerun.
+
+Streamlit은 rerun마다 화면의 모든 요소(delta)를 다시 보냅니다.
+AppTest로 각 페이지를 한 번 실행한 뒤 요소 트리의 protobuf 크기를 합산해 rerun당 전송량을 근사합니다.
+
+상호작용(위젯 변경) 비용은 --interactions 로 측정합니다.
+AppTest는 항상 스크립트 전체를 다시 실행하므로, 각 ForwardMsg의 delta.fragment_id를 보고
+st.fragment 안에서 나온 delta만 따로 합산해 "fragment rerun이면 보냈을 양"도 함께 보여줍니다.
+
+사용법:
+    python -m benchmarks.payload
+    python -m benchmarks.payload --interactions
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SAMPLE_LOCATION = {
+    "input_address": "서울특별시 중구 세종대로 110",
+    "normalized_address": "서울특별시 중구 세종대로 110",
+    "point": {"lat": 37.5663, "lon": 126.9779},
+    "provider": "dummy",
+    "extra": {},
+}
+SAMPLE_SCENARIO = {"greening_type": "sedum", "coverage_ratio": 0.5}
+
+PAGES: tuple[str, ...] = (
+    "app.py",
+    "pages/1_step1_condition_check.py",
+    "pages/2_step2_planning.py",
+    "pages/3_step3_result.py",
+    "pages/4_step4_report.py",
+)
+
+
+@dataclass
+class PayloadReport:
+    target: str
+    total_bytes: int
+    by_type: dict[str, int] = field(default_factory=dict)
+
+
+def sample_session_state() -> dict[str, Any]:
+    """마법사 전 단계를 통과한 세션 상태 (각 페이지를 단독 실행할 수 있도록)."""
+    from core.models import ScenarioInput
+    from core.services.scenario_service import ScenarioService
+
+    result = ScenarioService().compute(roof_area_m2=1000.0, scenario=ScenarioInput(**SAMPLE_SCENARIO))
+    return {
+        "location": SAMPLE_LOCATION,
+        "roof_area_m2_confirmed": 1000.0,
+        "scenario": SAMPLE_SCENARIO,
+        "result": result.model_dump(),
+    }
+
+
+def _walk(node) -> Iterator[Any]:
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from _walk(child)
+
+
+def tree_payload(at) -> tuple[int, dict[str, int]]:
+    total = 0
+    by_type: dict[str, int] = {}
+    for node in _walk(at._tree):
+        proto = getattr(node, "proto", None)
+        if proto is None or not hasattr(proto, "ByteSize"):
+            continue
+        size = proto.ByteSize()
+        total += size
+        by_type[node.type] = by_type.get(node.type, 0) + size
+    return total, by_type
+
+
+def new_app(target: str, session_state: dict[str, Any] | None = None):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / target), default_timeout=60)
+    for k, v in (session_state if session_state is not None else sample_session_state()).items():
+        at.session_state[k] = v
+    return at
+
+
+def measure_payload(target: str) -> PayloadReport:
+    at = new_app(target).run()
+    total, by_type = tree_payload(at)
+    return PayloadReport(target=target, total_bytes=total, by_type=by_type)
+
+
+@dataclass
+class InteractionReport:
+    name: str
+    target: str
+    full_ms: float
+    full_bytes: int
+    fragment_ms: float
+    fragment_bytes: int
+
+
+@contextmanager
+def _record_forward_msgs() -> Iterator[list[tuple[float, Any]]]:
+    """실행 중 큐에 들어가는 ForwardMsg를 (시각, msg)로 기록합니다."""
+    from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+    recorded: list[tuple[float, Any]] = []
+    original = ForwardMsgQueue.enqueue
+
+    def enqueue(self, msg):
+        recorded.append((time.perf_counter(), msg))
+        return original(self, msg)
+
+    ForwardMsgQueue.enqueue = enqueue
+    try:
+        yield recorded
+    finally:
+        ForwardMsgQueue.enqueue = original
+
+
+def _fire(at, action: Callable[[Any], Any]) -> tuple[float, int, float, int]:
+    with _record_forward_msgs() as recorded:
+        t0 = time.perf_counter()
+        action(at).run()
+        full_ms = (time.perf_counter() - t0) * 1000
+
+    deltas = [(ts, m) for ts, m in recorded if m.WhichOneof("type") == "delta"]
+    full_bytes = sum(m.ByteSize() for _, m in deltas)
+    in_fragment = [(ts, m) for ts, m in deltas if m.delta.fragment_id]
+    fragment_bytes = sum(m.ByteSize() for _, m in in_fragment)
+    # fragment 본문 실행 시간 근사: fragment delta 첫 전송 ~ 마지막 전송
+    fragment_ms = (in_fragment[-1][0] - in_fragment[0][0]) * 1000 if in_fragment else full_ms
+    if not in_fragment:
+        fragment_bytes = full_bytes  # fragment가 없으면 상호작용 = 전체 rerun
+    return full_ms, full_bytes, fragment_ms, fragment_bytes
+
+
+def _click(label_prefix: str) -> Callable[[Any], Any]:
+    # key는 버전마다 바뀔 수 있어서 버튼 라벨로 찾습니다
+    def action(at):
+        return next(b for b in at.button if b.label.startswith(label_prefix)).click()
+
+    return action
+
+
+def _apply_area(at):
+    at.text_input(key="roof_area_input").set_value("900")
+    return _click("값 적용")(at)
+
+
+# (이름, 페이지, AppTest 조작) — 사용자가 가장 자주 만지는 위젯들
+INTERACTIONS: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("step1: 면적 입력+적용", "pages/1_step1_condition_check.py", _apply_area),
+    ("step2: 슬라이더 변경", "pages/2_step2_planning.py", lambda at: at.slider(key="planning_slider").set_value(80)),
+    ("step2: 녹화 유형 선택", "pages/2_step2_planning.py", _click("🌳")),
+)
+
+
+def measure_interaction(name: str, target: str, action: Callable[[Any], Any], runs: int = 5) -> InteractionReport:
+    at = new_app(target).run()
+    samples = [_fire(at, action) for _ in range(max(1, runs))]
+    samples.sort(key=lambda s: s[0])
+    full_ms, full_bytes, fragment_ms, fragment_bytes = samples[len(samples) // 2]
+    return InteractionReport(name, target, full_ms, full_bytes, fragment_ms, fragment_bytes)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*")
+    parser.add_argument("--interactions", action="store_true", help="위젯 상호작용당 전송량/시간")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    if args.interactions:
+        print(f"{'interaction':<24} {'full ms':>8} {'full bytes':>11} {'frag ms':>8} {'frag bytes':>11}")
+        for name, target, action in INTERACTIONS:
+            r = measure_interaction(name, target, action, runs=args.runs)
+            print(f"{r.name:<24} {r.full_ms:>8.1f} {r.full_bytes:>11,} {r.fragment_ms:>8.1f} {r.fragment_bytes:>11,}")
+        return 0
+
+    print(f"{'target':<40} {'bytes/rerun':>12}  breakdown")
+    for target in args.targets or PAGES:
+        r = measure_payload(target)
+        top = sorted(r.by_type.items(), key=lambda kv: -kv[1])[:3]
+        print(f"{r.target:<40} {r.total_bytes:>12,}  " + ", ".join(f"{k}={v:,}" for k, v in top))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,417 @@
+"""Hot-path benchmark suite with stored baselines (asv style).
+
+벤치마크 하나는 측정할 callable을 yield 하는 컨텍스트 매니저입니다 (준비/정리 비용은 측정에서 제외).
+timeit처럼 한 반복이 충분히 길어지도록 호출 횟수를 잡고, 반복마다 호출당 시간을 잰 뒤 중앙값을 기록합니다.
+baselines.json보다 --threshold 배 이상 느려지면 회귀로 보고 exit 1 합니다.
+회귀 판정은 최솟값으로 합니다 (다른 프로세스 간섭은 시간을 늘리기만 하므로 중앙값보다 덜 흔들림).
+
+대상:
+- find_nearby_buildings: 1k / 100k / 1M 행 합성 시군구 파티션 테이블 (건물 밀도는 같고 면적만 커짐)
+- polygon_area_m2 (폴리곤 1,000개 루프) / polygon_areas_m2 (100k 배치)
+- vworld_wfs._point_in_polygon 루프 vs PolygonIndex.locate (겹쳐 깔린 폴리곤 2,000개)
+- get_building_polygon: 로컬 대역 서버 api.mock_server (외부 네트워크 없음)
+- ScenarioService.compute, ReportService.build_pdf / build_excel
+- 페이지 스크립트 rerun (streamlit AppTest)
+
+사용법:
+    python -m benchmarks.suite                    # 전체 실행 + baseline 비교 (회귀 시 exit 1)
+    python -m benchmarks.suite -k nearby          # 이름에 nearby가 들어간 것만
+    python -m benchmarks.suite --quick            # 1M 행 테이블, 페이지 rerun 등 느린 항목 제외
+    python -m benchmarks.suite --save             # 현재 결과를 baseline으로 저장 (실행한 항목만 덮어씀)
+
+합성 건물 테이블은 한 번 만든 뒤 OKSSANGIMONG_BENCH_DIR(기본: 임시 디렉터리)에 두고 재사용합니다.
+baseline은 기계마다 다르므로 측정 머신을 바꾸면 --save로 다시 잡으세요.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterator
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_PATH = Path(__file__).resolve().with_name("baselines.json")
+BENCH_DIR = Path(os.getenv("OKSSANGIMONG_BENCH_DIR", Path(tempfile.gettempdir()) / "okssangimong-bench"))
+
+# baseline 대비 이 배수 이상 느려지면 회귀
+DEFAULT_THRESHOLD = 1.5
+# 건물 1동당 면적 (m²). 테이블 크기와 무관하게 반경 200m 안 후보 수가 비슷하도록 밀도를 고정
+_M2_PER_BUILDING = 1_000.0
+_ROWS_PER_PARTITION = 10_000
+_ORIGIN = (37.40, 126.80)  # 합성 테이블 남서쪽 모서리 (lat, lon)
+_SAMPLE_POINT = (37.5663, 126.9779)
+
+Bench = Callable[[], ContextManager[Callable[[], Any]]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    factory: Bench
+    slow: bool = False
+    repeat: int = 7
+
+
+@dataclass
+class Result:
+    name: str
+    median_s: float
+    min_s: float
+    number: int
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, *, slow: bool = False, repeat: int = 7) -> Callable[[Callable[..., Iterator]], Bench]:
+    """제너레이터 함수를 벤치마크로 등록 (yield 하는 callable을 측정)."""
+
+    def register(fn: Callable[..., Iterator]) -> Bench:
+        factory = contextmanager(fn)
+        BENCHMARKS.append(Benchmark(name, factory, slow=slow, repeat=repeat))
+        return factory
+
+    return register
+
+
+def measure(fn: Callable[[], Any], *, repeat: int = 7, min_time_s: float = 0.1) -> tuple[float, float, int]:
+    """호출당 (중앙값, 최솟값) 초와 반복당 호출 수. 호출 수는 한 반복이 min_time_s 이상 되도록 늘립니다."""
+    fn()  # 워밍업 (lazy import, 프로세스 캐시 채우기)
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time_s or number >= 1_000_000:
+            break
+        number = max(number * 2, int(number * min_time_s / max(elapsed, 1e-9)))
+    samples = [elapsed / number]
+    for _ in range(max(1, repeat) - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return statistics.median(samples), min(samples), number
+
+
+def run_benchmark(bench: Benchmark, *, min_time_s: float = 0.1) -> Result:
+    with bench.factory() as fn:
+        median_s, min_s, number = measure(fn, repeat=bench.repeat, min_time_s=min_time_s)
+    return Result(bench.name, median_s, min_s, number)
+
+
+# ---------------------------------------------------------------------------
+# 합성 데이터
+# ---------------------------------------------------------------------------
+def _box_deg(n: int) -> tuple[float, float]:
+    """n동을 고정 밀도로 깔 정사각형 한 변 (dlat, dlon), 도 단위."""
+    side_m = math.sqrt(n * _M2_PER_BUILDING)
+    return side_m / 111_320.0, side_m / (111_320.0 * math.cos(math.radians(_ORIGIN[0])))
+
+
+def synthetic_buildings_table(n: int, root: Path | None = None) -> Path:
+    """n행 합성 건물 테이블 (etl.buildings와 같은 시군구 파티션 레이아웃). 이미 있으면 재사용."""
+    import numpy as np
+    import pandas as pd
+
+    from core.data_access.loaders import PARTITION_INDEX
+    from etl.buildings import write_partition, zorder_key
+
+    out = (root or BENCH_DIR) / f"buildings_{n}.parquet"
+    index_path = out / PARTITION_INDEX
+    if index_path.is_file():
+        return out
+
+    rng = np.random.default_rng(n)
+    dlat, dlon = _box_deg(n)
+    lat = _ORIGIN[0] + rng.random(n) * dlat
+    lon = _ORIGIN[1] + rng.random(n) * dlon
+    # 정사각 격자 한 칸 = 시군구 파티션 하나
+    k = max(1, int(round(math.sqrt(n / _ROWS_PER_PARTITION))))
+    row = np.minimum(((lat - _ORIGIN[0]) / dlat * k).astype(int), k - 1)
+    col = np.minimum(((lon - _ORIGIN[1]) / dlon * k).astype(int), k - 1)
+    floor_area = rng.uniform(80.0, 2_000.0, n)
+    df = pd.DataFrame(
+        {
+            "building_id": [f"bench-{i}" for i in range(n)],
+            "lat": lat,
+            "lon": lon,
+            "roof_area_m2": floor_area,
+            "greenable_area_m2": floor_area * 0.6,
+            "roof_area_source": "register",
+            "building_area_m2": floor_area,
+            "cell": row * k + col,
+        }
+    )
+
+    out.mkdir(parents=True, exist_ok=True)
+    index: dict[str, Any] = {}
+    for cell, part in df.groupby("cell"):
+        code = f"{11000 + int(cell):05d}"
+        part = part.drop(columns="cell")
+        order = np.argsort(zorder_key(part["lat"].to_numpy(), part["lon"].to_numpy()), kind="stable")
+        part = part.iloc[order].reset_index(drop=True)
+        write_partition(part, out, code, row_group_size=2_048)
+        index[code] = {
+            "rows": len(part),
+            "bbox": [float(part.lon.min()), float(part.lat.min()), float(part.lon.max()), float(part.lat.max())],
+        }
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+    return out
+
+
+@contextmanager
+def use_buildings_table(path: Path) -> Iterator[None]:
+    """loaders가 path의 테이블을 읽도록 잠시 바꿉니다 (캐시는 경로/버전별이라 끝날 때 메모리만 비움)."""
+    from core.data_access import loaders
+
+    original = loaders.buildings_path
+    loaders.buildings_path = lambda: path
+    try:
+        yield
+    finally:
+        loaders.buildings_path = original
+        loaders.clear_table_caches()
+
+
+def _dense_polygons(n: int = 2_000, vertices: int = 32, seed: int = 0) -> list[list[tuple[float, float]]]:
+    """WFS 응답 bbox 하나(약 200m) 안에 겹쳐 깔린 볼록 다각형 n개."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    polys = []
+    for _ in range(n):
+        cx = _SAMPLE_POINT[1] + (rng.random() - 0.5) * 0.002
+        cy = _SAMPLE_POINT[0] + (rng.random() - 0.5) * 0.002
+        ang = np.sort(rng.random(vertices)) * 2 * np.pi
+        rad = 0.00005 + rng.random(vertices) * 0.0001
+        polys.append(list(zip((cx + rad * np.cos(ang)).tolist(), (cy + rad * np.sin(ang)).tolist())))
+    return polys
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크
+# ---------------------------------------------------------------------------
+def _register_nearby(n: int, label: str, *, slow: bool = False) -> None:
+    @benchmark(f"find_nearby_buildings[{label}]", slow=slow)
+    def bench() -> Iterator[Callable[[], Any]]:
+        import numpy as np
+
+        from core.data_access.repositories import find_nearby_buildings
+
+        path = synthetic_buildings_table(n)
+        rng = np.random.default_rng(0)
+        dlat, dlon = _box_deg(n)
+        points = list(zip((_ORIGIN[0] + rng.random(256) * dlat).tolist(), (_ORIGIN[1] + rng.random(256) * dlon).tolist()))
+        next_point = itertools.cycle(points).__next__
+        with use_buildings_table(path):
+            yield lambda: find_nearby_buildings(*next_point(), radius_m=200.0)
+
+
+_register_nearby(1_000, "1k")
+_register_nearby(100_000, "100k")
+_register_nearby(1_000_000, "1M", slow=True)
+
+
+@benchmark("polygon_area_m2[1k polygons]")
+def _bench_polygon_area() -> Iterator[Callable[[], Any]]:
+    from benchmarks.geometry import synthetic_footprints
+    from core.utils.geometry import polygon_area_m2
+
+    polys = synthetic_footprints(1_000)
+    yield lambda: [polygon_area_m2(p) for p in polys]
+
+
+@benchmark("polygon_areas_m2[100k batch]")
+def _bench_polygon_areas() -> Iterator[Callable[[], Any]]:
+    from benchmarks.geometry import synthetic_footprints
+    from core.utils.geometry import pack_polygons, polygon_areas_m2
+
+    packed = pack_polygons(synthetic_footprints(100_000))
+    yield lambda: polygon_areas_m2(*packed)
+
+
+@benchmark("_point_in_polygon[2k dense features]")
+def _bench_point_in_polygon() -> Iterator[Callable[[], Any]]:
+    from api.vworld_wfs import _point_in_polygon
+
+    polys = _dense_polygons()
+    point = (_SAMPLE_POINT[1], _SAMPLE_POINT[0])
+    yield lambda: [i for i, p in enumerate(polys) if _point_in_polygon(point, p)]
+
+
+@benchmark("PolygonIndex.locate[2k dense features]")
+def _bench_polygon_index() -> Iterator[Callable[[], Any]]:
+    from core.utils.geometry import pack_polygons
+    from core.utils.spatial import PolygonIndex
+
+    packed = pack_polygons(_dense_polygons())
+    # WFS 응답마다 인덱스를 새로 만드는 것까지 포함 (vworld_wfs와 같은 사용 방식)
+    yield lambda: PolygonIndex(*packed).locate(_SAMPLE_POINT[1], _SAMPLE_POINT[0])
+
+
+@benchmark("get_building_polygon[mock WFS, 50 features]")
+def _bench_get_building_polygon() -> Iterator[Callable[[], Any]]:
+    from api import vworld_wfs
+    from api.mock_server import MockConfig, serve_mock
+    from core.utils.quota import set_quota_manager
+
+    features = [
+        {"type": "Feature", "id": f"b{i}", "properties": {"bd_mgt_sn": f"b{i}"},
+         "geometry": {"type": "Polygon", "coordinates": [p + [p[0]]]}}
+        for i, p in enumerate(_dense_polygons(50, vertices=12))
+    ]
+    original = vworld_wfs.VWORLD_WFS_URL
+    # 호출 한도(초당 토큰)는 측정 대상이 아니므로 끔
+    quota = set_quota_manager(None)
+    with serve_mock(MockConfig(fixtures={"features": features})) as upstream:
+        vworld_wfs.VWORLD_WFS_URL = f"{upstream.base_url}/req/wfs"
+        try:
+            yield lambda: vworld_wfs.get_building_polygon(_SAMPLE_POINT, api_key="bench")
+        finally:
+            vworld_wfs.VWORLD_WFS_URL = original
+            set_quota_manager(quota)
+
+
+@benchmark("ScenarioService.compute")
+def _bench_scenario() -> Iterator[Callable[[], Any]]:
+    from core.models import ScenarioInput
+    from core.services.scenario_service import ScenarioService
+
+    service = ScenarioService()
+    scenario = ScenarioInput(greening_type="sedum", coverage_ratio=0.5)
+    yield lambda: service.compute(roof_area_m2=1000.0, scenario=scenario)
+
+
+def _sample_result() -> Any:
+    from core.models import ScenarioInput
+    from core.services.scenario_service import ScenarioService
+
+    return ScenarioService().compute(roof_area_m2=1000.0, scenario=ScenarioInput(greening_type="sedum", coverage_ratio=0.5))
+
+
+@benchmark("ReportService.build_pdf")
+def _bench_pdf() -> Iterator[Callable[[], Any]]:
+    from core.services.report_service import ReportService
+
+    service, result = ReportService(), _sample_result()
+    yield lambda: service.build_pdf(result)
+
+
+@benchmark("ReportService.build_excel")
+def _bench_excel() -> Iterator[Callable[[], Any]]:
+    from core.services.report_service import ReportService
+
+    service, result = ReportService(), _sample_result()
+    yield lambda: service.build_excel(result)
+
+
+def _register_page(target: str) -> None:
+    @benchmark(f"page rerun[{Path(target).stem}]", slow=True, repeat=5)
+    def bench() -> Iterator[Callable[[], Any]]:
+        from benchmarks.payload import new_app
+
+        # bare mode 경고/지원 중단 안내가 rerun마다 찍히지 않도록
+        # (AppTest가 실행마다 streamlit 로그 레벨을 다시 설정하므로 레벨 대신 logger를 끔)
+        for name in ("streamlit.deprecation_util", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+            logging.getLogger(name).disabled = True
+        at = new_app(target)
+        yield at.run
+
+
+for _target in ("app.py", "pages/1_step1_condition_check.py", "pages/2_step2_planning.py",
+                "pages/3_step3_result.py", "pages/4_step4_report.py"):
+    _register_page(_target)
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+def load_baselines(path: Path = BASELINE_PATH) -> dict[str, Any]:
+    if not path.is_file():
+        return {"machine": None, "results": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baselines(results: list[Result], path: Path = BASELINE_PATH) -> None:
+    data = load_baselines(path)
+    data["machine"] = _machine()
+    data["results"].update({r.name: {"median_s": r.median_s, "min_s": r.min_s} for r in results})
+    data["results"] = dict(sorted(data["results"].items()))
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def compare(results: list[Result], baselines: dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> list[tuple[Result, float | None, bool]]:
+    """[(결과, baseline 대비 최솟값 배수 또는 None, 회귀 여부)]"""
+    out = []
+    for r in results:
+        base = baselines.get("results", {}).get(r.name)
+        ratio = r.min_s / base["min_s"] if base and base["min_s"] > 0 else None
+        out.append((r, ratio, ratio is not None and ratio >= threshold))
+    return out
+
+
+def _machine() -> str:
+    return f"{platform.system()} {platform.machine()} / {os.cpu_count()} cpu / Python {platform.python_version()}"
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default=None, help="이름에 이 문자열이 들어간 벤치마크만")
+    parser.add_argument("--quick", action="store_true", help="느린 항목(1M 행, 페이지 rerun) 제외")
+    parser.add_argument("--save", action="store_true", help="결과를 baseline으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀로 볼 baseline 대비 배수")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--min-time", type=float, default=0.1, help="반복 1회 최소 시간 (초)")
+    args = parser.parse_args(argv)
+
+    selected = [
+        b for b in BENCHMARKS
+        if (args.pattern is None or args.pattern in b.name) and not (args.quick and b.slow)
+    ]
+    baselines = load_baselines(args.baseline)
+    if baselines.get("machine") and baselines["machine"] != _machine():
+        print(f"note: baseline was recorded on {baselines['machine']}")
+
+    results: list[Result] = []
+    print(f"{'benchmark':<46} {'median':>11} {'min':>11} {'vs base':>8}")
+    for bench in selected:
+        result = run_benchmark(bench, min_time_s=args.min_time)
+        results.append(result)
+        (_, ratio, regressed), = compare([result], baselines, args.threshold)
+        ratio_s = f"{ratio:.2f}x" if ratio is not None else "new"
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{result.name:<46} {_format_time(result.median_s):>11} {_format_time(result.min_s):>11} {ratio_s:>8}{flag}")
+
+    if args.save:
+        save_baselines(results, args.baseline)
+        print(f"saved {len(results)} baselines → {args.baseline}")
+        return 0
+    regressions = [r.name for r, _, bad in compare(results, baselines, args.threshold) if bad]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:g}x baseline: " + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
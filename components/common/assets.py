@@ -0,0 +1,157 @@
+"""Static asset pipeline (CSS/HTML).
+
+디자인 CSS 파일과 페이지별 큰 CSS/HTML 문자열을 프로세스당 한 번만 읽고 압축(minify)해서 캐시합니다.
+Streamlit은 rerun마다 모든 st.markdown / st.html / components.html 내용을 브라우저로 다시 보내므로,
+여기서 줄인 바이트가 그대로 상호작용마다 절약됩니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+ASSET_DIR = Path(__file__).resolve().parents[2] / "design" / "okssang_imong"
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_HTML_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_STYLE_BLOCK_RE = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.DOTALL | re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_CLASS_ATTR_RE = re.compile(r"""class\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+_CLASS_SELECTOR_RE = re.compile(r"\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)")
+
+
+@dataclass(frozen=True)
+class Asset:
+    name: str
+    content: str
+    fingerprint: str
+    raw_size: int
+
+    @property
+    def size(self) -> int:
+        return len(self.content.encode("utf-8"))
+
+
+def fingerprint(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+
+def minify_css(css: str) -> str:
+    """주석/공백 제거. 값 안의 공백(calc, font-family 등)은 한 칸으로만 줄입니다."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _WS_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def _split_rules(css: str) -> list[tuple[str, str]]:
+    """압축된 CSS를 최상위 (prelude, body) 목록으로 나눕니다. @media 등은 body에 내부 규칙이 그대로 들어갑니다."""
+    rules: list[tuple[str, str]] = []
+    depth, start, body_start = 0, 0, 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            if depth == 0:
+                body_start = i + 1
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append((css[start:body_start - 1].strip(), css[body_start:i]))
+                start = i + 1
+    return rules
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    """셀렉터 목록을 최상위 쉼표에서만 나눕니다 (:is(.a,.b), [x="a,b"] 안의 쉼표는 그대로)."""
+    parts: list[str] = []
+    depth, start, quote = 0, 0, ""
+    for i, ch in enumerate(prelude):
+        if quote:
+            if ch == quote:
+                quote = ""
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(prelude[start:i])
+            start = i + 1
+    parts.append(prelude[start:])
+    return parts
+
+
+def _required_classes(selector: str) -> set[str]:
+    """셀렉터가 맞으려면 HTML에 있어야 하는 클래스.
+
+    괄호 안(:not(.x), :is(.a,.b), :has(...))의 클래스는 빼고 봅니다. :not(.unused)는 오히려 더 넓게 맞고
+    :is(.a,.b)는 하나만 있어도 맞으므로, 괄호 안 클래스 때문에 쓰는 규칙을 지우지 않도록 보수적으로 남깁니다.
+    """
+    outside, depth = [], 0
+    for ch in selector:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif depth == 0:
+            outside.append(ch)
+    return set(_CLASS_SELECTOR_RE.findall("".join(outside)))
+
+
+def prune_css(css: str, used_classes: set[str]) -> str:
+    """HTML에서 쓰지 않는 클래스 셀렉터 규칙을 제거합니다. (클래스가 없는 요소 셀렉터는 유지)"""
+    out: list[str] = []
+    for prelude, body in _split_rules(minify_css(css)):
+        if prelude.startswith("@"):
+            if prelude.startswith(("@media", "@supports")):
+                inner = prune_css(body, used_classes)
+                if inner:
+                    out.append(f"{prelude}{{{inner}}}")
+            else:
+                out.append(f"{prelude}{{{body}}}")
+            continue
+        selectors = [sel for sel in _split_selectors(prelude) if _required_classes(sel) <= used_classes]
+        if selectors:
+            out.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(out)
+
+
+def _used_classes(html: str) -> set[str]:
+    markup = _STYLE_BLOCK_RE.sub("", html)
+    return {c for attr in _CLASS_ATTR_RE.findall(markup) for c in attr.split()}
+
+
+@lru_cache(maxsize=256)
+def minify_html(html: str, *, prune_unused_css: bool = False) -> str:
+    """HTML 조각 압축 (<style> 내부는 CSS 규칙으로 압축).
+
+    공백 연속은 한 칸으로만 줄이므로(브라우저 렌더링과 동일) 인라인 요소 간격은 바뀌지 않습니다.
+    같은 문자열(모듈 상수)은 캐시되어 rerun 때 다시 계산하지 않습니다.
+
+    prune_unused_css=True는 components.html(iframe)처럼 조각이 자기 완결적일 때만 쓰세요.
+    st.markdown/st.html의 <style>은 페이지 전체에 적용되어 다른 요소가 의존할 수 있습니다.
+    """
+    html = _HTML_COMMENT_RE.sub("", html)
+    used = _used_classes(html) if prune_unused_css else None
+
+    def _style(m: re.Match) -> str:
+        css = prune_css(m.group(2), used) if used is not None else minify_css(m.group(2))
+        return m.group(1) + css + m.group(3)
+
+    html = _STYLE_BLOCK_RE.sub(_style, html)
+    return _WS_RE.sub(" ", html).strip()
+
+
+@lru_cache(maxsize=32)
+def load_css(file_name: str) -> Asset:
+    """design/okssang_imong 의 CSS를 한 번만 읽어 압축/지문(fingerprint)을 만들어 둡니다."""
+    raw = (ASSET_DIR / file_name).read_text(encoding="utf-8")
+    content = minify_css(raw)
+    return Asset(name=file_name, content=content, fingerprint=fingerprint(content), raw_size=len(raw.encode("utf-8")))
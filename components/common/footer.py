@@ -1,6 +1,10 @@
+from functools import lru_cache
+
 import streamlit as st
 import streamlit.components.v1 as components
 
+from components.common.assets import minify_html
+
 def get_footer_css():
     """푸터 CSS 반환"""
     return """
@@ -47,15 +51,13 @@ def get_footer_html():
     </footer>
     """
 
-def render_footer():
-    """
-    공통 푸터를 단독으로 렌더링합니다.
-    푸터만 따로 표시할 때 사용합니다.
-    """
+@lru_cache(maxsize=1)
+def _footer_fragment() -> str:
+    """푸터 HTML(+CSS)을 한 번만 만들어 압축/캐시합니다."""
     css = get_footer_css()
     html = get_footer_html()
-    
-    full_html = f"""
+
+    return minify_html(f"""
     <style>
     * {{ box-sizing: border-box; margin: 0; padding: 0; }}
     html, body {{ 
@@ -72,5 +74,12 @@ def render_footer():
     {css}
     </style>
     {html}
+    """)
+
+
+def render_footer():
+    """
+    공통 푸터를 단독으로 렌더링합니다.
+    푸터만 따로 표시할 때 사용합니다.
     """
-    components.html(full_html, height=80, scrolling=False)
+    components.html(_footer_fragment(), height=80, scrolling=False)
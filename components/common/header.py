@@ -1,6 +1,10 @@
+from functools import lru_cache
+
 import streamlit as st
 import streamlit.components.v1 as components
 
+from components.common.assets import minify_html
+
 def get_header_css():
     """헤더 CSS 반환"""
     return """
@@ -93,15 +97,13 @@ def get_header_html(active_page: str = None):
     </header>
     """
 
-def render_header(active_page: str = None):
-    """
-    공통 헤더를 단독으로 렌더링합니다.
-    헤더만 따로 표시할 때 사용합니다.
-    """
+@lru_cache(maxsize=16)
+def _header_fragment(active_page: str = None) -> str:
+    """헤더 HTML(+CSS)을 페이지별로 한 번만 만들어 압축/캐시합니다."""
     css = get_header_css()
     html = get_header_html(active_page)
-    
-    full_html = f"""
+
+    return minify_html(f"""
     <style>
     * {{ box-sizing: border-box; margin: 0; padding: 0; }}
     html, body {{ 
@@ -111,8 +113,15 @@ def render_header(active_page: str = None):
     {css}
     </style>
     {html}
+    """)
+
+
+def render_header(active_page: str = None):
     """
-    st.html(full_html)
+    공통 헤더를 단독으로 렌더링합니다.
+    헤더만 따로 표시할 때 사용합니다.
+    """
+    st.html(_header_fragment(active_page))
 
 
 def get_stepper_css():
@@ -214,13 +223,13 @@ def get_stepper_html(current_step: int = 1):
     </div>
     """
 
-def render_header_with_stepper(current_step: int = 1):
-    """헤더 + 스텝 진행바를 함께 렌더링합니다."""
+@lru_cache(maxsize=8)
+def _header_with_stepper_fragment(current_step: int = 1) -> str:
     css = get_header_css() + get_stepper_css()
     header_html = get_header_html()
     stepper_html = get_stepper_html(current_step)
-    
-    full_html = f"""
+
+    return minify_html(f"""
     <style>
     * {{ box-sizing: border-box; margin: 0; padding: 0; }}
     html, body {{ 
@@ -231,5 +240,9 @@ def render_header_with_stepper(current_step: int = 1):
     </style>
     {header_html}
     {stepper_html}
-    """
-    st.html(full_html)
+    """)
+
+
+def render_header_with_stepper(current_step: int = 1):
+    """헤더 + 스텝 진행바를 함께 렌더링합니다."""
+    st.html(_header_with_stepper_fragment(current_step))
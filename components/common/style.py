@@ -1,5 +1,7 @@
 import streamlit as st
 
+from components.common.assets import minify_html
+
 def apply_common_styles():
     """
     모든 페이지에 공통적으로 적용되는 CSS 스타일을 주입합니다.
@@ -7,7 +9,7 @@ def apply_common_styles():
     - 상단/하단 패딩 조정
     - 전체 배경색 설정
     """
-    st.markdown("""
+    st.markdown(minify_html("""
         <style>
         /* Streamlit 기본 앱 컨테이너 (배경색) */
         [data-testid="stApp"] {
@@ -51,4 +53,4 @@ def apply_common_styles():
             font-family: -apple-system, BlinkMacSystemFont, "Noto Sans KR", system-ui, sans-serif;
         }
         </style>
-    """, unsafe_allow_html=True)
+    """), unsafe_allow_html=True)
@@ -1,6 +1,7 @@
 import streamlit as st
-import pandas as pd
 
 def point_map(lat: float, lon: float):
+    import pandas as pd
+
     df = pd.DataFrame([{"lat": lat, "lon": lon}])
     st.map(df)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -16,6 +17,36 @@ class Settings:
     kakao_rest_api_key: str | None = os.getenv("KAKAO_REST_API_KEY") or None
     vworld_api_key: str | None = os.getenv("VWORLD_API_KEY") or None
     vworld_domain: str | None = os.getenv("VWORLD_DOMAIN") or None
+    # 외부 API 주소 (api.mock_server 같은 로컬 대역으로 바꿔 부하/장애 테스트할 때 지정)
+    vworld_base_url: str = os.getenv("OKSSANGIMONG_VWORLD_BASE_URL", "https://api.vworld.kr").rstrip("/")
+    kakao_base_url: str = os.getenv("OKSSANGIMONG_KAKAO_BASE_URL", "https://dapi.kakao.com").rstrip("/")
+
+    # 키별 호출 한도 ("N/s,N/d", 예: "10/s,40000/d"). 기본은 끔(빈 값) — 운영에서 키 등급에 맞게 지정하세요.
+    # 하나라도 지정하면 호스트의 모든 프로세스가 quota_db 하나를 공유 (core.utils.quota)
+    kakao_quota: str = os.getenv("OKSSANGIMONG_KAKAO_QUOTA", "")
+    vworld_quota: str = os.getenv("OKSSANGIMONG_VWORLD_QUOTA", "")
+    quota_db: str = os.getenv("OKSSANGIMONG_QUOTA_DB") or str(Path(tempfile.gettempdir()) / "okssangimong-quota.sqlite")
+    # 초당 한도에 걸렸을 때 토큰을 기다리는 최대 시간 (넘으면 다음 provider로)
+    quota_max_wait_s: float = float(os.getenv("OKSSANGIMONG_QUOTA_MAX_WAIT_S", "1.0"))
+
+    # HTTP API(server.main): 동기 core 서비스를 돌리는 스레드 수 (= 동시 처리 가능한 요청 수)
+    api_max_concurrency: int = int(os.getenv("OKSSANGIMONG_API_MAX_CONCURRENCY", "200"))
+
+    # 폴리곤 면적: pyproj Korea 2000 TM 투영 사용 여부 / 고정 CRS (미지정 시 경도별 투영대 EPSG:5185~5188)
+    precise_area: bool = os.getenv("OKSSANGIMONG_PRECISE_AREA", "1").lower() not in ("0", "false", "no")
+    area_crs: str | None = os.getenv("OKSSANGIMONG_AREA_CRS") or None
+
+    # 단계별 소요 시간 span/히스토그램 (core.utils.tracing)
+    tracing: bool = os.getenv("OKSSANGIMONG_TRACING", "1").lower() not in ("0", "false", "no")
+
+    # Prometheus 지표 로컬 엔드포인트 포트 (Streamlit 프로세스용, 0이면 끔. API 서버는 항상 GET /metrics)
+    metrics_port: int = int(os.getenv("OKSSANGIMONG_METRICS_PORT", "0"))
+
+    # 같은 주소/좌표 동시 조회를 프로세스 간에도 합칠 때 쓰는 디렉터리 (잠금 파일 + SQLite, 미지정 시 프로세스 내에서만)
+    singleflight_dir: str | None = os.getenv("OKSSANGIMONG_SINGLEFLIGHT_DIR") or None
+
+    # 로컬 도로명주소 색인(python -m etl.addresses)이 있으면 먼저 조회하고 없는 주소만 Kakao/VWorld로 보냄
+    offline_geocoder: bool = os.getenv("OKSSANGIMONG_OFFLINE_GEOCODER", "1").lower() not in ("0", "false", "no")
 
     # 버전 관리(계수/수식/데이터)
     engine_version: str = "0.1.0"
@@ -0,0 +1,168 @@
+"""Memory-mapped road-name address index (etl.addresses 출력 / api.offline_geocoder 입력).
+
+레이아웃 (settings.data_dir/processed/addresses/ → addresses.<시각>/ 링크, core.utils.publish):
+- ``meta.json``: 행 수, 만든 시각, 원본 파일, 지역 목록 [[시도 약칭, 시군구], ...]
+- ``keys.npy``: 전체 키(ParsedAddress.key) 64비트 해시, 오름차순. 아래 행 배열도 같은 순서
+- ``lat.npy`` / ``lon.npy`` (float64), ``region.npy`` (uint16, 지역 목록 번호)
+- ``names.bin`` + ``name_offsets.npy``: 표시용 도로명주소 (UTF-8를 이어 붙인 것과 행별 시작 위치)
+- ``road_keys.npy`` + ``road_rows.npy``: 지역을 뺀 키(road_key) 해시 오름차순과 그 행 번호
+- ``suggest_keys.npy`` + ``suggest_targets.npy``: 표시 주소 자동완성용 접두어 색인 (core.utils.prefix_index)
+
+모든 배열은 np.load(mmap_mode="r")로 열어서 전국(약 600만 행)이어도 실제로 읽는 페이지만 메모리에 올라가고,
+조회는 정렬 배열 이진 탐색(searchsorted) 한두 번이라 수 µs입니다. 64비트 해시 충돌은 600만 키에서
+확률 1e-6 수준이라 따로 확인하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+from core.config import settings
+from core.utils.address import ParsedAddress
+from core.utils.prefix_index import PrefixIndex
+from core.utils.publish import publish_dir
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+META_FILE = "meta.json"
+
+
+def address_index_path() -> Path:
+    return Path(settings.data_dir) / "processed" / "addresses"
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class AddressMatch(NamedTuple):
+    address: str
+    lat: float
+    lon: float
+    exact: bool  # False면 지역을 생략/일부만 준 입력을 도로명+건물번호로 찾은 것
+
+
+def write_address_index(rows: pd.DataFrame, out_dir: Path, *, sources: Iterable[str] = ()) -> int:
+    """rows(sido, sigungu, road, main, sub, underground, lat, lon, address) → 색인 파일. 쓴 행 수를 돌려줍니다.
+
+    같은 키가 여러 번 나오면(건물 출입구가 여러 개인 경우 등) 첫 행만 씁니다.
+    """
+    import numpy as np
+
+    keys = [
+        ParsedAddress(*values).key()
+        for values in zip(rows["sido"], rows["sigungu"], rows["road"], rows["main"], rows["sub"], rows["underground"])
+    ]
+    hashes = np.fromiter((key_hash(k) for k in keys), dtype=np.uint64, count=len(keys))
+    hashes, first = np.unique(hashes, return_index=True)  # 정렬 + 중복 제거
+    rows = rows.iloc[first]
+
+    regions = sorted(set(zip(rows["sido"], rows["sigungu"])))
+    region_ids = {region: i for i, region in enumerate(regions)}
+
+    road_hashes = np.fromiter(
+        (
+            key_hash(ParsedAddress("", "", *values).road_key())
+            for values in zip(rows["road"], rows["main"], rows["sub"], rows["underground"])
+        ),
+        dtype=np.uint64,
+        count=len(rows),
+    )
+    road_rows = np.argsort(road_hashes, kind="stable").astype(np.int32)
+
+    encoded = [a.encode("utf-8") for a in rows["address"]]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+
+    # 실행 중인 프로세스가 mmap한 파일을 덮어쓰지 않도록 새 버전 디렉터리에 쓴 뒤 링크를 바꿈
+    with publish_dir(out_dir) as tmp:
+        np.save(tmp / "keys.npy", hashes)
+        np.save(tmp / "lat.npy", rows["lat"].to_numpy(dtype=np.float64))
+        np.save(tmp / "lon.npy", rows["lon"].to_numpy(dtype=np.float64))
+        np.save(
+            tmp / "region.npy",
+            np.fromiter((region_ids[r] for r in zip(rows["sido"], rows["sigungu"])), dtype=np.uint16, count=len(rows)),
+        )
+        np.save(tmp / "road_keys.npy", road_hashes[road_rows])
+        np.save(tmp / "road_rows.npy", road_rows)
+        np.save(tmp / "name_offsets.npy", offsets)
+        (tmp / "names.bin").write_bytes(b"".join(encoded))
+        PrefixIndex.build(rows["address"]).save(tmp, "suggest")
+        meta = {"rows": int(len(rows)), "built_at": time.time(), "sources": list(sources), "regions": regions}
+        (tmp / META_FILE).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    return int(len(rows))
+
+
+class AddressIndex:
+    """도로명주소 색인 (읽기 전용, thread-safe)."""
+
+    def __init__(self, path: str | Path):
+        import numpy as np
+
+        # 링크(etl 재실행 시 바뀜)가 아니라 지금 버전 디렉터리를 고정해서 엶
+        self.path = Path(path).resolve()
+        meta = json.loads((self.path / META_FILE).read_text(encoding="utf-8"))
+        self.rows: int = meta["rows"]
+        self.regions: list[tuple[str, str]] = [tuple(r) for r in meta["regions"]]
+
+        def load(name: str) -> np.ndarray:
+            return np.load(self.path / f"{name}.npy", mmap_mode="r")
+
+        self._u64 = np.uint64  # 파이썬 int를 그대로 넘기면 2**63 이상에서 float로 비교됨
+        self._keys = load("keys")
+        self._lat = load("lat")
+        self._lon = load("lon")
+        self._region = load("region")
+        self._road_keys = load("road_keys")
+        self._road_rows = load("road_rows")
+        self._offsets = load("name_offsets")
+        self._names = np.memmap(self.path / "names.bin", dtype=np.uint8, mode="r") if self.rows else b""
+        self._suggest = PrefixIndex.load(self.path, "suggest")
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _row(self, i: int, exact: bool) -> AddressMatch:
+        return AddressMatch(self.address(i), float(self._lat[i]), float(self._lon[i]), exact)
+
+    def address(self, row: int) -> str:
+        start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+        return bytes(self._names[start:end]).decode("utf-8")
+
+    def suggest(self, query: str, limit: int = 10) -> list[str]:
+        """query로 시작하는(토큰 경계 기준) 표시 주소 최대 limit개."""
+        if self._suggest is None:
+            return []
+        return [self.address(row) for row in self._suggest.search(query, limit)]
+
+    def _region_matches(self, row: int, parsed: ParsedAddress) -> bool:
+        sido, sigungu = self.regions[int(self._region[row])]
+        if parsed.sido and parsed.sido != sido:
+            return False
+        # "장안구"만 준 입력도 "수원시장안구"에 맞도록 포함 관계로 비교
+        return not parsed.sigungu or parsed.sigungu in sigungu
+
+    def lookup(self, parsed: ParsedAddress) -> AddressMatch | None:
+        """정확히 일치하는 키가 있으면 그 행, 없으면 도로명+건물번호가 같고 입력 지역과 어긋나지 않는 행이
+        하나뿐일 때 그 행. 후보가 여러 개(지역 생략으로 모호)이거나 없으면 None."""
+        if not self.rows:
+            return None
+        if parsed.sido:
+            h = self._u64(key_hash(parsed.key()))
+            i = int(self._keys.searchsorted(h))
+            if i < self.rows and self._keys[i] == h:
+                return self._row(i, True)
+
+        h = self._u64(key_hash(parsed.road_key()))
+        lo = int(self._road_keys.searchsorted(h, side="left"))
+        hi = int(self._road_keys.searchsorted(h, side="right"))
+        matches = [row for row in (int(r) for r in self._road_rows[lo:hi]) if self._region_matches(row, parsed)]
+        if len(matches) != 1:
+            return None
+        return self._row(matches[0], False)
@@ -0,0 +1,67 @@
+"""Building name/address autocomplete index (etl.buildings 출력 / AutocompleteService 입력).
+
+레이아웃 (settings.data_dir/processed/buildings_suggest/ → buildings_suggest.<시각>/ 링크, core.utils.publish):
+- ``meta.json``: 건물 수, 만든 시각
+- ``suggest_keys.npy`` + ``suggest_targets.npy``: 이름/주소 접두어 색인 (core.utils.prefix_index, 대상 = 건물 번호)
+- ``names.bin`` + ``names_offsets.npy``, ``addresses.bin`` + ``addresses_offsets.npy``: 건물 번호별 이름/주소
+
+전국 건물 테이블을 프로세스마다 읽어 색인을 만들지 않도록 ETL에서 한 번 만들어 두고 mmap으로 씁니다.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Sequence
+
+from core.data_access.loaders import buildings_path
+from core.utils.prefix_index import MappedStrings, PrefixIndex, save_strings
+from core.utils.publish import publish_dir
+
+META_FILE = "meta.json"
+
+
+def buildings_suggest_path(table_path: Path | None = None) -> Path:
+    """건물 테이블(buildings.parquet) 옆 buildings_suggest 디렉터리."""
+    return (table_path or buildings_path()).with_name("buildings_suggest")
+
+
+class BuildingSuggestIndex:
+    """건물 이름/주소 자동완성 색인. 읽기 전용, thread-safe."""
+
+    def __init__(self, prefix: PrefixIndex, names: Sequence[str | None], addresses: Sequence[str]):
+        self.prefix = prefix
+        self.names = names
+        self.addresses = addresses
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    @classmethod
+    def build(cls, names: Sequence[str | None], addresses: Sequence[str]) -> BuildingSuggestIndex:
+        """메모리에서 바로 만들기 (샘플 테이블처럼 작은 경우). 건물 i의 이름과 주소가 모두 i를 가리킴."""
+        n = len(addresses)
+        prefix = PrefixIndex.build([*names, *addresses], targets=[*range(n), *range(n)])
+        return cls(prefix, names, addresses)
+
+    @classmethod
+    def load(cls, path: Path) -> BuildingSuggestIndex | None:
+        """ETL이 써 둔 색인을 mmap으로 엽니다. 없으면 None."""
+        path = Path(path).resolve()
+        if not (path / META_FILE).is_file():
+            return None
+        prefix = PrefixIndex.load(path, "suggest")
+        return cls(prefix, MappedStrings(path, "names"), MappedStrings(path, "addresses"))
+
+    def save(self, out_dir: Path) -> None:
+        with publish_dir(out_dir) as tmp:
+            self.prefix.save(tmp, "suggest")
+            save_strings(tmp, "names", self.names)
+            save_strings(tmp, "addresses", self.addresses)
+            meta = {"buildings": len(self), "built_at": time.time()}
+            (tmp / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[str | None, str]]:
+        """[(이름 또는 None, 주소), ...] 최대 limit개."""
+        return [(self.names[i] or None, self.addresses[i]) for i in self.prefix.search(query, limit)]
@@ -1,19 +1,56 @@
 from __future__ import annotations
 
+import json
 from functools import lru_cache
 from pathlib import Path
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from core.config import settings
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# etl.buildings 출력 레이아웃: buildings.parquet/sigungu_cd=XXXXX/part-0.parquet (+ 파티션별 bbox 인덱스)
+PARTITION_KEY = "sigungu_cd"
+PARTITION_INDEX = "_partitions.json"
+BUILDINGS_COLUMNS = [
+    "building_id",
+    "name",
+    "address",
+    "lat",
+    "lon",
+    "roof_area_m2",
+    "greenable_area_m2",
+    "roof_area_source",  # "register"(대장 실측) | "footprint"(α × footprint 면적) | "building_area"(α × 대장 건축면적)
+    "roof_version",  # etl.roof_areas 사전계산에 쓴 α/β
+    "footprint_area_m2",
+    "building_area_m2",
+    "use",
+    "ground_floors",
+    "height_m",
+    "pnu",
+    "footprint",  # core.utils.polycodec 인코딩 폴리곤 (포함 판정/공간 조인용)
+]
+
+
+def buildings_path() -> Path:
+    """처리된 건물 테이블 경로 (단일 parquet 파일 또는 시군구 파티션 디렉터리)."""
+    return Path(settings.data_dir) / "processed" / "buildings.parquet"
+
+
 @lru_cache(maxsize=8)
 def load_buildings_table() -> pd.DataFrame:
     """Load processed building table.
 
     Expected columns (example):
     - building_id, name, address, lat, lon, roof_area_m2 (optional)
+    etl.buildings가 만든 파티션 디렉터리면 sigungu_cd 컬럼과 BUILDINGS_COLUMNS가 함께 들어옵니다.
     """
-    path = Path(settings.data_dir) / "processed" / "buildings.parquet"
+    # pandas는 import 비용이 커서 실제로 테이블이 필요할 때 import
+    import pandas as pd
+
+    path = buildings_path()
     if path.exists():
         return pd.read_parquet(path)
 
@@ -34,8 +71,189 @@ def load_buildings_table() -> pd.DataFrame:
     # MVP: empty table if not provided
     return pd.DataFrame(columns=["building_id", "name", "address", "lat", "lon", "roof_area_m2"])
 
+def _table_version() -> tuple[str, int | None]:
+    """(테이블 경로, 버전). etl.buildings는 파티션을 다 쓴 뒤 _partitions.json을 os.replace로 바꾸므로
+    그 mtime을 버전으로 씁니다 (인덱스가 없는 디렉터리/단일 parquet 파일이면 경로 자체의 mtime)."""
+    path = buildings_path()
+    for marker in (path / PARTITION_INDEX, path):
+        try:
+            return str(path), marker.stat().st_mtime_ns
+        except OSError:
+            continue
+    return str(path), None
+
+
+_seen_version: tuple[str, int | None] | None = None
+
+
+def current_table_version() -> tuple[str, int | None]:
+    """지금 읽는 건물 테이블의 (경로, 버전). 테이블에서 계산한 값을 캐시할 때 키에 넣습니다."""
+    global _seen_version
+    version = _table_version()
+    if version != _seen_version:
+        # ETL로 테이블이 바뀌면 이전 버전의 데이터셋/footprint 색인(메모리 큼)을 바로 놓음
+        clear_table_caches()
+        _seen_version = version
+    return version
+
+
+def clear_table_caches() -> None:
+    """건물 테이블에서 만든 캐시(데이터셋 메타데이터, 파티션 bbox, footprint 색인)를 비웁니다."""
+    _open_dataset.cache_clear()
+    _read_partition_bboxes.cache_clear()
+    _footprint_index.cache_clear()
+
+
+def _buildings_dataset():
+    """pyarrow Dataset (메타데이터만 읽음). parquet 테이블이 없으면 None. 테이블 버전이 바뀌면 다시 엽니다."""
+    return _open_dataset(*current_table_version())
+
+
+@lru_cache(maxsize=1)
+def _open_dataset(path_str: str, version: int | None):
+    path = Path(path_str)
+    if not path.exists():
+        return None
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    if path.is_dir():
+        # 시군구코드는 문자열로 (정수로 추론하면 앞자리 0이 사라짐)
+        partitioning = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+        return ds.dataset(path, format="parquet", partitioning=partitioning, exclude_invalid_files=True)
+    return ds.dataset(path, format="parquet")
+
+
+def _partition_bboxes() -> dict[str, list[float]]:
+    """etl.buildings가 기록한 시군구 파티션별 bbox [min_lon, min_lat, max_lon, max_lat]."""
+    return _read_partition_bboxes(*current_table_version())
+
+
+@lru_cache(maxsize=1)
+def _read_partition_bboxes(path_str: str, version: int | None) -> dict[str, list[float]]:
+    path = Path(path_str) / PARTITION_INDEX
+    if not path.is_file():
+        return {}
+    return {code: entry["bbox"] for code, entry in json.loads(path.read_text(encoding="utf-8")).items()}
+
+
+def query_buildings_bbox(
+    min_lat: float, min_lon: float, max_lat: float, max_lon: float, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """bbox 안의 건물만 읽기.
+
+    parquet 테이블이면 전체를 메모리에 올리지 않고
+    파티션 bbox(_partitions.json) → row group lat/lon 통계 순으로 걸러 겹치는 row group만 읽습니다.
+    parquet가 없으면(샘플 CSV) load_buildings_table 결과를 걸러서 반환합니다.
+    columns 중 테이블에 없는 컬럼은 빼고 읽습니다.
+    """
+    import pandas as pd
+
+    dataset = _buildings_dataset()
+    if dataset is None:
+        df = load_buildings_table()
+        if columns:
+            columns = [c for c in columns if c in df.columns]
+        lat = pd.to_numeric(df["lat"], errors="coerce")
+        lon = pd.to_numeric(df["lon"], errors="coerce")
+        out = df[lat.between(min_lat, max_lat) & lon.between(min_lon, max_lon)]
+        return out[columns] if columns else out
+
+    import pyarrow.dataset as ds
+
+    if columns:
+        columns = [c for c in columns if c in dataset.schema.names]
+    filt = (
+        (ds.field("lat") >= min_lat)
+        & (ds.field("lat") <= max_lat)
+        & (ds.field("lon") >= min_lon)
+        & (ds.field("lon") <= max_lon)
+    )
+    index = _partition_bboxes()
+    if index:
+        codes = [
+            code
+            for code, (x0, y0, x1, y1) in index.items()
+            if x0 <= max_lon and min_lon <= x1 and y0 <= max_lat and min_lat <= y1
+        ]
+        if not codes:
+            names = columns or dataset.schema.names
+            return pd.DataFrame(columns=names)
+        filt = filt & ds.field(PARTITION_KEY).isin(codes)
+    return dataset.to_table(columns=columns, filter=filt).to_pandas()
+
+
+def group_points_by_partition(lats, lons) -> dict[str | None, "np.ndarray"]:
+    """점들을 bbox가 포함하는 시군구 파티션별로 묶기 → {코드: 점 인덱스 배열}.
+
+    파티션 인덱스가 없으면 {None: 전체} (= 테이블 전체를 한 인덱스로). 경계 근처 점은 여러 파티션에 들어갈 수 있습니다.
+    """
+    import numpy as np
+
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    index = _partition_bboxes()
+    if not index:
+        return {None: np.arange(len(lats))}
+    codes = list(index)
+    b = np.asarray([index[c] for c in codes], dtype=np.float64)
+    inside = (
+        (b[None, :, 0] <= lons[:, None])
+        & (lons[:, None] <= b[None, :, 2])
+        & (b[None, :, 1] <= lats[:, None])
+        & (lats[:, None] <= b[None, :, 3])
+    )
+    return {codes[j]: np.flatnonzero(inside[:, j]) for j in np.flatnonzero(inside.any(axis=0))}
+
+
+def load_building_names() -> pd.DataFrame:
+    """자동완성용 name/address 컬럼만 읽기 (parquet 테이블이면 두 컬럼만, footprint 등은 읽지 않음)."""
+    dataset = _buildings_dataset()
+    if dataset is None:
+        df = load_buildings_table()
+        return df[[c for c in ("name", "address") if c in df.columns]]
+    import pyarrow.dataset as ds
+
+    columns = [c for c in ("name", "address") if c in dataset.schema.names]
+    return dataset.to_table(columns=columns, filter=ds.field("address").is_valid()).to_pandas()
+
+
+def load_footprint_index(partition: str | None = None, columns: tuple[str, ...] = ()):
+    """footprint가 있는 건물 행과 그 폴리곤의 PolygonIndex (파티션별, 최근 FOOTPRINT_INDEX_CACHE_SIZE개만 캐시).
+
+    반환: (DataFrame, PolygonIndex) — PolygonIndex의 폴리곤 번호 = DataFrame 행 번호.
+    footprint 컬럼이 없는 테이블(샘플 CSV 등)이면 None.
+    """
+    return _footprint_index(current_table_version(), partition, columns)
+
+
+# 시군구 하나의 색인이 수십~수백 MB라 최근 몇 개만 (일괄 매칭용, 한 점 조회는 repositories.find_building_at)
+FOOTPRINT_INDEX_CACHE_SIZE = 12
+
+
+@lru_cache(maxsize=FOOTPRINT_INDEX_CACHE_SIZE)
+def _footprint_index(version: tuple[str, int | None], partition: str | None, columns: tuple[str, ...]):
+    dataset = _buildings_dataset()
+    if dataset is None or "footprint" not in dataset.schema.names:
+        return None
+    import pyarrow.dataset as ds
+
+    from core.utils.polycodec import decode_many
+    from core.utils.spatial import PolygonIndex
+
+    filt = ds.field("footprint").is_valid()
+    if partition is not None:
+        filt = filt & (ds.field(PARTITION_KEY) == partition)
+    names = [c for c in dict.fromkeys(("footprint", *columns)) if c in dataset.schema.names]
+    df = dataset.to_table(columns=names, filter=filt).to_pandas()
+    index = PolygonIndex(*decode_many(df.pop("footprint")))
+    return df.reset_index(drop=True), index
+
+
 @lru_cache(maxsize=8)
 def load_lookup_table(name: str) -> pd.DataFrame:
+    import pandas as pd
+
     path = Path(settings.data_dir) / "lookup" / f"{name}.csv"
     if not path.exists():
         return pd.DataFrame()
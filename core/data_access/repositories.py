@@ -1,43 +1,139 @@
 from __future__ import annotations
 
-import pandas as pd
+import math
+from typing import TYPE_CHECKING, Any
 
-from core.data_access.loaders import load_buildings_table
+from core.data_access.loaders import group_points_by_partition, load_footprint_index, query_buildings_bbox
 from core.models import BuildingCandidate
-from core.utils.geometry import haversine_m
+from core.utils.geometry import haversine_m_many
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_CANDIDATE_COLUMNS = ["building_id", "name", "address", "lat", "lon", "roof_area_m2"]
+# etl.roof_areas 사전계산 컬럼 (있으면 후보 extra에 그대로 실어 추정 단계에서 네트워크 없이 사용)
+# 한 점 포함 판정 때 읽는 범위: 대표점이 이 거리 안에 있는 건물 footprint만 (대형 단지 건물도 덮도록 여유 있게)
+FOOTPRINT_SEARCH_M = 300.0
+_PRECOMPUTED_COLUMNS = ["footprint_area_m2", "building_area_m2", "greenable_area_m2", "roof_area_source", "roof_version"]
+# roof_area_source → α × 바닥면적 사전계산에 쓴 바닥면적 컬럼 (앞에서부터 값이 있는 것)
+PRECOMPUTED_FLOOR_COLUMNS = {"footprint": "footprint_area_m2", "building_area": "building_area_m2"}
+
+
+def _none_if_missing(value: Any) -> Any:
+    # parquet/CSV 결측값(NaN/NA) → None (pydantic 모델이 Optional[str]로 받도록)
+    import pandas as pd
+
+    return None if pd.isna(value) else value
+
 
 def find_nearby_buildings(lat: float, lon: float, radius_m: float = 150.0, limit: int = 5) -> list[BuildingCandidate]:
-    df: pd.DataFrame = load_buildings_table()
+    import numpy as np
+    import pandas as pd
+
+    # 반경을 감싸는 bbox만 읽고 (parquet면 겹치는 row group만), 거리는 한 번에 계산
+    df: pd.DataFrame = query_buildings_bbox(*_bbox_around(lat, lon, radius_m), columns=_CANDIDATE_COLUMNS + _PRECOMPUTED_COLUMNS)
     if df.empty:
         return []
 
-    # 매우 단순한 거리 계산 (MVP)
-    candidates = []
-    for _, row in df.iterrows():
-        try:
-            d = haversine_m(lat, lon, float(row["lat"]), float(row["lon"]))
-        except Exception:
-            continue
-        if d <= radius_m:
-            candidates.append((d, row))
-
-    candidates.sort(key=lambda x: x[0])
-    out: list[BuildingCandidate] = []
-    for d, row in candidates[:limit]:
-        out.append(
-            BuildingCandidate(
-                building_id=str(row.get("building_id")),
-                name=row.get("name"),
-                address=row.get("address"),
-                distance_m=float(d),
-                extra={"roof_area_m2": row.get("roof_area_m2")},
-            )
-        )
+    lats = pd.to_numeric(df["lat"], errors="coerce").to_numpy(dtype=float)
+    lons = pd.to_numeric(df["lon"], errors="coerce").to_numpy(dtype=float)
+    d = haversine_m_many(lat, lon, lats, lons)
+    within = np.flatnonzero(d <= radius_m)
+    nearest = within[np.argsort(d[within], kind="stable")][:limit]
+
+    return [_candidate_from_row(df.iloc[int(i)], float(d[i])) for i in nearest]
+
+
+def _bbox_around(lat: float, lon: float, radius_m: float) -> tuple[float, float, float, float]:
+    """반경을 감싸는 (min_lat, min_lon, max_lat, max_lon)."""
+    dlat = radius_m / 111_320.0
+    dlon = dlat / max(math.cos(math.radians(lat)), 1e-6)
+    return lat - dlat, lon - dlon, lat + dlat, lon + dlon
+
+
+def _candidate_from_row(row: pd.Series, distance_m: float | None) -> BuildingCandidate:
+    return BuildingCandidate(
+        building_id=str(row.get("building_id")),
+        name=_none_if_missing(row.get("name")),
+        address=_none_if_missing(row.get("address")),
+        distance_m=distance_m,
+        extra={
+            "roof_area_m2": _none_if_missing(row.get("roof_area_m2")),
+            **{col: _none_if_missing(row[col]) for col in _PRECOMPUTED_COLUMNS if col in row.index},
+        },
+    )
+
+
+def locate_buildings(lats, lons) -> list[BuildingCandidate | None]:
+    """점마다 그 점을 포함하는 건물 footprint의 건물 (없거나 footprint 데이터가 없으면 None).
+
+    시군구 파티션별 footprint STRtree를 만들어(최근 몇 개만 캐시, loaders.load_footprint_index) 파티션마다 점 묶음을
+    한 번에 질의합니다. 일괄 매칭용이며, 화면에서 한 점만 찾을 때는 find_building_at을 씁니다.
+    distance_m은 건물 대표점까지의 거리입니다.
+    """
+    import numpy as np
+
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    out: list[BuildingCandidate | None] = [None] * len(lats)
+    for partition, idx in group_points_by_partition(lats, lons).items():
+        loaded = load_footprint_index(partition, tuple(_CANDIDATE_COLUMNS + _PRECOMPUTED_COLUMNS))
+        if loaded is None:
+            return out
+        rows, index = loaded
+        hits = index.locate_many(lons[idx], lats[idx])
+        for k, hit in zip(idx.tolist(), hits.tolist()):
+            if hit < 0 or out[k] is not None:
+                continue
+            row = rows.iloc[hit]
+            d = float(haversine_m_many(lats[k], lons[k], [row["lat"]], [row["lon"]])[0])
+            out[k] = _candidate_from_row(row, d)
     return out
 
-def get_roof_area_from_candidate(candidate: BuildingCandidate) -> float | None:
-    v = candidate.extra.get("roof_area_m2") if candidate.extra else None
+
+def find_building_at(lat: float, lon: float, search_m: float = FOOTPRINT_SEARCH_M) -> BuildingCandidate | None:
+    """좌표를 포함하는 footprint의 건물 (없으면 None).
+
+    대표점이 search_m 안에 있는 건물의 footprint만 읽어 작은 색인을 만듭니다 (시군구 전체 색인을 메모리에 두지 않음).
+    """
+    import numpy as np
+
+    from core.utils.polycodec import decode_many
+    from core.utils.spatial import PolygonIndex
+
+    df = query_buildings_bbox(
+        *_bbox_around(lat, lon, search_m), columns=["footprint", *_CANDIDATE_COLUMNS, *_PRECOMPUTED_COLUMNS]
+    )
+    if "footprint" not in df.columns:
+        return None
+    df = df[df["footprint"].notna()].reset_index(drop=True)
+    if df.empty:
+        return None
+    index = PolygonIndex(*decode_many(df.pop("footprint")))
+    hit = int(index.locate_many(np.asarray([lon]), np.asarray([lat]))[0])
+    if hit < 0:
+        return None
+    row = df.iloc[hit]
+    return _candidate_from_row(row, float(haversine_m_many(lat, lon, [row["lat"]], [row["lon"]])[0]))
+
+
+def _extra_float(candidate: BuildingCandidate, key: str) -> float | None:
+    v = candidate.extra.get(key) if candidate.extra else None
     try:
         return float(v) if v is not None and v != "" else None
     except Exception:
         return None
+
+
+def get_roof_area_from_candidate(candidate: BuildingCandidate) -> float | None:
+    return _extra_float(candidate, "roof_area_m2")
+
+
+def get_footprint_area_from_candidate(candidate: BuildingCandidate) -> float | None:
+    return _extra_float(candidate, "footprint_area_m2")
+
+
+def get_precomputed_floor_area_from_candidate(candidate: BuildingCandidate) -> float | None:
+    """etl.roof_areas가 roof_area_m2를 α × 바닥면적으로 채웠으면 그 바닥면적 (실측값/미계산이면 None)."""
+    col = PRECOMPUTED_FLOOR_COLUMNS.get((candidate.extra or {}).get("roof_area_source"))
+    return _extra_float(candidate, col) if col else None
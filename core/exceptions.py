@@ -16,3 +16,21 @@ class RooftopAreaUnavailableError(OkssangimongError):
 
 class InvalidScenarioError(OkssangimongError):
     pass
+
+
+class UpstreamUnavailableError(OkssangimongError):
+    """외부 API를 잠시 쓸 수 없음 (호출 한도 초과, 연결 실패). 입력 문제가 아니므로 retry_after_s 뒤 다시 시도."""
+
+    def __init__(self, message: str, retry_after_s: float | None = None):
+        self.retry_after_s = retry_after_s
+        super().__init__(message)
+
+
+class QuotaExceededError(OkssangimongError):
+    """API 키 호출 한도(core.utils.quota) 초과. 같은 키로 재시도하지 말고 다음 provider로 넘어가세요."""
+
+    def __init__(self, key: str, retry_after_s: float | None = None):
+        self.key = key
+        self.retry_after_s = retry_after_s
+        when = f"{retry_after_s:.1f}s" if retry_after_s is not None else "tomorrow"
+        super().__init__(f"API quota for {key!r} exhausted (retry after {when})")
@@ -0,0 +1,156 @@
+"""Compact building footprint record.
+
+VWorld WFS(lt_c_bldginfo) 응답의 건물 폴리곤 하나를
+- 좌표: (N, 2) float64 배열 하나 + ring offsets (첫 ring = 외곽선, 나머지 = 구멍)
+- 속성: 건물 ID/용도/층수/높이/구조 등 자주 쓰는 값만 타입이 있는 필드로
+보관합니다. 원본 GeoJSON dict(키 문자열, 좌표 리스트의 리스트)를 들고 있지 않으므로
+캐시에 오래 두어도 메모리가 작고, 추정 단계에서 속성을 다시 조회할 필요가 없습니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from core.utils.geometry import geojson_polygons, pack_geojson, polygon_areas_m2
+from core.utils.polycodec import decode_polygon, encode_polygon
+
+# 필드 → lt_c_bldginfo 속성 키 후보 (데이터셋/버전마다 이름이 달라 앞에서부터 처음 찾은 값 사용, 대소문자 무시)
+PROPERTY_KEYS: dict[str, tuple[str, ...]] = {
+    "building_id": ("bd_mgt_sn", "bld_mgt_sn", "buld_idntfc_no", "gis_idntfc_no", "ufid"),
+    "pnu": ("pnu",),
+    "name": ("bld_nm", "buld_nm", "bldg_nm"),
+    "use": ("main_prpos_nm", "mainpurpsnm", "buld_prpos_nm", "bdtyp_nm", "main_prpos_code", "bdtyp_cd"),
+    "structure": ("strct_nm", "strct_cd_nm", "buld_strct_nm", "strct_cd"),
+    "ground_floors": ("grnd_flr", "gro_flo_co", "ground_floor_co"),
+    "underground_floors": ("ugrnd_flr", "und_flo_co", "undgrnd_floor_co"),
+    "height_m": ("height", "bld_hgt", "buld_hg"),
+    "building_area_m2": ("archarea", "arch_area", "buld_bildng_ar"),
+    "total_floor_area_m2": ("totalarea", "tot_area", "buld_totar"),
+}
+
+_STR_FIELDS = ("building_id", "pnu", "name", "use", "structure")
+_INT_FIELDS = ("ground_floors", "underground_floors")
+_FLOAT_FIELDS = ("height_m", "building_area_m2", "total_floor_area_m2")
+ATTRIBUTE_FIELDS = _STR_FIELDS + _INT_FIELDS + _FLOAT_FIELDS
+
+
+def _lookup(props: Mapping[str, Any], keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        for candidate in (key, key.upper()):
+            value = props.get(candidate)
+            if value not in (None, ""):
+                return value
+    return None
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_properties(props: Mapping[str, Any] | None) -> dict[str, Any]:
+    """WFS feature properties → Footprint 속성 필드 dict (없거나 변환 불가한 값은 None)."""
+    props = props or {}
+    out: dict[str, Any] = {}
+    for field in _STR_FIELDS:
+        value = _lookup(props, PROPERTY_KEYS[field])
+        out[field] = str(value) if value is not None else None
+    for field in _INT_FIELDS:
+        out[field] = _to_int(_lookup(props, PROPERTY_KEYS[field]))
+    for field in _FLOAT_FIELDS:
+        out[field] = _to_float(_lookup(props, PROPERTY_KEYS[field]))
+    return out
+
+
+def feature_attributes(feature: Mapping[str, Any]) -> dict[str, Any]:
+    """GeoJSON feature의 속성 필드 (건물 ID가 properties에 없으면 feature id 사용)."""
+    attributes = parse_properties(feature.get("properties"))
+    if attributes["building_id"] is None and feature.get("id") is not None:
+        attributes["building_id"] = str(feature["id"])
+    return attributes
+
+
+class Footprint:
+    """건물 폴리곤 1개 (구멍 포함) + 주요 속성."""
+
+    __slots__ = ("coords", "ring_offsets") + ATTRIBUTE_FIELDS
+
+    def __init__(self, coords: np.ndarray, ring_offsets: np.ndarray, **attributes: Any):
+        self.coords = np.ascontiguousarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.ring_offsets = np.asarray(ring_offsets, dtype=np.int32)
+        for field in ATTRIBUTE_FIELDS:
+            setattr(self, field, attributes.get(field))
+
+    @classmethod
+    def from_rings(cls, rings: Sequence[Sequence[Tuple[float, float]]], **attributes: Any) -> "Footprint":
+        coords, ring_offsets, _ = pack_geojson([{"type": "Polygon", "coordinates": [list(r) for r in rings]}])
+        return cls(coords, ring_offsets, **attributes)
+
+    @classmethod
+    def from_feature(cls, feature: Mapping[str, Any]) -> list["Footprint"]:
+        """GeoJSON feature → Footprint 목록 (MultiPolygon이면 폴리곤마다 하나, 속성은 공유)."""
+        attributes = feature_attributes(feature)
+        out: list[Footprint] = []
+        for poly in geojson_polygons(feature.get("geometry")):
+            coords, ring_offsets, _ = pack_geojson([{"type": "Polygon", "coordinates": poly}])
+            out.append(cls(coords, ring_offsets, **attributes))
+        return out
+
+    @classmethod
+    def from_bytes(cls, buf: bytes | bytearray | memoryview) -> "Footprint":
+        """to_bytes()로 만든 버퍼에서 복원 (ring offsets는 버퍼 view를 그대로 사용)."""
+        view = decode_polygon(buf)
+        return cls(view.coords(), view.ring_offsets, **view.attributes)
+
+    def to_bytes(self) -> bytes:
+        """캐시/세션/결과 저장소용 압축 표현 (꼭짓점당 8바이트 + 속성 JSON)."""
+        return encode_polygon(self.coords, self.ring_offsets, self.attributes())
+
+    # ---- geometry ----
+    @property
+    def exterior(self) -> np.ndarray:
+        return self.coords[self.ring_offsets[0]:self.ring_offsets[1]]
+
+    @property
+    def holes(self) -> list[np.ndarray]:
+        ro = self.ring_offsets
+        return [self.coords[ro[i]:ro[i + 1]] for i in range(1, len(ro) - 1)]
+
+    def exterior_list(self) -> list[tuple[float, float]]:
+        """외곽선을 [(lon, lat), ...]로 (기존 get_building_polygon 반환 형식)."""
+        return [(x, y) for x, y in self.exterior.tolist()]
+
+    def area_m2(self, *, precise: bool = False, crs: str | None = None) -> float:
+        """구멍을 뺀 면적 (m²)."""
+        polygon_offsets = np.array([0, len(self.ring_offsets) - 1])
+        return float(polygon_areas_m2(self.coords, self.ring_offsets, polygon_offsets, precise=precise, crs=crs)[0])
+
+    # ---- attributes ----
+    def attributes(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in ATTRIBUTE_FIELDS if getattr(self, field) is not None}
+
+    @property
+    def nbytes(self) -> int:
+        """좌표 배열 크기 (bytes)."""
+        return self.coords.nbytes + self.ring_offsets.nbytes
+
+    def __repr__(self) -> str:
+        return (
+            f"Footprint(building_id={self.building_id!r}, vertices={len(self.coords)}, "
+            f"holes={len(self.ring_offsets) - 2})"
+        )
+
+
+def footprints_from_features(features: Iterable[Mapping[str, Any]]) -> list[Footprint]:
+    return [fp for feature in features for fp in Footprint.from_feature(feature)]
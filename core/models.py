@@ -17,6 +17,12 @@ class LocationResult(BaseModel):
     extra: dict[str, Any] = Field(default_factory=dict)
 
 
+class AddressSuggestion(BaseModel):
+    label: str  # 화면 표시용 (건물이면 "이름 · 주소")
+    address: str  # 선택하면 검색창에 넣을 주소
+    source: Literal["building", "address"] = "address"
+
+
 class BuildingCandidate(BaseModel):
     building_id: str
     name: Optional[str] = None
@@ -1,63 +1,92 @@
 from __future__ import annotations
 
-import streamlit as st
-
-from core.models import LocationResult, RooftopAreaEstimate, ScenarioInput, SimulationResult
-from core.services.geocoding_service import GeocodingService
+from core.models import AddressSuggestion, LocationResult, RooftopAreaEstimate, ScenarioInput, SimulationResult
 from core.services.building_service import BuildingService
+from core.services.container import get_services
+from core.services.geocoding_service import GeocodingService
+from core.services.report_service import ReportService
 from core.services.rooftop_service import RooftopService
 from core.services.scenario_service import ScenarioService
-from core.services.report_service import ReportService
-from core.state import ensure_session
+from core.state import StateBackend, StreamlitStateBackend, ensure_session
 
 
 class AnalyzeService:
     """UI(페이지)에서 호출하는 유스케이스 진입점.
 
     멀티페이지 Streamlit에서는 세션 상태를 통해 입력/중간결과를 이어갑니다.
-    추후 FastAPI로 분리할 때는 session_state 대신 DB를 붙이면 됩니다.
+    상태 저장소는 주입 가능하며(core.state.StateBackend) 기본값은 st.session_state 입니다.
+    실제 계산은 프로세스 공유 서비스(core.services.container)에 위임하며,
+    HTTP API(server.main)도 같은 서비스를 세션 없이 사용합니다.
     """
 
-    def __init__(self):
-        ensure_session()
-        self.geocoding = GeocodingService()
-        self.buildings = BuildingService()
-        self.rooftop = RooftopService()
-        self.scenario = ScenarioService()
-        self.report = ReportService()
+    def __init__(self, state: StateBackend | None = None):
+        self.state = state or StreamlitStateBackend()
+        ensure_session(self.state)
+        self.services = get_services()
+
+    # 서비스는 공유 컨테이너에서 처음 쓸 때 생성됩니다 (페이지 콜드스타트 최소화)
+    @property
+    def geocoding(self) -> GeocodingService:
+        return self.services.geocoding
+
+    @property
+    def buildings(self) -> BuildingService:
+        return self.services.buildings
+
+    @property
+    def rooftop(self) -> RooftopService:
+        return self.services.rooftop
+
+    @property
+    def scenario(self) -> ScenarioService:
+        return self.services.scenario
+
+    @property
+    def report(self) -> ReportService:
+        return self.services.report
+
+    def suggest_addresses(self, query: str, k: int = 5) -> list[AddressSuggestion]:
+        return self.services.autocomplete.suggest(query, k)
 
     def set_address(self, address: str) -> LocationResult:
         loc = self.geocoding.geocode(address)
-        st.session_state["location"] = loc.model_dump()
+        self.state.set("location", loc.model_dump())
         return loc
 
     def estimate_rooftop_area(self, loc_dict: dict) -> RooftopAreaEstimate:
         lat = float(loc_dict["point"]["lat"])
         lon = float(loc_dict["point"]["lon"])
-        candidates = self.buildings.find_candidates(lat, lon)
-        est = self.rooftop.estimate_area(candidates, lat=lat, lon=lon)
-        return est
+        estimate = self.services.estimate_rooftop_area(lat, lon)
+        # 추정에 쓴 건물 폴리곤은 압축 인코딩으로 세션에 보관. 캐시만 읽음 (추정이 WFS를 건너뛰었거나
+        # 못 찾은 경우 여기서 다시 조회하지 않도록)
+        self.state.set("footprint", self.rooftop.cached_footprint_bytes(lat, lon))
+        return estimate
 
     def confirm_area(self, roof_area_m2: float) -> None:
-        st.session_state["roof_area_m2_confirmed"] = float(roof_area_m2)
+        self.state.set("roof_area_m2_confirmed", float(roof_area_m2))
 
     def set_scenario(self, scenario: ScenarioInput) -> None:
-        st.session_state["scenario"] = scenario.model_dump()
+        self.state.set("scenario", scenario.model_dump())
 
     def compute(self) -> SimulationResult:
-        roof_area = float(st.session_state["roof_area_m2_confirmed"] or 0.0)
-        scenario_dict = st.session_state.get("scenario") or {}
+        roof_area = float(self.state.get("roof_area_m2_confirmed") or 0.0)
+        scenario_dict = self.state.get("scenario") or {}
         scenario = ScenarioInput(**scenario_dict)
         result = self.scenario.compute(roof_area_m2=roof_area, scenario=scenario)
-        st.session_state["result"] = result.model_dump()
+        self.state.set("result", result.model_dump())
         return result
 
     def export_pdf(self) -> tuple[bytes, str]:
-        result_dict = st.session_state.get("result") or {}
+        result_dict = self.state.get("result") or {}
         result = SimulationResult(**result_dict)
         return self.report.build_pdf(result)
 
     def export_excel(self) -> tuple[bytes, str]:
-        result_dict = st.session_state.get("result") or {}
+        result_dict = self.state.get("result") or {}
         result = SimulationResult(**result_dict)
         return self.report.build_excel(result)
+
+    def export_image(self) -> tuple[bytes, str]:
+        result_dict = self.state.get("result") or {}
+        result = SimulationResult(**result_dict)
+        return self.report.build_image(result)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from core.data_access.address_index import AddressIndex
+from core.data_access.building_suggest import BuildingSuggestIndex
+from core.models import AddressSuggestion
+from core.utils.tracing import traced
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+MIN_QUERY_CHARS = 2
+
+
+class AutocompleteService:
+    """검색창 주소 자동완성: 건물 이름/주소 색인 + 도로명주소 색인에서 접두어가 맞는 주소 top-k.
+
+    두 색인 모두 ETL(etl.buildings, etl.addresses)이 만들어 둔 정렬 배열을 mmap으로 쓰고,
+    ServiceContainer가 프로세스당 하나를 모든 세션에 공유합니다. 조회는 이진 탐색이라 ms 미만.
+    """
+
+    def __init__(self, buildings: BuildingSuggestIndex | None = None, address_index: AddressIndex | None = None):
+        self.buildings = buildings
+        self.address_index = address_index
+
+    @classmethod
+    def from_frame(cls, buildings: pd.DataFrame, address_index: AddressIndex | None = None) -> AutocompleteService:
+        """name/address 컬럼 테이블로 건물 색인을 메모리에서 만들기 (ETL 색인이 없는 샘플/테스트용)."""
+        frame = buildings.dropna(subset=["address"])
+        names = frame["name"].astype("string") if "name" in frame else [None] * len(frame)
+        index = BuildingSuggestIndex.build(
+            [name if isinstance(name, str) and name else None for name in names],
+            [str(a) for a in frame["address"]],
+        )
+        return cls(index, address_index)
+
+    @traced("autocomplete.suggest")
+    def suggest(self, query: str, k: int = 8) -> list[AddressSuggestion]:
+        query = (query or "").strip()
+        if len(query.replace(" ", "")) < MIN_QUERY_CHARS:
+            return []
+        out: list[AddressSuggestion] = []
+        seen: set[str] = set()
+
+        def add(suggestion: AddressSuggestion) -> None:
+            if suggestion.address not in seen and len(out) < k:
+                seen.add(suggestion.address)
+                out.append(suggestion)
+
+        if self.buildings is not None:
+            for name, address in self.buildings.search(query, k):
+                label = f"{name} · {address}" if name else address
+                add(AddressSuggestion(label=label, address=address, source="building"))
+        if self.address_index is not None and len(out) < k:
+            for address in self.address_index.suggest(query, k):
+                add(AddressSuggestion(label=address, address=address, source="address"))
+        return out
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from core.models import BuildingCandidate
-from core.data_access.repositories import find_nearby_buildings
+from core.data_access.repositories import find_building_at, find_nearby_buildings, locate_buildings
 from core.exceptions import BuildingNotFoundError
+from core.utils.tracing import span, traced
 
 class BuildingService:
-    def find_candidates(self, lat: float, lon: float) -> list[BuildingCandidate]:
-        return find_nearby_buildings(lat, lon, radius_m=200.0, limit=5)
+    @traced("buildings.find_candidates")
+    def find_candidates(self, lat: float, lon: float, limit: int = 5) -> list[BuildingCandidate]:
+        """반경 내 후보 (가까운 순). 좌표를 footprint로 포함하는 건물이 있으면 맨 앞에 두고 extra["contains_point"]=True."""
+        with span("buildings.nearby"):
+            candidates = find_nearby_buildings(lat, lon, radius_m=200.0, limit=limit)
+        with span("buildings.containment"):
+            containing = find_building_at(lat, lon)
+        if containing is None:
+            return candidates
+        containing.extra["contains_point"] = True
+        others = [c for c in candidates if c.building_id != containing.building_id]
+        return [containing, *others][:limit]
 
     def choose_best(self, candidates: list[BuildingCandidate]) -> BuildingCandidate:
         if not candidates:
             raise BuildingNotFoundError("근처 건물 후보를 찾지 못했습니다.")
-        # MVP: 가장 가까운 후보
-        return candidates[0]
+        # 좌표를 포함하는 건물 우선, 없으면 가장 가까운 후보 (대표점 기준)
+        return next((c for c in candidates if c.extra.get("contains_point")), candidates[0])
+
+    @traced("buildings.match_points")
+    def match_points(self, points: Sequence[tuple[float, float]]) -> list[BuildingCandidate | None]:
+        """(lat, lon) 여러 개를 한 번에 건물과 매칭 (포함 판정, 일괄 주소 처리용)."""
+        if not points:
+            return []
+        lats, lons = zip(*points)
+        return locate_buildings(lats, lons)
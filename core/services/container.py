@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Any, Callable
+
+from core.models import RooftopAreaEstimate
+from core.services.autocomplete_service import AutocompleteService
+from core.services.building_service import BuildingService
+from core.services.geocoding_service import GeocodingService
+from core.services.report_service import ReportService
+from core.services.rooftop_service import RooftopService
+from core.services.scenario_service import ScenarioService
+from core.utils import metrics
+from core.utils.cache import LRUCache
+
+
+class ServiceContainer:
+    """프로세스 단위로 공유하는 서비스 묶음.
+
+    서비스들은 세션 상태를 갖지 않으므로 Streamlit 세션/ API 요청 모두가
+    같은 인스턴스(커넥션 풀, 캐시 포함)를 재사용합니다.
+    각 서비스는 처음 접근할 때 생성됩니다(예: 지오코딩 provider는 requests를 끌어옴).
+    """
+
+    def __init__(self, **overrides: Any):
+        self._instances: dict[str, Any] = dict(overrides)
+        self._lock = threading.Lock()
+        self.estimate_cache = LRUCache(maxsize=2048, ttl_s=6 * 3600)
+        metrics.track_cache("estimate", self.estimate_cache)
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        inst = self._instances.get(name)
+        if inst is None:
+            with self._lock:
+                inst = self._instances.get(name)
+                if inst is None:
+                    inst = self._instances[name] = factory()
+        return inst
+
+    @staticmethod
+    def _new_geocoding() -> GeocodingService:
+        svc = GeocodingService()
+        metrics.track_cache("geocode", svc.cache)
+        return svc
+
+    @staticmethod
+    def _new_rooftop() -> RooftopService:
+        svc = RooftopService()
+        metrics.track_cache("polygon", svc.footprint_cache)
+        return svc
+
+    @staticmethod
+    def _new_autocomplete() -> AutocompleteService:
+        from core.data_access.address_index import META_FILE, AddressIndex, address_index_path
+        from core.data_access.building_suggest import BuildingSuggestIndex, buildings_suggest_path
+        from core.data_access.loaders import load_building_names
+
+        index_dir = address_index_path()
+        addresses = AddressIndex(index_dir) if (index_dir / META_FILE).is_file() else None
+        # etl.buildings가 만든 색인(mmap)을 쓰고, 없을 때만(샘플 테이블, 이전 ETL) name/address 두 컬럼으로 만듦
+        buildings = BuildingSuggestIndex.load(buildings_suggest_path())
+        if buildings is None:
+            return AutocompleteService.from_frame(load_building_names(), addresses)
+        return AutocompleteService(buildings, addresses)
+
+    @property
+    def geocoding(self) -> GeocodingService:
+        return self._get("geocoding", self._new_geocoding)
+
+    @property
+    def buildings(self) -> BuildingService:
+        return self._get("buildings", BuildingService)
+
+    @property
+    def rooftop(self) -> RooftopService:
+        return self._get("rooftop", self._new_rooftop)
+
+    @property
+    def autocomplete(self) -> AutocompleteService:
+        # 자동완성 색인은 프로세스당 한 번 열어 모든 세션이 공유
+        return self._get("autocomplete", self._new_autocomplete)
+
+    @property
+    def scenario(self) -> ScenarioService:
+        return self._get("scenario", ScenarioService)
+
+    @property
+    def report(self) -> ReportService:
+        return self._get("report", ReportService)
+
+    def estimate_rooftop_area(self, lat: float, lon: float) -> RooftopAreaEstimate:
+        from core.data_access.loaders import current_table_version
+
+        # 좌표 소수 6자리(~0.1m) 단위로 같은 지점이면 캐시된 추정치를 재사용
+        # (건물 테이블 버전도 키에 넣어 ETL로 테이블을 다시 만들면 새 값으로 계산)
+        key = (current_table_version(), round(float(lat), 6), round(float(lon), 6))
+
+        def compute() -> RooftopAreaEstimate:
+            candidates = self.buildings.find_candidates(lat, lon)
+            return self.rooftop.estimate_area(candidates, lat=lat, lon=lon)
+
+        return self.estimate_cache.get_or_compute(key, compute)
+
+
+@lru_cache(maxsize=1)
+def get_services() -> ServiceContainer:
+    # Streamlit 프로세스는 OKSSANGIMONG_METRICS_PORT가 있으면 여기서 로컬 /metrics 엔드포인트를 엽니다
+    metrics.serve_from_settings()
+    return ServiceContainer()
@@ -1,48 +1,105 @@
 from __future__ import annotations
 
-import requests
-
-from core.exceptions import AddressNotFoundError
+from core.exceptions import AddressNotFoundError, QuotaExceededError, UpstreamUnavailableError
 from core.models import LocationResult
 from api.adapters import GeocodingProvider
-from api.kakao_api import KakaoGeocodingProvider
-from api.vworld_api import VWorldGeocodingProvider
+from api.offline_geocoder import OfflineGeocodingProvider
 from core.config import settings
+from core.data_access.address_index import META_FILE, AddressIndex, address_index_path
+from core.utils.cache import LRUCache
+from core.utils.singleflight import SingleFlight
+from core.utils.tracing import span, traced
 
 def default_provider() -> GeocodingProvider:
-    # 우선순위: Kakao -> VWorld -> Dummy
+    # 우선순위: 로컬 도로명주소 색인 -> Kakao -> VWorld -> Dummy
+    # (provider 모듈은 requests를 끌어오므로 실제로 쓸 때 import)
+    providers: list[GeocodingProvider] = []
     if settings.kakao_rest_api_key:
-        return KakaoGeocodingProvider(api_key=settings.kakao_rest_api_key)
+        from api.kakao_api import KakaoGeocodingProvider
+
+        providers.append(KakaoGeocodingProvider(api_key=settings.kakao_rest_api_key))
     if settings.vworld_api_key:
-        return VWorldGeocodingProvider(
-            api_key=settings.vworld_api_key,
-            domain=settings.vworld_domain,
+        from api.vworld_api import VWorldGeocodingProvider
+
+        providers.append(
+            VWorldGeocodingProvider(
+                api_key=settings.vworld_api_key,
+                domain=settings.vworld_domain,
+            )
         )
-    return _DummyGeocodingProvider()
+    if not providers:
+        remote: GeocodingProvider = _DummyGeocodingProvider()
+    elif len(providers) == 1:
+        remote = providers[0]
+    else:
+        # 키가 둘 다 있으면 느린 응답은 hedge, 오류/한도 초과는 다음 provider로, 계속 실패하면 회로 차단
+        from api.hedged import HedgedGeocodingProvider
+
+        remote = HedgedGeocodingProvider(providers)
+
+    # 로컬 도로명주소 색인이 있으면 먼저 찾고, 색인에 없는 주소만 위 provider로
+    if settings.offline_geocoder and (address_index_path() / META_FILE).is_file():
+        return OfflineGeocodingProvider(AddressIndex(address_index_path()), fallback=remote)
+    return remote
 
 class GeocodingService:
-    def __init__(self, provider: GeocodingProvider | None = None):
+    def __init__(
+        self,
+        provider: GeocodingProvider | None = None,
+        cache: LRUCache | None = None,
+        flight: SingleFlight | None = None,
+    ):
         self.provider = provider or default_provider()
+        # 같은 주소 재조회 시 외부 API 호출을 줄이기 위한 프로세스 단위 캐시 (성공 결과만 저장)
+        self.cache = cache if cache is not None else LRUCache(maxsize=2048, ttl_s=24 * 3600)
+        # 캐시에 없는 같은 주소를 여러 세션이 동시에 조회하면 진행 중인 provider 호출 하나를 공유
+        self.flight = flight if flight is not None else SingleFlight(
+            "geocode",
+            shared_dir=settings.singleflight_dir,
+            dumps=lambda res: res.model_dump_json().encode("utf-8"),
+            loads=LocationResult.model_validate_json,
+        )
 
+    @traced("geocode")
     def geocode(self, address: str) -> LocationResult:
         address = (address or "").strip()
 
-        try:
-            res = self.provider.geocode(address)
-        except requests.RequestException as exc:
-            raise AddressNotFoundError(
-                "지오코딩 서비스에 연결하지 못했습니다. 잠시 후 다시 시도해주세요."
-            ) from exc
+        cached = self.cache.get(address)
+        if cached is not None:
+            return cached
 
+        # 로컬 색인 조회(OfflineGeocodingProvider.lookup)는 수 µs라서 single-flight 잠금을 거치지 않음
+        res = self.provider.lookup(address) if isinstance(self.provider, OfflineGeocodingProvider) else None
+        if res is None:
+            res = self.flight.do(address, lambda: self._lookup(address))
         if not res:
             raise AddressNotFoundError("주소를 찾을 수 없습니다. 다른 주소를 입력해보세요.")
 
+        self.cache.set(address, res)
         return res
 
+    def _lookup(self, address: str) -> LocationResult | None:
+        import requests
+
+        try:
+            with span("geocode.provider"):
+                return self.provider.geocode(address)
+        except QuotaExceededError as exc:
+            raise UpstreamUnavailableError(
+                "요청이 많아 주소 조회가 잠시 제한되었습니다. 잠시 후 다시 시도해주세요.",
+                retry_after_s=exc.retry_after_s,
+            ) from exc
+        except requests.RequestException as exc:
+            raise UpstreamUnavailableError(
+                "지오코딩 서비스에 연결하지 못했습니다. 잠시 후 다시 시도해주세요."
+            ) from exc
+
 
 class _DummyGeocodingProvider:
     """No external API. Returns a fixed point near Seoul City Hall."""
 
+    name = "dummy"
+
     def geocode(self, address: str) -> LocationResult | None:
         address = (address or "").strip()
         if not address:
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-import pandas as pd
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.cidfonts import UnicodeCIDFont
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable
 
 from core.models import SimulationResult
+from core.utils import metrics
+from core.utils.tracing import traced
+
+if TYPE_CHECKING:
+    from PIL import ImageFont
+
+# NOTE: reportlab / pandas(openpyxl) / Pillow는 import 비용이 커서(특히 pandas),
+# 실제로 리포트를 만들 때 함수 안에서 import 합니다. 리포트를 안 쓰는 페이지의 콜드스타트를 줄이기 위함.
 
 
 # =============================================================================
@@ -103,6 +108,9 @@ def _candidate_font_dirs() -> list[Path]:
 
 def _try_register_ttf(font_name: str, font_path: Path) -> str | None:
     """TTF/OTF/TTC 폰트를 등록 시도. 성공하면 등록된 폰트 이름 반환."""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
     if not (font_path.exists() and font_path.is_file()):
         return None
 
@@ -132,6 +140,9 @@ def _ensure_korean_font() -> str:
       3) ReportLab 내장 CID 한글 폰트(뷰어/환경 의존 가능)
       4) Helvetica (최후)
     """
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
     # 1) 명시 경로 우선
     env_path = os.getenv(ENV_KOREAN_FONT_PATH)
     if env_path:
@@ -179,6 +190,47 @@ def _ensure_korean_font() -> str:
     return "Helvetica"
 
 
+@lru_cache(maxsize=1)
+def _find_korean_font_file() -> Path | None:
+    """이미지 렌더링(Pillow)용 한글 폰트 파일 경로를 찾습니다. (PDF 폰트 탐색과 동일한 후보 사용)"""
+    env_path = os.getenv(ENV_KOREAN_FONT_PATH)
+    if env_path:
+        p = Path(env_path).expanduser()
+        if p.is_file():
+            return p
+
+    font_dirs = _candidate_font_dirs()
+    for _, filenames in KOREAN_TTF_CANDIDATES:
+        for d in font_dirs:
+            for fn in filenames:
+                if (d / fn).is_file():
+                    return d / fn
+            try:
+                for sub in d.iterdir():
+                    if sub.is_dir():
+                        for fn in filenames:
+                            if (sub / fn).is_file():
+                                return sub / fn
+            except Exception:
+                continue
+    return None
+
+
+@lru_cache(maxsize=32)
+def _pil_font(size: int) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+    """크기별 Pillow 폰트. 폰트 파일 탐색/로딩은 프로세스당 한 번만 수행됩니다."""
+    from PIL import ImageFont
+
+    font_file = _find_korean_font_file()
+    if font_file is not None:
+        try:
+            return ImageFont.truetype(str(font_file), size)
+        except Exception:
+            pass
+    # 한글 폰트가 없으면 기본 폰트(한글은 깨질 수 있음)
+    return ImageFont.load_default(size=size)
+
+
 # =============================================================================
 # Domain labels
 # =============================================================================
@@ -208,6 +260,112 @@ def _as_number(value: Any) -> Any:
         return value
 
 
+# =============================================================================
+# Summary card image
+# =============================================================================
+# 공유용 요약 카드 기본 크기(OG 이미지 비율). 썸네일은 같은 레이아웃을 축소 렌더링합니다.
+IMAGE_CARD_SIZE = (1200, 630)
+THUMBNAIL_WIDTH = 360
+
+_CARD_BG = (244, 246, 249)
+_CARD_HEADER = (11, 59, 91)
+_CARD_TILE = (255, 255, 255)
+_CARD_BORDER = (226, 232, 240)
+_CARD_TEXT = (26, 32, 44)
+_CARD_MUTED = (113, 128, 150)
+_CARD_ACCENT = (47, 133, 90)
+
+
+def result_hash(result: SimulationResult) -> str:
+    """SimulationResult 내용 기반 해시. 이미지 캐시 키/파일명에 사용합니다."""
+    return hashlib.sha1(result.model_dump_json().encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _render_summary_png(result_json: str, width: int) -> bytes:
+    """요약 카드를 PNG로 렌더링합니다. (결과 JSON + 폭 단위로 캐시)
+
+    헤드리스 브라우저 없이 Pillow로 직접 그리므로 1장에 수십 ms 이내로 끝납니다.
+    """
+    from PIL import Image, ImageDraw
+
+    result = SimulationResult.model_validate_json(result_json)
+    base_w, base_h = IMAGE_CARD_SIZE
+    k = width / base_w
+    height = max(1, int(round(base_h * k)))
+
+    def px(v: float) -> int:
+        return int(round(v * k))
+
+    img = Image.new("RGB", (width, height), _CARD_BG)
+    draw = ImageDraw.Draw(img)
+
+    # Header
+    draw.rectangle((0, 0, width, px(120)), fill=_CARD_HEADER)
+    draw.text((px(60), px(34)), "옥상이몽 시뮬레이션 결과", font=_pil_font(px(40)), fill=(255, 255, 255))
+    draw.text(
+        (px(60), px(150)),
+        f"{_greening_label(result.greening_type)} · 녹화 비율 {result.coverage_ratio:.0%} · "
+        f"옥상 면적 {result.roof_area_m2:,.0f}㎡",
+        font=_pil_font(px(28)),
+        fill=_CARD_TEXT,
+    )
+
+    tiles = (
+        ("녹화 면적", f"{result.green_area_m2:,.0f}", "㎡"),
+        ("CO₂ 흡수", f"{result.co2_absorption_kg_per_year:,.1f}", "kg/년"),
+        ("온도 저감", f"-{abs(result.temp_reduction_c):,.1f}", "℃"),
+        ("소나무 환산", f"{int(result.tree_equivalent_count):,}", "그루"),
+    )
+    tile_w, tile_h, gap, top = 255, 250, 20, 230
+    label_font, value_font, unit_font = _pil_font(px(24)), _pil_font(px(56)), _pil_font(px(24))
+    for i, (label, value, unit) in enumerate(tiles):
+        x0 = 60 + i * (tile_w + gap)
+        draw.rounded_rectangle(
+            (px(x0), px(top), px(x0 + tile_w), px(top + tile_h)),
+            radius=px(20),
+            fill=_CARD_TILE,
+            outline=_CARD_BORDER,
+            width=max(1, px(2)),
+        )
+        draw.text((px(x0 + 24), px(top + 28)), label, font=label_font, fill=_CARD_MUTED)
+        draw.text((px(x0 + 24), px(top + 90)), value, font=value_font, fill=_CARD_ACCENT)
+        draw.text((px(x0 + 24), px(top + 180)), unit, font=unit_font, fill=_CARD_MUTED)
+
+    draw.text(
+        (px(60), px(540)),
+        f"표면온도 {result.baseline_surface_temp_c:.1f}℃ → {result.after_surface_temp_c:.1f}℃ · "
+        f"Engine {result.engine_version} / Coeff {result.coefficient_set_version}",
+        font=_pil_font(px(22)),
+        fill=_CARD_MUTED,
+    )
+
+    buf = io.BytesIO()
+    # 단색 위주의 카드라 압축률이 높고, 낮은 압축 레벨로도 용량이 충분히 작습니다.
+    img.save(buf, format="PNG", compress_level=3)
+    return buf.getvalue()
+
+
+metrics.track_cache("report_image", _render_summary_png)
+
+
+def _metered(kind: str) -> Callable:
+    """build_* 결과(bytes, filename)의 생성 시간/크기를 metrics에 기록."""
+
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> tuple[bytes, str]:
+            start = perf_counter()
+            data, filename = fn(*args, **kwargs)
+            metrics.REPORT_BUILD_SECONDS.observe(kind, value=perf_counter() - start)
+            metrics.REPORT_BYTES.observe(kind, value=len(data))
+            return data, filename
+
+        return wrapper
+
+    return decorate
+
+
 # =============================================================================
 # Service
 # =============================================================================
@@ -218,7 +376,12 @@ class ReportService:
     추후 템플릿/디자인은 UI팀 스타일에 맞춰 개선 가능.
     """
 
+    @traced("report.pdf")
+    @_metered("pdf")
     def build_pdf(self, result: SimulationResult) -> tuple[bytes, str]:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.pdfgen import canvas
+
         buf = io.BytesIO()
         c = canvas.Canvas(buf, pagesize=A4)
         w, h = A4  # noqa: F841  # (w는 향후 레이아웃 확장 때 사용 가능)
@@ -284,7 +447,11 @@ class ReportService:
         filename = "okssangimong_report.pdf"
         return pdf_bytes, filename
 
+    @traced("report.excel")
+    @_metered("excel")
     def build_excel(self, result: SimulationResult) -> tuple[bytes, str]:
+        import pandas as pd
+
         buf = io.BytesIO()
         generated_at = _utc_now_iso()
 
@@ -370,3 +537,24 @@ class ReportService:
             style_sheet("메타데이터")
 
         return buf.getvalue(), "okssangimong_result.xlsx"
+
+    @traced("report.image")
+    @_metered("image")
+    def build_image(self, result: SimulationResult, *, width: int = IMAGE_CARD_SIZE[0]) -> tuple[bytes, str]:
+        """공유용 요약 카드 PNG. 같은 결과는 캐시된 바이트를 그대로 반환합니다."""
+        png = _render_summary_png(result.model_dump_json(), int(width))
+        filename = f"okssangimong_result_{result_hash(result)[:8]}.png"
+        return png, filename
+
+    def build_thumbnails(
+        self,
+        results: list[SimulationResult],
+        *,
+        width: int = THUMBNAIL_WIDTH,
+        max_workers: int | None = None,
+    ) -> list[tuple[bytes, str]]:
+        """포트폴리오(여러 건물) 결과의 썸네일을 병렬로 생성합니다. 입력 순서를 유지합니다."""
+        if not results:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda r: self.build_image(r, width=width), results))
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from core.models import RooftopAreaEstimate
-from core.data_access.repositories import get_roof_area_from_candidate
+from core.models import BuildingCandidate, RooftopAreaEstimate
+from core.data_access.repositories import (
+    get_footprint_area_from_candidate,
+    get_precomputed_floor_area_from_candidate,
+    get_roof_area_from_candidate,
+)
 from core.config import settings
-from core.utils.geometry import polygon_area_m2
-from api.vworld_wfs import get_building_polygon
 from core.utils.availability import compute_availability_ratio
+from core.utils.cache import LRUCache
+from core.utils.tracing import span, traced
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
@@ -66,6 +70,16 @@ def _get_beta() -> float:
     return _clamp(beta, 0.0, 1.0)
 
 
+def roof_coefficients() -> tuple[float, float]:
+    """현재 설정의 (α, β)."""
+    return _get_alpha(), _get_beta()
+
+
+def roof_table_version(alpha: float, beta: float) -> str:
+    """사전계산 면적 테이블(etl.roof_areas)의 버전 문자열. α/β가 바뀌면 버전도 바뀝니다."""
+    return f"alpha={alpha:g};beta={beta:g}"
+
+
 def estimate_roof_area_m2_from_floor(floor_area_m2: float, *, alpha: float) -> float:
     """A_roof = α × A_floor"""
     return max(0.0, float(alpha) * float(floor_area_m2))
@@ -83,6 +97,57 @@ def estimate_greenable_roof_area_m2_from_floor(floor_area_m2: float, *, alpha: f
 
 
 class RooftopService:
+    def __init__(self, footprint_cache: LRUCache | None = None):
+        # 좌표별 WFS 건물 폴리곤 캐시. Footprint 객체 대신 polycodec 인코딩(bytes)을 저장해
+        # 항목당 수백 바이트로 유지합니다 (찾지 못한 경우는 저장하지 않음)
+        self.footprint_cache = footprint_cache if footprint_cache is not None else LRUCache(maxsize=4096, ttl_s=24 * 3600)
+        # 폴리곤을 못 찾았거나 WFS 오류였던 좌표는 잠깐 기억해서, 같은 화면을 다시 그릴 때마다
+        # WFS 재시도(백오프 포함 수 초)를 반복하지 않도록 함
+        self.footprint_misses = LRUCache(maxsize=4096, ttl_s=120)
+
+    @staticmethod
+    def _footprint_key(lat: float, lon: float) -> tuple[float, float]:
+        return (round(float(lat), 6), round(float(lon), 6))
+
+    def cached_footprint_bytes(self, lat: float, lon: float) -> bytes | None:
+        """이미 조회해 둔 폴리곤 인코딩만 돌려줍니다 (외부 호출 없음)."""
+        return self.footprint_cache.get(self._footprint_key(lat, lon))
+
+    def footprint_bytes(self, lat: float, lon: float) -> bytes | None:
+        """좌표의 건물 폴리곤 인코딩 (Footprint.to_bytes). 캐시에 없으면 VWorld WFS를 조회합니다."""
+        if not settings.vworld_api_key:
+            return None
+        key = self._footprint_key(lat, lon)
+        cached = self.footprint_cache.get(key)
+        if cached is not None:
+            return cached
+        if self.footprint_misses.get(key) is not None:
+            return None
+
+        from api.vworld_wfs import get_building_footprint
+
+        try:
+            with span("rooftop.wfs_footprint"):
+                footprint = get_building_footprint((lat, lon), api_key=settings.vworld_api_key)
+        except Exception:
+            footprint = None
+        if footprint is None:
+            self.footprint_misses.set(key, True)
+            return None
+        encoded = footprint.to_bytes()
+        self.footprint_cache.set(key, encoded)
+        return encoded
+
+    def get_footprint(self, lat: float, lon: float):
+        """좌표의 건물 폴리곤 (core.footprint.Footprint) 또는 None."""
+        encoded = self.footprint_bytes(lat, lon)
+        if encoded is None:
+            return None
+        from core.footprint import Footprint
+
+        return Footprint.from_bytes(encoded)
+
+    @traced("rooftop.estimate_area")
     def estimate_area(self, candidates, lat: float | None = None, lon: float | None = None) -> RooftopAreaEstimate:
         """
         옥상 녹화/활용 가능면적(Available/Greenable Roof Area) 추정.
@@ -90,6 +155,7 @@ class RooftopService:
         우선순위:
         1) candidates에서 roof_area_m2(물리 옥상면적)를 찾으면:
            A_greenable = β × A_roof
+           (etl.roof_areas가 footprint 면적·대장 건축면적으로 사전계산한 값이면 바닥면적도 테이블 값을 쓰고 WFS는 호출하지 않음)
         2) 없으면 VWorld 폴리곤으로 바닥면적(A_floor) 추정 후:
            A_greenable = α × β × A_floor
         3) 둘 다 없으면 suggested=None (사용자 입력 유도)
@@ -107,33 +173,63 @@ class RooftopService:
         confidence = "low"
         note = "면적 데이터가 없으면 사용자가 직접 입력하도록 유도합니다."
 
+        # 사전계산 테이블의 footprint 면적 (있으면 WFS 폴리곤 조회 생략)
+        table_floor_area: float | None = None
+
+        # 좌표를 footprint로 포함하는 건물이 있으면 그 건물 값만 사용 (옆 건물 면적을 쓰지 않도록)
+        pool = [c for c in candidates or [] if c.extra.get("contains_point")] or candidates or []
+
         # 1) 후보 데이터(테이블) 기반: roof_area_m2를 '물리 옥상면적'으로 보고 β 적용
-        for c in candidates or []:
+        for c in pool:
             v = get_roof_area_from_candidate(c)
+            # 사전계산 바닥면적: roof_area_source가 가리키는 footprint 면적 또는 대장 건축면적
+            precomputed_floor = get_precomputed_floor_area_from_candidate(c)
+            precomputed = bool(precomputed_floor)
+            if precomputed and c.extra.get("roof_version") != roof_table_version(alpha, beta):
+                # α/β를 바꾼 뒤 아직 etl.roof_areas를 다시 돌리지 않은 테이블 → 같은 바닥면적으로 다시 계산
+                v = estimate_roof_area_m2_from_floor(precomputed_floor, alpha=alpha)
             if v and v > 0:
                 roof_area_m2_raw = float(v)
                 suggested = estimate_greenable_roof_area_m2_from_roof(roof_area_m2_raw, beta=beta)
                 if alpha > 0:
                     floor_area_from_roof = roof_area_m2_raw / alpha
+                table_floor_area = get_footprint_area_from_candidate(c) or precomputed_floor
 
-                confidence = "medium"
-                note = (
-                    "데이터 테이블의 roof_area_m2(물리 옥상면적) 값을 기반으로 추정했습니다. "
-                    f"녹화/활용 가능면적은 A_greenable=β×A_roof 로 변환 적용했습니다 (β={beta}). "
-                    "정확도를 위해 확인이 필요합니다."
-                )
+                if precomputed:
+                    confidence = "low"
+                    floor_label = (
+                        "footprint 바닥면적" if c.extra.get("roof_area_source") == "footprint" else "건축물대장 건축면적"
+                    )
+                    note = (
+                        f"건물 테이블의 {floor_label}(A_floor)으로 사전계산한 값을 사용했습니다. "
+                        f"옥상 녹화/활용 가능면적은 A_greenable=α×β×A_floor 입니다 (α={alpha}, β={beta}). "
+                        "참고용으로 확인이 필요합니다."
+                    )
+                else:
+                    confidence = "medium"
+                    note = (
+                        "데이터 테이블의 roof_area_m2(물리 옥상면적) 값을 기반으로 추정했습니다. "
+                        f"녹화/활용 가능면적은 A_greenable=β×A_roof 로 변환 적용했습니다 (β={beta}). "
+                        "정확도를 위해 확인이 필요합니다."
+                    )
                 break
 
         # 2) VWorld WFS 폴리곤 기반 바닥면적 추정 (가능한 경우)
-        polygon = None
-        if lat is not None and lon is not None and settings.vworld_api_key:
-            try:
-                polygon = get_building_polygon((lat, lon), api_key=settings.vworld_api_key)
-            except Exception:
-                polygon = None
-
-            if polygon:
-                area = polygon_area_m2(polygon)
+        if lat is not None and lon is not None and table_floor_area is None:
+            footprint = self.get_footprint(lat, lon)
+            if footprint is not None:
+                # 중정(구멍)이 있는 건물은 구멍 면적을 뺀 값
+                with span("rooftop.polygon_area"):
+                    area = footprint.area_m2(precise=settings.precise_area, crs=settings.area_crs)
+                if not candidates and footprint.building_id:
+                    # 후보 테이블이 없으면 WFS 속성(용도/층수/높이 등)을 후보로 남겨 다시 조회하지 않도록
+                    candidates = [
+                        BuildingCandidate(
+                            building_id=footprint.building_id,
+                            name=footprint.name,
+                            extra={"source": "vworld_wfs", **footprint.attributes()},
+                        )
+                    ]
                 if area and area > 0:
                     floor_area_m2 = float(area)
 
@@ -155,7 +251,9 @@ class RooftopService:
                         # (원하면 implied alpha 같은 것도 note에 추가 가능)
                         note = note + " 또한 VWorld 폴리곤(WFS)으로 바닥면적(A_floor)도 함께 추정했습니다."
 
-        if floor_area_m2 is None and floor_area_from_roof is not None:
+        if floor_area_m2 is None and table_floor_area is not None:
+            floor_area_m2 = table_floor_area
+        elif floor_area_m2 is None and floor_area_from_roof is not None:
             floor_area_m2 = floor_area_from_roof
             note = note + " VWorld가 없을 때는 roof_area_m2와 α를 사용해 바닥면적과 가용비율을 추정했습니다."
 
@@ -8,8 +8,11 @@ from core.constants import (
 from core.models import ScenarioInput, SimulationResult
 from core.config import settings
 from core.exceptions import InvalidScenarioError
+from core.utils.tracing import traced
 
 class ScenarioService:
+    # 계산 자체가 수 µs라 페이지/API 요청 Trace 안에서 불릴 때만 span 기록
+    @traced("scenario.compute", only_in_trace=True)
     def compute(
         self,
         roof_area_m2: float,
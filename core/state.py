@@ -1,29 +1,174 @@
-"""Streamlit session state helpers.
+"""Session state helpers.
 
 UI가 바뀌어도 상태 키를 한 곳에서 관리하면 유지보수가 쉬워집니다.
+
+상태 저장소는 StateBackend로 추상화되어 있어서
+- Streamlit 페이지: StreamlitStateBackend (st.session_state, 기본값)
+- 배치/워커/테스트: InMemoryStateBackend
+- 여러 프로세스가 공유하는 로컬 저장소: SqliteStateBackend
+를 같은 AnalyzeService로 구동할 수 있습니다. streamlit은 Streamlit 백엔드를 쓸 때만 import 합니다.
 """
 
 from __future__ import annotations
-import streamlit as st
+
+import base64
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Protocol
 
 DEFAULTS = {
     "location": None,
     "roof_area_m2_confirmed": None,
     "scenario": None,
     "result": None,
+    # 선택한 건물 폴리곤 (core.footprint.Footprint.to_bytes 인코딩)
+    "footprint": None,
+    # 리포트 페이지 요약 이미지 미리보기/다운로드 표시 여부 (버튼을 눌러 다시 실행돼도 유지)
+    "share_image_open": False,
 }
 
-def ensure_session() -> None:
+
+class StateBackend(Protocol):
+    def get(self, key: str, default: Any = None) -> Any:
+        ...
+
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    def contains(self, key: str) -> bool:
+        ...
+
+
+class InMemoryStateBackend:
+    """프로세스 메모리 dict 기반. 테스트/배치 작업용."""
+
+    def __init__(self, initial: dict[str, Any] | None = None):
+        self._data: dict[str, Any] = dict(initial or {})
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+
+class StreamlitStateBackend:
+    """st.session_state 기반 (Streamlit 페이지 기본값)."""
+
+    @property
+    def _session_state(self):
+        import streamlit as st
+
+        return st.session_state
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._session_state.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._session_state[key] = value
+
+    def contains(self, key: str) -> bool:
+        return key in self._session_state
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"__bytes__": base64.b64encode(bytes(value)).decode("ascii")}
+    raise TypeError(f"State value is not serializable: {type(value).__name__}")
+
+
+def _json_object_hook(obj: dict) -> Any:
+    if len(obj) == 1 and "__bytes__" in obj:
+        return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+class SqliteStateBackend:
+    """SQLite 파일 기반 key-value 저장소 (Redis 대용의 로컬 구현).
+
+    session_id 별로 상태를 나눠 저장하며, 여러 프로세스(API 워커, 배치)가 같은 파일을 공유할 수 있습니다.
+    값은 JSON으로 저장합니다 (중첩된 bytes는 base64로 감싸서 저장).
+    값 자체가 bytes이면 (폴리곤 인코딩, 리포트 등) 변환 없이 BLOB으로 저장합니다.
+    """
+
+    def __init__(self, path: str | Path, session_id: str = "default"):
+        self.path = Path(path)
+        self.session_id = session_id
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                " session_id TEXT NOT NULL, key TEXT NOT NULL, value NOT NULL,"
+                " PRIMARY KEY (session_id, key))"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 커넥션은 스레드 간 공유하지 않고 스레드마다 하나씩 재사용
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._conn().execute(
+            "SELECT value FROM state WHERE session_id = ? AND key = ?", (self.session_id, key)
+        ).fetchone()
+        if row is None:
+            return default
+        if isinstance(row[0], bytes):
+            return row[0]
+        return json.loads(row[0], object_hook=_json_object_hook)
+
+    def set(self, key: str, value: Any) -> None:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            payload: str | bytes = bytes(value)
+        else:
+            payload = json.dumps(value, ensure_ascii=False, default=_json_default)
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO state (session_id, key, value) VALUES (?, ?, ?)",
+                (self.session_id, key, payload),
+            )
+
+    def contains(self, key: str) -> bool:
+        row = self._conn().execute(
+            "SELECT 1 FROM state WHERE session_id = ? AND key = ?", (self.session_id, key)
+        ).fetchone()
+        return row is not None
+
+
+_DEFAULT_BACKEND = StreamlitStateBackend()
+
+
+def ensure_session(backend: StateBackend | None = None) -> None:
+    backend = backend or _DEFAULT_BACKEND
     for k, v in DEFAULTS.items():
-        if k not in st.session_state:
-            st.session_state[k] = v
+        if not backend.contains(k):
+            backend.set(k, v)
+
+
+def get_state(backend: StateBackend | None = None) -> dict:
+    backend = backend or _DEFAULT_BACKEND
+    return {k: backend.get(k) for k in DEFAULTS.keys()}
+
 
-def get_state() -> dict:
-    return {k: st.session_state.get(k) for k in DEFAULTS.keys()}
+def set_state(key: str, value, backend: StateBackend | None = None):
+    (backend or _DEFAULT_BACKEND).set(key, value)
 
-def set_state(key: str, value):
-    st.session_state[key] = value
 
-def clear_state():
+def clear_state(backend: StateBackend | None = None):
+    backend = backend or _DEFAULT_BACKEND
     for k in DEFAULTS.keys():
-        st.session_state[k] = DEFAULTS[k]
+        backend.set(k, DEFAULTS[k])
@@ -0,0 +1,112 @@
+"""Road-name address (도로명주소) parsing / normalization for local lookups.
+
+    parsed = parse_road_address("서울시 중구 세종대로 110 (태평로1가)")
+    parsed.key()       # "서울|중구|세종대로|110|0|0"
+    parsed.road_key()  # "세종대로|110|0|0"
+
+입력 주소에서 시도/시군구, 도로명, 건물번호(본번-부번, 지하 여부)만 뽑아 비교용 키를 만듭니다.
+- 시도는 약칭으로 통일 (서울특별시/서울시/서울 → 서울, 전라북도/전북특별자치도 → 전북 등)
+- 시군구는 공백 없이 이어 붙임 (수원시 장안구 → 수원시장안구), 읍/면/동/리 토큰과 괄호 참고항목은 버림
+- 도로명 뒤에 붙여 쓴 번호도 인식 (세종대로110, 강남대로94길20)
+- 건물번호 뒤의 동/층/호 같은 상세주소는 버림
+
+etl.addresses(색인 생성)와 api.offline_geocoder(조회)가 같은 규칙을 써야 키가 맞습니다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+# 시도 약칭 → 표기 (첫 번째가 정식 명칭)
+SIDO_ALIASES: dict[str, tuple[str, ...]] = {
+    "서울": ("서울특별시", "서울시", "서울"),
+    "부산": ("부산광역시", "부산시", "부산"),
+    "대구": ("대구광역시", "대구시", "대구"),
+    "인천": ("인천광역시", "인천시", "인천"),
+    "광주": ("광주광역시", "광주"),  # "광주시"는 경기도 광주시와 겹쳐서 약칭에서 뺌
+    "대전": ("대전광역시", "대전시", "대전"),
+    "울산": ("울산광역시", "울산시", "울산"),
+    "세종": ("세종특별자치시", "세종시", "세종"),
+    "경기": ("경기도", "경기"),
+    "강원": ("강원특별자치도", "강원도", "강원"),
+    "충북": ("충청북도", "충북"),
+    "충남": ("충청남도", "충남"),
+    "전북": ("전북특별자치도", "전라북도", "전북"),
+    "전남": ("전라남도", "전남"),
+    "경북": ("경상북도", "경북"),
+    "경남": ("경상남도", "경남"),
+    "제주": ("제주특별자치도", "제주도", "제주"),
+}
+_SIDO = {alias: short for short, aliases in SIDO_ALIASES.items() for alias in aliases}
+
+_PAREN = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_SEPARATORS = re.compile(r"[,\s]+")
+# 도로명(…로/…길) + 붙여 쓴 건물번호(선택). 최소 일치라서 "강남대로94길"은 번호 없이 도로명 하나로 읽힘
+_ROAD = re.compile(r"(?P<road>.+?(?:로|길))(?P<number>\d+(?:-\d+)?)?")
+_NUMBER = re.compile(r"(?P<main>\d+)(?:-(?P<sub>\d+))?(?:번지?)?")
+
+
+class ParsedAddress(NamedTuple):
+    sido: str  # 약칭, 없으면 ""
+    sigungu: str  # 공백 없이, 없으면 ""
+    road: str
+    main: int
+    sub: int = 0
+    underground: bool = False
+
+    def key(self) -> str:
+        """시도|시군구|도로명|본번|부번|지하 (시군구 안에서 도로명은 유일)."""
+        return f"{self.sido}|{self.sigungu}|{self.road_key()}"
+
+    def road_key(self) -> str:
+        """지역을 뺀 도로명|본번|부번|지하 (지역을 생략한 입력 조회용)."""
+        return f"{self.road}|{self.main}|{self.sub}|{int(self.underground)}"
+
+
+def sido_short(name: str) -> str:
+    """시도 명칭 → 약칭 (모르는 이름이면 공백만 지운 그대로)."""
+    name = name.replace(" ", "")
+    return _SIDO.get(name, name)
+
+
+def sido_full(short: str) -> str:
+    aliases = SIDO_ALIASES.get(short)
+    return aliases[0] if aliases else short
+
+
+def parse_road_address(text: str) -> ParsedAddress | None:
+    """도로명주소 문자열 → ParsedAddress. 도로명 + 건물번호를 못 찾으면 None (지번 주소 등)."""
+    tokens = [t for t in _SEPARATORS.split(_PAREN.sub(" ", text or "")) if t]
+    # 건물번호가 뒤따르는 마지막 도로명 토큰을 찾음 (앞쪽 "종로구" 같은 지역명과 구분)
+    for i in range(len(tokens) - 1, -1, -1):
+        m = _ROAD.fullmatch(tokens[i])
+        if m is None:
+            continue
+        rest = tokens[i + 1 :]
+        underground = False
+        number = m.group("number")
+        if number is None:
+            if rest and rest[0] == "지하":
+                underground, rest = True, rest[1:]
+            n = _NUMBER.fullmatch(rest[0]) if rest else None
+            if n is None:
+                continue
+            main, sub = n.group("main"), n.group("sub")
+        else:
+            main, _, sub = number.partition("-")
+        sido, sigungu = _region(tokens[:i])
+        return ParsedAddress(sido, sigungu, m.group("road"), int(main), int(sub or 0), underground)
+    return None
+
+
+def _region(tokens: list[str]) -> tuple[str, str]:
+    sido = ""
+    parts: list[str] = []
+    for j, token in enumerate(tokens):
+        if j == 0 and token in _SIDO:
+            sido = _SIDO[token]
+        elif token.endswith(("시", "군", "구")):
+            parts.append(token)
+        # 읍/면/동/리 등은 도로명주소 키에 쓰지 않음
+    return sido, "".join(parts)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable, Tuple
+import threading
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # NOTE:
 # - 공간데이터(폴리곤)가 들어오면 shapely/pyproj로 확장하세요.
@@ -17,42 +22,50 @@ def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     return R * c
 
-def _looks_like_korea_lonlat(points: list[Tuple[float, float]]) -> bool:
-    if not points:
-        return False
-    valid = 0
-    for lon, lat in points:
-        if 33.0 <= lat <= 39.5 and 124.0 <= lon <= 132.5:
-            valid += 1
-    return valid / len(points) >= 0.6
-
 
-def _looks_like_korea_latlon(points: list[Tuple[float, float]]) -> bool:
-    if not points:
-        return False
-    valid = 0
-    for lat, lon in points:
-        if 33.0 <= lat <= 39.5 and 124.0 <= lon <= 132.5:
-            valid += 1
-    return valid / len(points) >= 0.6
+def haversine_m_many(lat: float, lon: float, lats: "np.ndarray", lons: "np.ndarray") -> "np.ndarray":
+    """한 점에서 여러 점까지의 haversine 거리 (m, 배열). NaN 좌표는 NaN."""
+    import numpy as np
 
+    R = 6371000.0
+    phi1 = math.radians(lat)
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lons, dtype=np.float64) - lon)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * R * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
 def _normalize_polygon_lonlat(points: list[Tuple[float, float]]) -> list[Tuple[float, float]]:
-    if _looks_like_korea_lonlat(points):
+    # 한 번 순회로 (lon,lat)/(lat,lon) 두 해석을 동시에 센다
+    lonlat = latlon = 0
+    for a, b in points:
+        if 33.0 <= b <= 39.5 and 124.0 <= a <= 132.5:
+            lonlat += 1
+        elif 33.0 <= a <= 39.5 and 124.0 <= b <= 132.5:
+            latlon += 1
+    if not points or lonlat / len(points) >= 0.6:
         return points
-    if _looks_like_korea_latlon(points):
+    if latlon / len(points) >= 0.6:
         return [(lon, lat) for lat, lon in points]
     return points
 
-def polygon_area_m2(coords_lonlat: Iterable[Tuple[float, float]]) -> float:
+def polygon_area_m2(
+    coords_lonlat: Iterable[Tuple[float, float]],
+    *,
+    precise: bool = False,
+    crs: str | None = None,
+) -> float:
     """Approximate polygon area in square meters from lon/lat coordinates.
 
     coords_lonlat: [(lon, lat), ...] closed or open polygon.
-    NOTE: This uses a simple local projection; replace with shapely/pyproj for accuracy.
+    NOTE: 기본값은 단일 위도 기준 국지 근사입니다.
+    precise=True면 pyproj로 Korea 2000 TM(EPSG:5185~5188, crs 지정 시 해당 CRS)에 투영해 계산합니다 (polygon_areas_m2 참고).
     """ 
     pts = list(coords_lonlat)
     if len(pts) < 3:
         return 0.0
+    if precise:
+        return float(polygon_areas_m2(*pack_polygons([pts]), precise=True, crs=crs)[0])
     
     pts = _normalize_polygon_lonlat(pts)
     
@@ -62,7 +75,9 @@ def polygon_area_m2(coords_lonlat: Iterable[Tuple[float, float]]) -> float:
     )
     meters_per_deg_lon = 111412.84 * math.cos(math.radians(lat0)) - 93.5 * math.cos(3 * math.radians(lat0))
 
-    projected = [(lon * meters_per_deg_lon, lat * meters_per_deg_lat) for lon, lat in pts]
+    # 첫 꼭짓점 기준 상대좌표로 투영 (절대좌표 곱의 상쇄 오차 방지)
+    lon_ref, lat_ref = pts[0]
+    projected = [((lon - lon_ref) * meters_per_deg_lon, (lat - lat_ref) * meters_per_deg_lat) for lon, lat in pts]
     
     area = 0.0
     for i in range(len(projected)):
@@ -71,3 +86,274 @@ def polygon_area_m2(coords_lonlat: Iterable[Tuple[float, float]]) -> float:
         area += x1 * y2 - x2 * y1
         
     return abs(area) / 2.0
+
+
+# ---------------------------------------------------------------------------
+# Batch (NumPy) area kernel
+#
+# 여러 폴리곤을 ragged array(평탄화된 좌표 버퍼 + offsets)로 받아 한 번에 계산합니다.
+#   coords          : (N, 2) float64, [lon, lat] 순서의 모든 꼭짓점
+#   ring_offsets    : (R + 1,) int, ring r의 꼭짓점 = coords[ring_offsets[r]:ring_offsets[r + 1]]
+#   polygon_offsets : (P + 1,) int, 폴리곤 p의 ring = ring_offsets 인덱스 [polygon_offsets[p], polygon_offsets[p + 1])
+#                     각 폴리곤의 첫 ring은 외곽선, 나머지는 구멍(hole)
+# (GeoArrow/Shapely의 ragged 표현과 같은 구조라 대량 WFS 다운로드 결과를 그대로 넘길 수 있습니다.)
+# numpy는 이 함수들을 처음 쓸 때 import 합니다.
+# ---------------------------------------------------------------------------
+
+Ring = Sequence[Tuple[float, float]]
+
+
+def pack_polygons(polygons: Iterable[Ring | Sequence[Ring]]) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """폴리곤 목록 → (coords, ring_offsets, polygon_offsets).
+
+    각 폴리곤은 ring 하나([(lon, lat), ...]) 또는 ring 목록([외곽선, 구멍, ...])이어도 됩니다.
+    """
+    import numpy as np
+
+    flat: list[Tuple[float, float]] = []
+    ring_offsets = [0]
+    polygon_offsets = [0]
+    for poly in polygons:
+        rings = [poly] if poly and isinstance(poly[0][0], (int, float)) else poly
+        for ring in rings:
+            flat.extend(ring)
+            ring_offsets.append(len(flat))
+        polygon_offsets.append(len(ring_offsets) - 1)
+
+    # list[tuple] → ndarray는 np.asarray보다 평탄화 이터레이터 + fromiter가 2배 이상 빠름
+    coords = np.fromiter(chain.from_iterable(flat), dtype=np.float64, count=2 * len(flat)).reshape(-1, 2)
+    return coords, np.asarray(ring_offsets, dtype=np.int64), np.asarray(polygon_offsets, dtype=np.int64)
+
+
+def geojson_polygons(geometry: dict | None) -> list:
+    """GeoJSON Polygon/MultiPolygon → 폴리곤(ring 목록) 리스트. 빈 폴리곤과 다른 geometry 타입은 제외."""
+    geometry = geometry or {}
+    coords = geometry.get("coordinates") or []
+    geom_type = geometry.get("type")
+    if geom_type == "Polygon":
+        return [coords] if coords else []
+    if geom_type == "MultiPolygon":
+        return [poly for poly in coords if poly]
+    return []
+
+
+def pack_geojson(geometries: Iterable[dict]) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """GeoJSON Polygon/MultiPolygon geometry 목록 → (coords, ring_offsets, polygon_offsets).
+
+    좌표를 튜플 리스트로 바꾸지 않고 원본 중첩 리스트에서 바로 평탄화합니다 (WFS 응답 수백 건용).
+    구멍(내부 ring)도 그대로 유지하며, 3차원 좌표는 x, y만 사용합니다.
+    """
+    import numpy as np
+
+    rings: list = []
+    ring_offsets = [0]
+    polygon_offsets = [0]
+    n = 0
+    for geometry in geometries:
+        for poly in geojson_polygons(geometry):
+            for ring in poly:
+                if ring and len(ring[0]) != 2:
+                    ring = [pt[:2] for pt in ring]
+                rings.append(ring)
+                n += len(ring)
+                ring_offsets.append(n)
+            polygon_offsets.append(len(ring_offsets) - 1)
+
+    flat = chain.from_iterable(chain.from_iterable(rings))
+    coords = np.fromiter(flat, dtype=np.float64, count=2 * n).reshape(-1, 2)
+    return coords, np.asarray(ring_offsets, dtype=np.int64), np.asarray(polygon_offsets, dtype=np.int64)
+
+
+def _normalize_lonlat_array(coords: "np.ndarray", vertex_poly: "np.ndarray", n_polys: int) -> "np.ndarray":
+    """폴리곤별 lon/lat 순서 판별(_normalize_polygon_lonlat과 같은 규칙)을 벡터로 한 번에 합니다."""
+    import numpy as np
+
+    if len(coords) == 0:
+        return coords
+    a, b = coords[:, 0], coords[:, 1]
+    lonlat = (b >= 33.0) & (b <= 39.5) & (a >= 124.0) & (a <= 132.5)
+    latlon = ~lonlat & (a >= 33.0) & (a <= 39.5) & (b >= 124.0) & (b <= 132.5)
+
+    n = np.maximum(np.bincount(vertex_poly, minlength=n_polys), 1)
+    swap_poly = (np.bincount(vertex_poly, weights=lonlat, minlength=n_polys) / n < 0.6) & (
+        np.bincount(vertex_poly, weights=latlon, minlength=n_polys) / n >= 0.6
+    )
+    if not swap_poly.any():
+        return coords
+    swap = swap_poly[vertex_poly]
+    out = coords.copy()
+    out[swap] = coords[swap][:, ::-1]
+    return out
+
+
+def ring_signed_areas(coords: "np.ndarray", ring_offsets: "np.ndarray") -> "np.ndarray":
+    """ring별 shoelace 부호 면적 (좌표 단위², 반시계 +).
+
+    ring이 닫혀 있든(첫 점 반복) 열려 있든 결과는 같습니다. 꼭짓점 3개 미만 ring은 0.
+    """
+    import numpy as np
+
+    ring_offsets = np.asarray(ring_offsets, dtype=np.int64)
+    n_rings = len(ring_offsets) - 1
+    counts = np.diff(ring_offsets)
+    if n_rings <= 0 or len(coords) == 0:
+        return np.zeros(max(n_rings, 0), dtype=np.float64)
+
+    ring_id = np.repeat(np.arange(n_rings), counts)
+    starts = ring_offsets[:-1]
+
+    # 다음 꼭짓점 인덱스 (ring 마지막 점은 ring 첫 점으로)
+    nxt = np.arange(1, len(coords) + 1)
+    nonempty = counts > 0
+    nxt[ring_offsets[1:][nonempty] - 1] = starts[nonempty]
+
+    # ring 첫 점 기준 상대좌표로 계산해 큰 절대좌표(경도 127 등)의 상쇄 오차를 줄임
+    origin = coords[np.minimum(starts, len(coords) - 1)][ring_id]
+    x = coords[:, 0] - origin[:, 0]
+    y = coords[:, 1] - origin[:, 1]
+    cross = x * y[nxt] - x[nxt] * y
+
+    areas = np.bincount(ring_id, weights=cross, minlength=n_rings) / 2.0
+    areas[counts < 3] = 0.0
+    return areas
+
+
+# Korea 2000 / TM 투영대 (중앙 경선, EPSG). 폴리곤 경도에 가장 가까운 투영대를 쓰면 축척 오차가 가장 작습니다.
+KOREA_TM_BELTS: tuple[tuple[float, str], ...] = (
+    (125.0, "EPSG:5185"),  # 서부
+    (127.0, "EPSG:5186"),  # 중부
+    (129.0, "EPSG:5187"),  # 동부
+    (131.0, "EPSG:5188"),  # 동해(울릉)
+)
+
+_pyproj_local = threading.local()
+
+
+def _thread_cache() -> dict:
+    cache = getattr(_pyproj_local, "cache", None)
+    if cache is None:
+        cache = _pyproj_local.cache = {}
+    return cache
+
+
+def get_transformer(crs: str):
+    """EPSG:4326(lon/lat) → crs 변환기. 스레드마다 CRS별로 한 번만 만들어 재사용합니다.
+
+    (pyproj Transformer는 생성 비용이 크고 스레드 간 공유가 안전하지 않습니다.)
+    """
+    cache = _thread_cache()
+    transformer = cache.get(("transformer", crs))
+    if transformer is None:
+        from pyproj import Transformer
+
+        transformer = cache[("transformer", crs)] = Transformer.from_crs("EPSG:4326", crs, always_xy=True)
+    return transformer
+
+
+def _get_proj(crs: str):
+    cache = _thread_cache()
+    proj = cache.get(("proj", crs))
+    if proj is None:
+        from pyproj import Proj
+
+        proj = cache[("proj", crs)] = Proj(crs)
+    return proj
+
+
+def _project_tm(
+    coords: "np.ndarray",
+    vertex_poly: "np.ndarray",
+    poly_lon0: "np.ndarray",
+    poly_lat0: "np.ndarray",
+    crs: str | None,
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """좌표 배열을 투영대별로 묶어 한 번씩 변환합니다 (점/폴리곤 단위 호출 X).
+
+    반환: (투영 좌표, 폴리곤 중심의 면적 축척계수). 평면 면적 / 축척계수 = 실제(타원체) 면적.
+    """
+    import numpy as np
+
+    if crs:
+        belt_crs = [crs]
+        poly_belt = np.zeros(len(poly_lon0), dtype=np.int64)
+    else:
+        belt_crs = [code for _, code in KOREA_TM_BELTS]
+        centers = np.array([lon0 for lon0, _ in KOREA_TM_BELTS])
+        poly_belt = np.abs(poly_lon0[:, None] - centers[None, :]).argmin(axis=1)
+
+    vertex_belt = poly_belt[vertex_poly]
+    out = np.empty_like(coords)
+    areal_scale = np.ones(len(poly_lon0), dtype=np.float64)
+    for idx in np.unique(poly_belt):
+        code = belt_crs[idx]
+        mask = vertex_belt == idx
+        x, y = get_transformer(code).transform(coords[mask, 0], coords[mask, 1])
+        out[mask, 0] = x
+        out[mask, 1] = y
+        pmask = poly_belt == idx
+        areal_scale[pmask] = _get_proj(code).get_factors(poly_lon0[pmask], poly_lat0[pmask]).areal_scale
+    return out, areal_scale
+
+
+def polygon_areas_m2(
+    coords: "np.ndarray",
+    ring_offsets: "np.ndarray",
+    polygon_offsets: "np.ndarray",
+    *,
+    precise: bool = False,
+    crs: str | None = None,
+) -> "np.ndarray":
+    """여러 폴리곤의 면적(m²)을 한 번의 NumPy 패스로 계산합니다. 구멍(hole) 면적은 뺍니다.
+
+    precise=False: polygon_area_m2와 같은 폴리곤별 국지 근사(외곽선 평균 위도 기준).
+    precise=True : Korea 2000 TM(crs 미지정 시 폴리곤 경도에 맞는 투영대)으로 투영해 평면 면적을 구하고,
+                   폴리곤 중심의 면적 축척계수로 나눠 실제(GRS80 타원체) 면적으로 보정합니다.
+                   pyproj가 없으면 근사로 계산합니다.
+    """
+    import numpy as np
+
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    ring_offsets = np.asarray(ring_offsets, dtype=np.int64)
+    polygon_offsets = np.asarray(polygon_offsets, dtype=np.int64)
+    n_polys = len(polygon_offsets) - 1
+    if n_polys <= 0:
+        return np.zeros(0, dtype=np.float64)
+
+    rings_per_poly = np.diff(polygon_offsets)
+    ring_counts = np.diff(ring_offsets)
+    ring_poly = np.repeat(np.arange(n_polys), rings_per_poly)
+    vertex_poly = np.repeat(ring_poly, ring_counts)
+    coords = _normalize_lonlat_array(coords, vertex_poly, n_polys)
+
+    # 외곽선(각 폴리곤 첫 ring)의 평균 경위도
+    has_ring = rings_per_poly > 0
+    ext = polygon_offsets[:-1][has_ring]
+    ring_id = np.repeat(np.arange(len(ring_counts)), ring_counts)
+    ext_n = np.maximum(ring_counts[ext], 1)
+    lon0 = np.zeros(n_polys, dtype=np.float64)
+    lat0 = np.zeros(n_polys, dtype=np.float64)
+    lon0[has_ring] = np.bincount(ring_id, weights=coords[:, 0], minlength=len(ring_counts))[ext] / ext_n
+    lat0[has_ring] = np.bincount(ring_id, weights=coords[:, 1], minlength=len(ring_counts))[ext] / ext_n
+
+    # 외곽선은 +, 구멍은 -
+    sign = np.full(len(ring_poly), -1.0)
+    sign[ext] = 1.0
+
+    if precise:
+        try:
+            projected, areal_scale = _project_tm(coords, vertex_poly, lon0, lat0, crs)
+        except ImportError:
+            projected = None
+        if projected is not None:
+            ring_area = np.abs(ring_signed_areas(projected, ring_offsets))
+            area = np.bincount(ring_poly, weights=sign * ring_area, minlength=n_polys)
+            return np.maximum(area, 0.0) / areal_scale
+
+    # 폴리곤별 m/deg 계수 (국지 근사)
+    rad = np.radians(lat0)
+    m_lat = 111132.92 - 559.82 * np.cos(2 * rad) + 1.175 * np.cos(4 * rad)
+    m_lon = 111412.84 * np.cos(rad) - 93.5 * np.cos(3 * rad)
+
+    ring_area_deg2 = np.abs(ring_signed_areas(coords, ring_offsets))
+    deg2 = np.bincount(ring_poly, weights=sign * ring_area_deg2, minlength=n_polys)
+    return np.maximum(deg2, 0.0) * m_lon * m_lat
@@ -0,0 +1,338 @@
+"""Process-wide metrics registry (Prometheus text exposition format).
+
+    from core.utils import metrics
+    metrics.UPSTREAM_REQUESTS.inc("vworld_geocode", "200")
+    metrics.REPORT_BYTES.observe("pdf", value=len(data))
+
+- 카운터/게이지/히스토그램은 라벨 값 튜플 → 값 dict 하나라 기록 비용이 1µs 미만입니다 (운영에서 켜둔 채로 사용).
+- 캐시 적중률(track_cache), Streamlit 활성 세션 수, tracing 단계별 히스토그램은 render() 시점에 읽어옵니다
+  (기록 경로에 추가 비용 없음).
+- 노출: API 서버의 GET /metrics, Streamlit 프로세스는 OKSSANGIMONG_METRICS_PORT(127.0.0.1)로 여는
+  로컬 HTTP 엔드포인트, 배치/벤치마크는 write_textfile()로 파일 덤프.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from core.config import settings
+from core.utils.tracing import BUCKETS_S, Histogram, stage_histograms
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "okssangimong_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 리포트 파일 크기 버킷 (bytes)
+BYTES_BUCKETS: tuple[float, ...] = (1e3, 5e3, 1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6)
+
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _labels(self, values: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+    def samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield self.name, self._labels(labels), value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = float(value)
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class HistogramVec(_Metric):
+    """라벨별 고정 버킷 히스토그램 (tracing.Histogram 재사용)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = BUCKETS_S
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = buckets
+        self._children: dict[tuple[str, ...], Histogram] = {}
+
+    def labels(self, *labels: str) -> Histogram:
+        h = self._children.get(labels)
+        if h is None:
+            with self._lock:
+                h = self._children.setdefault(labels, Histogram(self.buckets))
+        return h
+
+    def observe(self, *labels: str, value: float) -> None:
+        self.labels(*labels).observe(value)
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = list(self._children.items())
+        for labels, h in items:
+            yield from _histogram_samples(self.name, self._labels(labels), h)
+
+
+def _histogram_samples(name: str, labels: dict[str, str], h: Histogram) -> Iterator[Sample]:
+    snap = h.snapshot()
+    cumulative = 0
+    for bound, n in zip(h.bounds + (float("inf"),), snap["counts"]):
+        cumulative += n
+        yield f"{name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+    yield f"{name}_sum", labels, snap["sum"]
+    yield f"{name}_count", labels, snap["count"]
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+_registry: dict[str, _Metric] = {}
+_registry_lock = threading.Lock()
+# render() 시점에 (이름, 종류, 설명, 샘플 목록)을 돌려주는 함수들
+_collectors: list[Callable[[], Iterable[tuple[str, str, str, list[Sample]]]]] = []
+
+
+def _register(metric: _Metric) -> Any:
+    with _registry_lock:
+        return _registry.setdefault(metric.name, metric)
+
+
+def counter(name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+    return _register(Counter(PREFIX + name, help, labelnames))
+
+
+def gauge(name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+    return _register(Gauge(PREFIX + name, help, labelnames))
+
+
+def histogram(
+    name: str, help: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = BUCKETS_S
+) -> HistogramVec:
+    return _register(HistogramVec(PREFIX + name, help, labelnames, buckets))
+
+
+def register_collector(fn: Callable[[], Iterable[tuple[str, str, str, list[Sample]]]]) -> None:
+    _collectors.append(fn)
+
+
+UPSTREAM_REQUESTS = counter(
+    "upstream_requests_total", "외부 API 호출 수 (status: HTTP 코드 또는 error)", ("upstream", "status")
+)
+UPSTREAM_RETRIES = counter("upstream_retries_total", "urllib3 Retry가 다시 보낸 요청 수", ("upstream",))
+UPSTREAM_LATENCY = histogram("upstream_latency_seconds", "외부 API 호출 소요 시간 (재시도 포함)", ("upstream",))
+REPORT_BUILD_SECONDS = histogram("report_build_seconds", "리포트 생성 시간", ("kind",))
+REPORT_BYTES = histogram("report_bytes", "리포트 파일 크기", ("kind",), buckets=BYTES_BUCKETS)
+HTTP_IN_FLIGHT = gauge("http_requests_in_flight", "처리 중인 API 요청 수")
+QUOTA_REJECTED = counter(
+    "quota_rejected_total", "호출 한도로 보내지 않은 요청 (reason: rate, daily)", ("key", "reason")
+)
+UPSTREAM_FAILOVERS = counter("upstream_failovers_total", "한도 초과로 다음 provider로 넘긴 지오코딩", ("from_key",))
+GEOCODE_HEDGES = counter("geocode_hedges_total", "응답이 p95보다 늦어 다른 provider로 보낸 hedge 요청", ("provider",))
+OFFLINE_GEOCODES = counter("offline_geocodes_total", "로컬 도로명주소 색인 조회 (result: hit, miss=외부 provider로)", ("result",))
+CIRCUIT_STATE = gauge("circuit_state", "provider 회로 차단기 상태 (0=closed, 1=open, 2=half_open)", ("provider",))
+SINGLEFLIGHT_CALLS = counter(
+    "singleflight_calls_total",
+    "single-flight 호출 (result: leader=직접 호출, shared=진행 중 호출 공유, shared_process=다른 프로세스 결과 사용)",
+    ("group", "result"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Collectors (읽기 시점에 계산)
+# ---------------------------------------------------------------------------
+_caches: dict[str, Any] = {}
+
+
+def track_cache(name: str, cache: Any) -> None:
+    """LRUCache(hits/misses/len) 또는 functools.lru_cache 함수(cache_info)를 적중률 집계 대상으로 등록."""
+    _caches[name] = cache
+
+
+def _cache_stats(cache: Any) -> tuple[int, int, int]:
+    if hasattr(cache, "cache_info"):
+        info = cache.cache_info()
+        return info.hits, info.misses, info.currsize
+    return cache.hits, cache.misses, len(cache)
+
+
+def _collect_caches() -> Iterator[tuple[str, str, str, list[Sample]]]:
+    stats = {name: _cache_stats(cache) for name, cache in list(_caches.items())}
+    yield PREFIX + "cache_hits_total", "counter", "캐시 적중 수", [
+        (PREFIX + "cache_hits_total", {"cache": name}, hits) for name, (hits, _, _) in stats.items()
+    ]
+    yield PREFIX + "cache_misses_total", "counter", "캐시 미스 수", [
+        (PREFIX + "cache_misses_total", {"cache": name}, misses) for name, (_, misses, _) in stats.items()
+    ]
+    yield PREFIX + "cache_entries", "gauge", "캐시 항목 수", [
+        (PREFIX + "cache_entries", {"cache": name}, size) for name, (_, _, size) in stats.items()
+    ]
+
+
+def active_streamlit_sessions() -> int | None:
+    """현재 프로세스의 Streamlit 활성 세션 수 (Streamlit 런타임이 없으면 None)."""
+    if "streamlit.runtime" not in sys.modules:
+        return None
+    try:
+        from streamlit.runtime import Runtime
+
+        if not Runtime.exists():
+            return None
+        return int(Runtime.instance()._session_mgr.num_active_sessions())
+    except Exception:  # 내부 API라 버전에 따라 없을 수 있음
+        return None
+
+
+def _collect_sessions() -> Iterator[tuple[str, str, str, list[Sample]]]:
+    n = active_streamlit_sessions()
+    if n is not None:
+        yield PREFIX + "active_sessions", "gauge", "Streamlit 활성 세션 수", [(PREFIX + "active_sessions", {}, n)]
+
+
+def _collect_stages() -> Iterator[tuple[str, str, str, list[Sample]]]:
+    name = PREFIX + "stage_seconds"
+    samples = [
+        sample
+        for stage, h in sorted(stage_histograms().items())
+        for sample in _histogram_samples(name, {"stage": stage}, h)
+    ]
+    if samples:
+        yield name, "histogram", "tracing span 단계별 소요 시간", samples
+
+
+register_collector(_collect_caches)
+register_collector(_collect_sessions)
+register_collector(_collect_stages)
+
+
+# ---------------------------------------------------------------------------
+# Exposition
+# ---------------------------------------------------------------------------
+def render() -> str:
+    """등록된 모든 지표를 Prometheus text format(0.0.4)으로."""
+    families: list[tuple[str, str, str, list[Sample]]] = [
+        (m.name, m.kind, m.help, list(m.samples())) for m in list(_registry.values())
+    ]
+    for collect in _collectors:
+        families.extend(collect())
+
+    lines: list[str] = []
+    for name, kind, help_, samples in families:
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f"{n}{_format_labels(labels)} {_format_value(v)}" for n, labels, v in samples)
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: str | Path) -> None:
+    """render() 결과를 파일로 (node_exporter textfile collector 등). 원자적으로 교체합니다."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(render(), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+_server: Any = None
+_server_lock = threading.Lock()
+
+
+def serve(port: int, addr: str = "127.0.0.1") -> Any:
+    """백그라운드 스레드로 GET /metrics 엔드포인트를 엽니다 (프로세스당 한 번, 이미 열려 있으면 그대로 반환)."""
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        try:
+            server = ThreadingHTTPServer((addr, port), Handler)
+        except OSError as exc:
+            # Streamlit 워커 여러 개가 같은 포트를 쓰려는 경우 등
+            logger.warning("metrics endpoint %s:%s unavailable: %s", addr, port, exc)
+            return None
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        _server = server
+        return server
+
+
+def serve_from_settings() -> Any:
+    """settings.metrics_port가 설정되어 있으면 로컬 엔드포인트를 엽니다."""
+    if settings.metrics_port:
+        return serve(settings.metrics_port)
+    return None
+
+
+def reset() -> None:
+    """기록된 값 비우기 (테스트용, 등록된 지표/캐시 목록은 유지)."""
+    for metric in list(_registry.values()):
+        with metric._lock:
+            getattr(metric, "_values", getattr(metric, "_children", {})).clear()
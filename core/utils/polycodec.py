@@ -0,0 +1,130 @@
+"""Compact binary encoding for polygons (footprint cache / result store / session state).
+
+list[tuple[float, float]]는 꼭짓점 하나에 100바이트 이상을 쓰고, 캐시·세션마다 같은 좌표가 복사됩니다.
+여기서는 폴리곤 하나를 bytes 한 덩어리로 묶습니다.
+
+레이아웃 (little-endian):
+    header  : magic b"FP", version u8, flags u8, n_ring_offsets u32, n_vertices u32, attrs_len u32,
+              origin_x f64, origin_y f64, scale f64                                   (40 bytes)
+    rings   : int32 × n_ring_offsets       (첫 ring = 외곽선, 나머지 = 구멍)
+    coords  : int32 × 2 × n_vertices      ((x - origin_x) / scale, (y - origin_y) / scale 반올림)
+    attrs   : UTF-8 JSON (선택)
+
+기본 scale 1e-7°(약 1cm)이면 꼭짓점당 8바이트입니다.
+decode_polygon은 ring/좌표 배열을 복사하지 않고 버퍼 위의 NumPy view로 돌려줍니다.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Iterable, Mapping, NamedTuple
+
+import numpy as np
+
+MAGIC = b"FP"
+VERSION = 1
+DEFAULT_SCALE = 1e-7  # degrees per unit (~1.1 cm)
+
+_HEADER = struct.Struct("<2sBBIII3d")
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S2"),
+        ("version", "u1"),
+        ("flags", "u1"),
+        ("n_rings", "<u4"),
+        ("n_vertices", "<u4"),
+        ("attrs_len", "<u4"),
+        ("ox", "<f8"),
+        ("oy", "<f8"),
+        ("scale", "<f8"),
+    ]
+)
+
+
+class PolygonView(NamedTuple):
+    ring_offsets: np.ndarray  # int32 view
+    quantized: np.ndarray  # (N, 2) int32 view
+    origin: tuple[float, float]
+    scale: float
+    attributes: dict[str, Any]
+
+    def coords(self) -> np.ndarray:
+        """(N, 2) float64 좌표 (여기서만 새 배열을 만듭니다)."""
+        return self.quantized * self.scale + np.asarray(self.origin)
+
+
+def encode_polygon(
+    coords: np.ndarray,
+    ring_offsets: np.ndarray,
+    attributes: Mapping[str, Any] | None = None,
+    *,
+    scale: float = DEFAULT_SCALE,
+) -> bytes:
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    ring_offsets = np.asarray(ring_offsets, dtype="<i4")
+    origin = coords[0] if len(coords) else np.zeros(2)
+    quantized = np.rint((coords - origin) / scale).astype("<i4")
+    attrs = json.dumps(dict(attributes), ensure_ascii=False, separators=(",", ":")).encode("utf-8") if attributes else b""
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, len(ring_offsets), len(coords), len(attrs), float(origin[0]), float(origin[1]), scale
+    )
+    return b"".join((header, ring_offsets.tobytes(), quantized.tobytes(), attrs))
+
+
+def decode_polygon(buf: bytes | bytearray | memoryview) -> PolygonView:
+    magic, version, _flags, n_rings, n_vertices, attrs_len, ox, oy, scale = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not an encoded polygon buffer")
+    offset = _HEADER.size
+    ring_offsets = np.frombuffer(buf, dtype="<i4", count=n_rings, offset=offset)
+    offset += 4 * n_rings
+    quantized = np.frombuffer(buf, dtype="<i4", count=2 * n_vertices, offset=offset).reshape(-1, 2)
+    offset += 8 * n_vertices
+    attributes = json.loads(bytes(buf[offset:offset + attrs_len]).decode("utf-8")) if attrs_len else {}
+    return PolygonView(ring_offsets, quantized, (ox, oy), scale, attributes)
+
+
+def decode_many(buffers: Iterable[bytes | None]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """인코딩된 폴리곤 여러 개 → (coords, ring_offsets, polygon_offsets) (geometry.pack_polygons와 같은 형식).
+
+    버퍼를 하나로 이어 붙인 뒤 헤더/ring/좌표를 인덱스 배열로 한 번에 모아 읽습니다 (폴리곤별 파이썬 디코딩 없음).
+    None(폴리곤 없음)은 꼭짓점이 없는 폴리곤으로 채워 입력 순서와 폴리곤 번호를 맞춥니다.
+    """
+    buffers = list(buffers)
+    present = np.fromiter((b is not None for b in buffers), dtype=bool, count=len(buffers))
+    chunks = [bytes(b) for b in buffers if b is not None]
+    if not chunks:
+        return np.zeros((0, 2)), np.zeros(1, dtype=np.int64), np.zeros(len(buffers) + 1, dtype=np.int64)
+
+    lengths = np.fromiter(map(len, chunks), dtype=np.int64, count=len(chunks))
+    starts = np.cumsum(lengths) - lengths
+    raw = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+
+    headers = raw[starts[:, None] + np.arange(_HEADER.size)].view(_HEADER_DTYPE).ravel()
+    if (headers["magic"] != MAGIC).any() or (headers["version"] != VERSION).any():
+        raise ValueError("Not an encoded polygon buffer")
+    n_offsets = headers["n_rings"].astype(np.int64)
+    n_vertices = headers["n_vertices"].astype(np.int64)
+
+    def gather(offsets: np.ndarray, nbytes: np.ndarray) -> np.ndarray:
+        first = np.cumsum(nbytes) - nbytes
+        return raw[np.repeat(offsets - first, nbytes) + np.arange(int(nbytes.sum()))]
+
+    local_rings = gather(starts + _HEADER.size, 4 * n_offsets).view("<i4").astype(np.int64)
+    quantized = gather(starts + _HEADER.size + 4 * n_offsets, 8 * n_vertices).view("<i4").reshape(-1, 2)
+
+    scale = np.repeat(headers["scale"], n_vertices)[:, None]
+    origin = np.repeat(np.column_stack([headers["ox"], headers["oy"]]), n_vertices, axis=0)
+    coords = quantized * scale + origin
+
+    # 폴리곤별 ring offsets [0, ..., n]의 첫 0을 빼고 꼭짓점 누적 개수를 더해 이어 붙임
+    vertex_base = np.cumsum(n_vertices) - n_vertices
+    keep = np.ones(len(local_rings), dtype=bool)
+    keep[np.cumsum(n_offsets) - n_offsets] = False
+    ring_offsets = np.concatenate([[0], (local_rings + np.repeat(vertex_base, n_offsets))[keep]])
+
+    rings_per_poly = np.zeros(len(buffers), dtype=np.int64)
+    rings_per_poly[present] = n_offsets - 1
+    polygon_offsets = np.concatenate([[0], np.cumsum(rings_per_poly)])
+    return coords, ring_offsets, polygon_offsets
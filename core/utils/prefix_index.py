@@ -0,0 +1,145 @@
+"""Sorted-array prefix index for address / building-name autocomplete.
+
+    index = PrefixIndex.build(["서울특별시 중구 세종대로 110", "서울시청"])
+    index.search("세종대로 11", limit=5)   # → [0] (texts의 번호)
+
+텍스트마다 토큰 경계에서 시작하는 접미 문자열("서울중구세종대로110", "중구세종대로110", "세종대로110")을
+정규화(prefix_key)해서 고정 폭 UTF-8 bytes 배열로 정렬해 둡니다. 정렬 배열은 트라이를 평평하게 편 것과 같아서
+접두어 범위를 이진 탐색(searchsorted) 두 번으로 찾고, 범위 안 키를 길이 순(짧은 이어짐 먼저, 같으면 사전 순)으로
+골라 limit개만 꺼냅니다. 범위가 아주 넓으면(짧은 질의) 사전 순 앞쪽 RANK_WINDOW개 안에서만 길이 순으로 고릅니다.
+파이썬 객체 없이 numpy 배열 두 개라 메모리가 작고, save/load로 .npy 파일에 두면 mmap으로 바로 씁니다.
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import count as _count
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from core.utils.address import sido_short
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_DROP = re.compile(r"[^0-9a-z가-힣]")
+
+# 길이 순 정렬에 쓰는 접두어 범위 최대 크기 (키 입력마다 도는 조회라 훑는 양을 묶어 둠)
+RANK_WINDOW = 4096
+
+
+def prefix_key(text: str) -> str:
+    """비교용 정규화: 소문자, 한글/영문/숫자만 남김, 첫 토큰이 시도면 약칭 (서울특별시/서울시 → 서울)."""
+    tokens = (text or "").lower().split()
+    if tokens:
+        tokens[0] = sido_short(tokens[0])
+    return _DROP.sub("", "".join(tokens))
+
+
+def entry_keys(text: str) -> list[str]:
+    """토큰 경계마다의 접미 키. 숫자로 시작하는 토큰(건물번호, 층/호)에서는 시작하지 않음 (첫 토큰 제외)."""
+    tokens = (text or "").split()
+    return [
+        key
+        for i, token in enumerate(tokens)
+        if i == 0 or not token[:1].isdigit()
+        if (key := prefix_key(" ".join(tokens[i:])))
+    ]
+
+
+class PrefixIndex:
+    """정렬된 (키, 대상 번호) 배열. 읽기 전용, thread-safe."""
+
+    def __init__(self, keys: np.ndarray, targets: np.ndarray):
+        self.keys = keys
+        self.targets = targets
+        self.width = keys.dtype.itemsize
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def build(
+        cls, texts: Iterable[str | None], *, targets: Iterable[int] | None = None, width: int = 48
+    ) -> PrefixIndex:
+        """texts[i]의 접미 키들이 모두 대상 targets[i](기본: i)를 가리키는 색인. 키는 width bytes에서 자름."""
+        import numpy as np
+
+        keys: list[bytes] = []
+        key_targets: list[int] = []
+        for i, text in zip(targets if targets is not None else _count(), texts):
+            for key in entry_keys(text or ""):
+                keys.append(key.encode("utf-8")[:width])
+                key_targets.append(i)
+        key_array = np.array(keys, dtype=f"S{width}")
+        order = np.argsort(key_array, kind="stable")
+        return cls(key_array[order], np.asarray(key_targets, dtype=np.int32)[order])
+
+    def save(self, directory: Path, name: str) -> None:
+        import numpy as np
+
+        np.save(directory / f"{name}_keys.npy", self.keys)
+        np.save(directory / f"{name}_targets.npy", self.targets)
+
+    @classmethod
+    def load(cls, directory: Path, name: str) -> PrefixIndex | None:
+        """save()로 쓴 파일을 mmap으로 엽니다. 파일이 없으면 None."""
+        import numpy as np
+
+        keys_path = directory / f"{name}_keys.npy"
+        if not keys_path.is_file():
+            return None
+        return cls(np.load(keys_path, mmap_mode="r"), np.load(directory / f"{name}_targets.npy", mmap_mode="r"))
+
+    def search(self, query: str, limit: int = 10) -> list[int]:
+        """query로 시작하는 키의 대상 번호 (중복 제거, 짧은 이어짐 순) 최대 limit개."""
+        prefix = prefix_key(query).encode("utf-8")[: self.width]
+        if not prefix or not len(self.keys):
+            return []
+        lo = int(self.keys.searchsorted(prefix, side="left"))
+        # UTF-8에 0xff 바이트는 없으므로 prefix + 0xff가 접두어 범위의 끝
+        hi = int(self.keys.searchsorted(prefix + b"\xff", side="left"))
+        import numpy as np
+
+        hi = min(hi, lo + RANK_WINDOW)
+        # 고정 폭 bytes라 str_len = 끝의 0 패딩을 뺀 키 길이. stable이라 같은 길이는 사전 순 유지
+        order = np.argsort(np.char.str_len(self.keys[lo:hi]), kind="stable")
+        out: list[int] = []
+        seen: set[int] = set()
+        for target in self.targets[lo:hi][order]:
+            target = int(target)
+            if target not in seen:
+                seen.add(target)
+                out.append(target)
+                if len(out) >= limit:
+                    break
+        return out
+
+
+def save_strings(directory: Path, name: str, strings: Iterable[str | None]) -> None:
+    """문자열 목록을 UTF-8로 이어 붙인 ``<name>.bin``과 시작 위치 ``<name>_offsets.npy``로 저장 (None은 빈 문자열)."""
+    import numpy as np
+
+    encoded = [(s or "").encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    np.save(directory / f"{name}_offsets.npy", offsets)
+    (directory / f"{name}.bin").write_bytes(b"".join(encoded))
+
+
+class MappedStrings:
+    """save_strings로 쓴 문자열 목록을 mmap으로 읽기 (항목을 꺼낼 때만 decode)."""
+
+    def __init__(self, directory: Path, name: str):
+        import numpy as np
+
+        self._offsets = np.load(directory / f"{name}_offsets.npy", mmap_mode="r")
+        path = directory / f"{name}.bin"
+        self._data = np.memmap(path, dtype=np.uint8, mode="r") if path.stat().st_size else b""
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        start, end = int(self._offsets[i]), int(self._offsets[i + 1])
+        return bytes(self._data[start:end]).decode("utf-8")
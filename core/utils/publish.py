@@ -0,0 +1,63 @@
+"""Atomic publish of a generated directory (memory-mapped indexes).
+
+    with publish_dir(address_index_path()) as tmp:
+        np.save(tmp / "keys.npy", keys)
+        ...
+
+실행 중인 프로세스가 mmap으로 열어 둔 파일을 제자리에서 다시 쓰면(truncate) 그 페이지를 읽는 순간 SIGBUS가 납니다.
+여기서는 ``<이름>.<시각>`` 새 디렉터리에 다 쓴 뒤 ``<이름>`` 심볼릭 링크를 os.replace로 한 번에 바꿉니다.
+읽는 쪽은 열 때 Path.resolve()로 버전 디렉터리를 고정하므로 중간에 바뀌어도 한 버전만 봅니다.
+이전 버전은 keep개만 남기고 지웁니다 (이미 mmap한 파일은 지워도 inode가 남아 안전).
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+def _versions(dst: Path) -> list[Path]:
+    # 예전 레이아웃을 옮겨 둔 것은 파일일 수도 있음 (단일 parquet 테이블)
+    found = [p for p in dst.parent.glob(f"{dst.name}.*") if p.name[len(dst.name) + 1 :].isdigit()]
+    return sorted(found, key=lambda p: int(p.name[len(dst.name) + 1 :]))
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+@contextmanager
+def publish_dir(dst: Path, *, keep: int = 1) -> Iterator[Path]:
+    """새 버전 디렉터리를 넘겨주고, 블록이 예외 없이 끝나면 dst가 그 디렉터리를 가리키도록 바꿉니다."""
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    version = dst.parent / f"{dst.name}.{time.time_ns()}"
+    version.mkdir()
+    try:
+        yield version
+    except BaseException:
+        shutil.rmtree(version, ignore_errors=True)
+        raise
+
+    previous = _versions(dst)
+    if dst.exists() and not dst.is_symlink():
+        # 예전 레이아웃(실제 디렉터리나 파일)은 버전 이름으로 옮겨 두고 링크로 바꿈
+        # 가장 오래된 버전으로 (이름의 숫자 순으로 정리하므로 새 버전보다 먼저 지워져야 함)
+        legacy = dst.parent / f"{dst.name}.0"
+        os.replace(dst, legacy)
+        previous.append(legacy)
+    link = dst.parent / f".{dst.name}.link-{os.getpid()}"
+    link.unlink(missing_ok=True)
+    os.symlink(version.name, link)
+    os.replace(link, dst)
+
+    stale = [p for p in previous if p != version]
+    for old in stale[: max(0, len(stale) - keep)]:
+        _remove(old)
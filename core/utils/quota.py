@@ -0,0 +1,221 @@
+"""Host-wide API quota manager (token bucket shared through SQLite).
+
+    quota = get_quota_manager()
+    quota.acquire("kakao")          # 토큰이 없으면 잠깐 기다리거나 QuotaExceededError
+
+VWorld/Kakao 키에는 초당/일일 한도가 있는데, Streamlit 워커와 API 워커가 각자 재시도하면 한도를 넘겨
+429가 연달아 나고 재시도가 다시 429를 부릅니다. 여기서는 키별 버킷 하나를 SQLite 파일(settings.quota_db)에 두고
+같은 호스트의 모든 프로세스가 BEGIN IMMEDIATE 트랜잭션으로 토큰을 꺼내 씁니다.
+
+- 초당 한도: rate 토큰/초로 채워지는 버킷 (최대 burst = 1초 분량). 토큰이 모자라면 max_wait_s까지만 기다림
+- 일일 한도: 한국 시간 자정에 초기화되는 사용량 카운터
+- upstream 429: penalize()로 Retry-After 동안 키 전체를 막아 다른 프로세스도 바로 멈춤
+- urllib3 재시도도 한도를 쓰므로 charge()로 토큰을 빚(음수)으로 차감
+
+한도는 "10/s,40000/d" 형식 문자열로 설정합니다 (OKSSANGIMONG_KAKAO_QUOTA, OKSSANGIMONG_VWORLD_QUOTA).
+기본값은 빈 값(끔)이라 한도를 지정하지 않으면 quota_db 파일도 만들지 않습니다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from core.config import settings
+from core.exceptions import QuotaExceededError
+from core.utils import metrics
+
+KST = timezone(timedelta(hours=9))
+
+
+@dataclass(frozen=True)
+class QuotaLimit:
+    rate_per_s: float | None = None
+    daily: int | None = None
+
+    @property
+    def burst(self) -> float:
+        return max(1.0, self.rate_per_s or 0.0)
+
+
+def parse_quota(spec: str | None) -> QuotaLimit | None:
+    """"10/s,40000/d" → QuotaLimit(10, 40000). 빈 문자열/None이면 한도 없음."""
+    if not spec or not spec.strip():
+        return None
+    rate, daily = None, None
+    for part in spec.split(","):
+        value, _, unit = part.strip().partition("/")
+        if unit == "s":
+            rate = float(value)
+        elif unit == "d":
+            daily = int(value)
+        else:
+            raise ValueError(f"Unknown quota unit in {part!r} (expected N/s or N/d)")
+    return QuotaLimit(rate, daily)
+
+
+def _today(now: float) -> str:
+    return datetime.fromtimestamp(now, KST).date().isoformat()
+
+
+class QuotaManager:
+    """키별 공유 토큰 버킷. 프로세스/스레드 간 안전 (SQLite 잠금)."""
+
+    def __init__(self, path: str | Path, limits: dict[str, QuotaLimit], *, max_wait_s: float = 1.0):
+        self.path = Path(path)
+        self.limits = dict(limits)
+        self.max_wait_s = max_wait_s
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS quota ("
+            " key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL,"
+            " day TEXT NOT NULL, used INTEGER NOT NULL, blocked_until REAL NOT NULL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        # core.state.SqliteStateBackend와 같이 스레드마다 커넥션 하나. 트랜잭션은 직접 BEGIN IMMEDIATE
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _bucket(self, key: str, now: float) -> Iterator[dict[str, Any]]:
+        """키의 버킷 행을 (채운 뒤) 잠근 채로 넘기고, 블록이 끝나면 바뀐 값을 저장."""
+        limit = self.limits[key]
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated, day, used, blocked_until FROM quota WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                row = (limit.burst, now, _today(now), 0, 0.0)
+            tokens, updated, day, used, blocked_until = row
+            if limit.rate_per_s:
+                tokens = min(limit.burst, tokens + max(0.0, now - updated) * limit.rate_per_s)
+            if day != _today(now):
+                day, used = _today(now), 0
+            bucket = {"tokens": tokens, "day": day, "used": used, "blocked_until": blocked_until}
+            yield bucket
+            conn.execute(
+                "INSERT OR REPLACE INTO quota (key, tokens, updated, day, used, blocked_until) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, bucket["tokens"], now, bucket["day"], bucket["used"], bucket["blocked_until"]),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def try_acquire(self, key: str, now: float | None = None) -> float:
+        """토큰 하나를 꺼냅니다. 성공하면 0, 아니면 다시 시도할 때까지 기다릴 초 (일일 한도 소진이면 inf)."""
+        limit = self.limits.get(key)
+        if limit is None:
+            return 0.0
+        now = time.time() if now is None else now
+        with self._bucket(key, now) as bucket:
+            if bucket["blocked_until"] > now:
+                return bucket["blocked_until"] - now
+            if limit.daily is not None and bucket["used"] >= limit.daily:
+                return float("inf")
+            if limit.rate_per_s and bucket["tokens"] < 1.0:
+                return (1.0 - bucket["tokens"]) / limit.rate_per_s
+            bucket["tokens"] -= 1.0
+            bucket["used"] += 1
+            return 0.0
+
+    def acquire(self, key: str, *, max_wait_s: float | None = None) -> None:
+        """토큰을 꺼낼 때까지 최대 max_wait_s 기다립니다. 그 안에 안 되면 QuotaExceededError (기다리지 않고 바로)."""
+        max_wait_s = self.max_wait_s if max_wait_s is None else max_wait_s
+        deadline = time.monotonic() + max_wait_s
+        while True:
+            wait = self.try_acquire(key)
+            if wait <= 0:
+                return
+            if time.monotonic() + wait > deadline:
+                reason = "daily" if wait == float("inf") else "rate"
+                metrics.QUOTA_REJECTED.inc(key, reason)
+                raise QuotaExceededError(key, retry_after_s=None if wait == float("inf") else wait)
+            time.sleep(wait)
+
+    def charge(self, key: str, amount: float) -> None:
+        """이미 보낸 요청(urllib3 재시도 등)만큼 토큰/일일 사용량을 차감 (토큰은 음수가 될 수 있음)."""
+        if key not in self.limits or amount <= 0:
+            return
+        with self._bucket(key, time.time()) as bucket:
+            bucket["tokens"] -= amount
+            bucket["used"] += int(amount)
+
+    def penalize(self, key: str, seconds: float) -> None:
+        """upstream이 429를 준 경우: 모든 프로세스가 seconds 동안 이 키로 요청하지 않도록 막음."""
+        if key not in self.limits:
+            return
+        now = time.time()
+        with self._bucket(key, now) as bucket:
+            bucket["blocked_until"] = max(bucket["blocked_until"], now + seconds)
+            bucket["tokens"] = min(bucket["tokens"], 0.0)
+
+    def remaining(self, key: str) -> dict[str, float | None]:
+        """{"tokens": 남은 초당 토큰, "daily": 오늘 남은 호출 수(한도 없으면 None)} (조회만, 토큰 소비 없음)."""
+        limit = self.limits[key]
+        with self._bucket(key, time.time()) as bucket:
+            pass
+        return {
+            "tokens": bucket["tokens"] if limit.rate_per_s else None,
+            "daily": max(0, limit.daily - bucket["used"]) if limit.daily is not None else None,
+        }
+
+
+_UNSET: Any = object()
+_manager: Any = _UNSET
+_manager_lock = threading.Lock()
+
+
+def get_quota_manager() -> QuotaManager | None:
+    """settings로 만든 프로세스 공용 QuotaManager (한도가 하나도 없으면 None)."""
+    global _manager
+    if _manager is _UNSET:
+        with _manager_lock:
+            if _manager is _UNSET:
+                limits = {
+                    key: limit
+                    for key, limit in (("kakao", parse_quota(settings.kakao_quota)), ("vworld", parse_quota(settings.vworld_quota)))
+                    if limit is not None
+                }
+                _manager = (
+                    QuotaManager(settings.quota_db, limits, max_wait_s=settings.quota_max_wait_s) if limits else None
+                )
+    return _manager
+
+
+def set_quota_manager(manager: QuotaManager | None) -> QuotaManager | None:
+    """공용 QuotaManager 교체 (테스트/벤치마크용, None이면 한도 없음). 이전 값을 돌려줍니다."""
+    global _manager
+    with _manager_lock:
+        previous, _manager = _manager, manager
+    return None if previous is _UNSET else previous
+
+
+def _collect_quota() -> Iterator[tuple[str, str, str, list[metrics.Sample]]]:
+    manager = _manager
+    if manager is _UNSET or manager is None:
+        return
+    remaining = {key: manager.remaining(key) for key in manager.limits}
+    yield metrics.PREFIX + "quota_tokens", "gauge", "API 키별 남은 초당 토큰 (호스트 공유)", [
+        (metrics.PREFIX + "quota_tokens", {"key": key}, r["tokens"]) for key, r in remaining.items() if r["tokens"] is not None
+    ]
+    yield metrics.PREFIX + "quota_daily_remaining", "gauge", "API 키별 오늘 남은 호출 수 (호스트 공유)", [
+        (metrics.PREFIX + "quota_daily_remaining", {"key": key}, r["daily"]) for key, r in remaining.items() if r["daily"] is not None
+    ]
+
+
+metrics.register_collector(_collect_quota)
@@ -0,0 +1,218 @@
+"""Request coalescing (single-flight) for identical concurrent lookups.
+
+    flight = SingleFlight("geocode")
+    result = flight.do(address, lambda: provider.geocode(address))
+
+같은 키로 동시에 들어온 호출 중 첫 번째(leader)만 fn을 실행하고, 나머지는 그 호출이 끝나기를 기다렸다가
+같은 결과(또는 같은 예외)를 받습니다. 캠페인 오픈처럼 인기 주소 하나를 여러 세션이 한꺼번에 조회할 때
+외부 API 호출이 한 번으로 줄어듭니다. 캐시가 아니라서 호출이 끝나면 결과를 들고 있지 않습니다
+(이미 끝난 결과 재사용은 호출하는 쪽 LRUCache 담당).
+
+shared_dir를 주면 (settings.singleflight_dir, OKSSANGIMONG_SINGLEFLIGHT_DIR) 같은 디렉터리를 쓰는 프로세스끼리도
+합칩니다 (Streamlit 워커 여러 개, API 워커):
+- 키마다 따로 만든 잠금 파일(locks/<name>-<키 해시>.lock, fcntl.flock)을 leader 프로세스가 잡고 fn을 실행한 뒤
+  결과를 SQLite(singleflight.sqlite)에 잠깐(ttl_s) 남기고 잠금 파일을 지웁니다 (다른 키는 서로 기다리지 않음).
+- 다른 프로세스는 잠금을 기다렸다가 남은 결과가 있으면 그것을 씁니다 (dumps/loads로 bytes 변환 가능한 값만).
+- fcntl이 없는 플랫폼(Windows)에서는 프로세스 내 합치기만 합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Generic, Hashable, TypeVar
+
+from core.utils import metrics
+from core.utils.tracing import span
+
+try:  # POSIX 전용
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """키별 진행 중 호출 하나를 공유합니다. thread-safe."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        shared_dir: str | Path | None = None,
+        dumps: Callable[[T], bytes] | None = None,
+        loads: Callable[[bytes], T] | None = None,
+        ttl_s: float = 30.0,
+        wait_timeout_s: float = 60.0,
+    ):
+        self.name = name
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._shared: _SharedFlight | None = None
+        if shared_dir is not None and fcntl is not None:
+            self._shared = _SharedFlight(
+                Path(shared_dir), name, dumps or _identity, loads or _identity, ttl_s, wait_timeout_s
+            )
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.SINGLEFLIGHT_CALLS.inc(self.name, "shared")
+            with span("singleflight.wait"):
+                call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            if self._shared is not None:
+                call.value = self._shared.do(str(key), fn)
+            else:
+                metrics.SINGLEFLIGHT_CALLS.inc(self.name, "leader")
+                call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class _SharedFlight:
+    """프로세스 간 합치기: 잠금 파일로 leader를 정하고 SQLite로 결과를 넘깁니다."""
+
+    def __init__(
+        self,
+        root: Path,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any],
+        ttl_s: float,
+        wait_timeout_s: float,
+    ):
+        self.root = root
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+        self.ttl_s = ttl_s
+        self.wait_timeout_s = wait_timeout_s
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / "locks").mkdir(exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS flight ("
+                " name TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, stored_at REAL NOT NULL,"
+                " PRIMARY KEY (name, key))"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        # core.state.SqliteStateBackend와 같이 스레드마다 커넥션 하나
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.root / "singleflight.sqlite", timeout=10.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _lock_path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return self.root / "locks" / f"{self.name}-{digest}.lock"
+
+    def _acquire(self, fd: int, deadline: float) -> bool:
+        """잠금을 잡으면 True. 다른 프로세스가 잡고 있어서 기다렸다면 기다린 뒤 True, 시간 초과면 False."""
+        delay = 0.005
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+
+    def _stored(self, key: str) -> Any:
+        row = self._conn().execute(
+            "SELECT value FROM flight WHERE name = ? AND key = ? AND stored_at >= ?",
+            (self.name, key, time.time() - self.ttl_s),
+        ).fetchone()
+        return None if row is None else self.loads(row[0])
+
+    def _store(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO flight (name, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                (self.name, key, self.dumps(value), now),
+            )
+            conn.execute("DELETE FROM flight WHERE stored_at < ?", (now - self.ttl_s,))
+
+    def _open_locked(self, path: Path) -> tuple[BinaryIO, bool]:
+        """(열린 잠금 파일, 잠금 여부). 기다리는 동안 leader가 파일을 지웠으면 새 파일로 다시 잡습니다."""
+        deadline = time.monotonic() + self.wait_timeout_s
+        while True:
+            lock_file = open(path, "a+b")
+            locked = self._acquire(lock_file.fileno(), deadline)
+            try:
+                current = os.stat(path).st_ino
+            except FileNotFoundError:
+                current = None
+            if not locked or current == os.fstat(lock_file.fileno()).st_ino:
+                return lock_file, locked
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        path = self._lock_path(key)
+        with span("singleflight.lock"):
+            lock_file, locked = self._open_locked(path)
+        with lock_file:
+            if not locked:
+                logger.warning("singleflight %s: lock wait timed out, calling without coalescing", self.name)
+            try:
+                # 다른 프로세스의 leader가 방금 끝냈으면 그 결과를 씀
+                stored = self._stored(key)
+                if stored is not None:
+                    metrics.SINGLEFLIGHT_CALLS.inc(self.name, "shared_process")
+                    return stored
+                metrics.SINGLEFLIGHT_CALLS.inc(self.name, "leader")
+                value = fn()
+                if value is not None:
+                    self._store(key, value)
+                return value
+            finally:
+                if locked:
+                    # 잡고 있는 동안 지워야 기다리던 쪽이 지운 파일을 잡고 끝난 줄 모르는 일이 없음 (_open_locked)
+                    path.unlink(missing_ok=True)
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,283 @@
+"""Vectorized spatial queries over many polygons (point-in-polygon, nearest polygon).
+
+WFS bbox 응답처럼 폴리곤 수백 개가 한 번에 들어오는 경우를 위해,
+폴리곤을 geometry.pack_polygons의 ragged 배열로 한 번 묶고 bbox를 미리 계산해 둔 뒤
+- bbox 검사로 대부분의 폴리곤을 먼저 걸러내고
+- 남은 폴리곤의 모든 변(edge)에 대해 crossing-number 검사를 NumPy로 한 번에 수행합니다.
+구멍(hole)이 있는 폴리곤도 처리합니다 (외곽선 안 & 어떤 구멍에도 속하지 않음 = 포함).
+
+점이 수천 개면(주소 일괄 매칭) STRtree로 (점, 후보 폴리곤) 쌍을 한 번에 뽑고
+쌍마다의 변 검사도 한 번의 NumPy 연산으로 처리합니다 (PolygonIndex.locate_many).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence, Tuple
+
+import numpy as np
+
+from core.utils.geometry import pack_polygons
+
+
+class STRtree:
+    """Sort-Tile-Recursive로 묶은 정적 R-tree (bbox 배열, 점 일괄 질의).
+
+    레벨마다 노드 bbox와 자식 범위 [start, end)를 배열로 들고 있어서
+    (점, 노드) 쌍을 레벨 단위로 한꺼번에 확장/필터링합니다 (점마다 파이썬 루프 없음).
+    """
+
+    __slots__ = ("items", "item_bboxes", "levels", "node_size")
+
+    def __init__(self, bboxes: np.ndarray, node_size: int = 16):
+        bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        self.node_size = int(node_size)
+        order = _str_order(bboxes, self.node_size)
+        self.items = order
+        self.item_bboxes = bboxes[order]
+        # levels[0]이 리프 바로 위, levels[-1]이 최상위 (노드 수 <= node_size)
+        self.levels: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        boxes = self.item_bboxes
+        while len(boxes) > self.node_size:
+            starts = np.arange(0, len(boxes), self.node_size)
+            ends = np.append(starts[1:], len(boxes))
+            node_boxes = np.column_stack(
+                [
+                    np.minimum.reduceat(boxes[:, 0], starts),
+                    np.minimum.reduceat(boxes[:, 1], starts),
+                    np.maximum.reduceat(boxes[:, 2], starts),
+                    np.maximum.reduceat(boxes[:, 3], starts),
+                ]
+            )
+            perm = _str_order(node_boxes, self.node_size)
+            node_boxes, starts, ends = node_boxes[perm], starts[perm], ends[perm]
+            self.levels.append((node_boxes, starts, ends))
+            boxes = node_boxes
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def query_points(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """bbox가 점을 포함하는 (점 인덱스, 항목 인덱스) 쌍. 점 인덱스 오름차순."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        top = self.levels[-1][0] if self.levels else self.item_bboxes
+        pts = np.repeat(np.arange(len(xs)), len(top))
+        nodes = np.tile(np.arange(len(top)), len(xs))
+        pts, nodes = _keep_inside(top, nodes, pts, xs, ys)
+
+        for level in range(len(self.levels) - 1, -1, -1):
+            _, starts, ends = self.levels[level]
+            below = self.levels[level - 1][0] if level > 0 else self.item_bboxes
+            counts = ends[nodes] - starts[nodes]
+            first = np.cumsum(counts) - counts
+            children = np.repeat(starts[nodes] - first, counts) + np.arange(int(counts.sum()))
+            pts, nodes = _keep_inside(below, children, np.repeat(pts, counts), xs, ys)
+
+        order = np.argsort(pts, kind="stable")
+        return pts[order], self.items[nodes[order]]
+
+
+def _str_order(bboxes: np.ndarray, node_size: int) -> np.ndarray:
+    """STR 정렬 순서: 중심 x로 세로 띠(slice)를 나누고 띠 안에서 중심 y로 정렬."""
+    n = len(bboxes)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    cx = (bboxes[:, 0] + bboxes[:, 2]) * 0.5
+    cy = (bboxes[:, 1] + bboxes[:, 3]) * 0.5
+    n_nodes = -(-n // node_size)
+    per_slice = node_size * int(np.ceil(np.sqrt(n_nodes)))
+    by_x = np.argsort(cx, kind="stable")
+    slice_id = np.empty(n, dtype=np.int64)
+    slice_id[by_x] = np.arange(n) // per_slice
+    return np.lexsort((cy, slice_id))
+
+
+def _keep_inside(boxes: np.ndarray, idx: np.ndarray, pts: np.ndarray, xs: np.ndarray, ys: np.ndarray):
+    b = boxes[idx]
+    x, y = xs[pts], ys[pts]
+    keep = (b[:, 0] <= x) & (x <= b[:, 2]) & (b[:, 1] <= y) & (y <= b[:, 3])
+    return pts[keep], idx[keep]
+
+
+class PolygonIndex:
+    """폴리곤 묶음에 대한 포함/최근접 질의.
+
+    좌표는 (x, y) = (lon, lat) 평면으로 다룹니다. 최근접 거리는 위도에 따른 경도 축소(cos φ)를 반영합니다.
+    """
+
+    __slots__ = (
+        "coords",
+        "ring_offsets",
+        "polygon_offsets",
+        "bboxes",
+        "_vertex_poly",
+        "_vertex_ring",
+        "_next",
+        "_is_hole_ring",
+        "_tree",
+    )
+
+    def __init__(self, coords: np.ndarray, ring_offsets: np.ndarray, polygon_offsets: np.ndarray):
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        self.ring_offsets = np.asarray(ring_offsets, dtype=np.int64)
+        self.polygon_offsets = np.asarray(polygon_offsets, dtype=np.int64)
+
+        n_polys = len(self.polygon_offsets) - 1
+        ring_counts = np.diff(self.ring_offsets)
+        ring_poly = np.repeat(np.arange(n_polys), np.diff(self.polygon_offsets))
+        self._vertex_ring = np.repeat(np.arange(len(ring_counts)), ring_counts)
+        self._vertex_poly = ring_poly[self._vertex_ring]
+
+        # 각 꼭짓점의 같은 ring 안 다음 꼭짓점 (ring 끝 → ring 시작)
+        nxt = np.arange(1, len(self.coords) + 1)
+        nonempty = ring_counts > 0
+        nxt[self.ring_offsets[1:][nonempty] - 1] = self.ring_offsets[:-1][nonempty]
+        self._next = nxt
+
+        is_hole = np.ones(len(ring_counts), dtype=bool)
+        is_hole[self.polygon_offsets[:-1][np.diff(self.polygon_offsets) > 0]] = False
+        self._is_hole_ring = is_hole
+
+        # 폴리곤별 bbox (minx, miny, maxx, maxy). 꼭짓점이 없는 폴리곤은 어떤 점도 통과하지 못하게 inf/-inf
+        self.bboxes = np.empty((n_polys, 4), dtype=np.float64)
+        self.bboxes[:, :2] = np.inf
+        self.bboxes[:, 2:] = -np.inf
+        if len(self.coords):
+            np.minimum.at(self.bboxes[:, 0], self._vertex_poly, self.coords[:, 0])
+            np.minimum.at(self.bboxes[:, 1], self._vertex_poly, self.coords[:, 1])
+            np.maximum.at(self.bboxes[:, 2], self._vertex_poly, self.coords[:, 0])
+            np.maximum.at(self.bboxes[:, 3], self._vertex_poly, self.coords[:, 1])
+        self._tree: STRtree | None = None
+
+    @classmethod
+    def from_polygons(cls, polygons: Iterable[Sequence[Tuple[float, float]] | Sequence[Sequence[Tuple[float, float]]]]) -> "PolygonIndex":
+        return cls(*pack_polygons(polygons))
+
+    def __len__(self) -> int:
+        return len(self.polygon_offsets) - 1
+
+    def bbox_candidates(self, x: float, y: float) -> np.ndarray:
+        b = self.bboxes
+        return (b[:, 0] <= x) & (x <= b[:, 2]) & (b[:, 1] <= y) & (y <= b[:, 3])
+
+    def contains(self, x: float, y: float) -> np.ndarray:
+        """점 (x, y)를 포함하는 폴리곤 마스크 (bool, 폴리곤 수 길이)."""
+        n_polys = len(self)
+        candidates = self.bbox_candidates(x, y)
+        if not candidates.any():
+            return candidates
+
+        vmask = candidates[self._vertex_poly]
+        i = np.flatnonzero(vmask)
+        j = self._next[i]
+        xi, yi = self.coords[i, 0], self.coords[i, 1]
+        xj, yj = self.coords[j, 0], self.coords[j, 1]
+
+        # crossing number: 점에서 +x 방향 반직선과 교차하는 변의 수 (수평 변은 straddle 조건에서 제외됨)
+        straddle = (yi > y) != (yj > y)
+        x_cross = np.zeros_like(xi)
+        np.divide((xj - xi) * (y - yi), (yj - yi), out=x_cross, where=straddle)
+        x_cross += xi
+        crossing = straddle & (x < x_cross)
+
+        n_rings = len(self.ring_offsets) - 1
+        ring_inside = (np.bincount(self._vertex_ring[i], weights=crossing, minlength=n_rings) % 2) == 1
+
+        ring_poly = np.repeat(np.arange(n_polys), np.diff(self.polygon_offsets))
+        in_exterior = np.zeros(n_polys, dtype=bool)
+        in_exterior[ring_poly[ring_inside & ~self._is_hole_ring]] = True
+        in_hole = np.zeros(n_polys, dtype=bool)
+        in_hole[ring_poly[ring_inside & self._is_hole_ring]] = True
+        return in_exterior & ~in_hole
+
+    def edge_distances(self, x: float, y: float) -> np.ndarray:
+        """점에서 각 폴리곤 경계(모든 ring의 변)까지 최단거리 (경도 축소 반영한 도 단위).
+
+        최근접 후보만 정확히 계산하고, 나머지(bbox 거리 하한이 최근접 상한보다 먼 폴리곤)는 inf.
+        """
+        n_polys = len(self)
+        out = np.full(n_polys, np.inf)
+        if not len(self.coords):
+            return out
+        kx = np.cos(np.radians(y))
+
+        # 하한: 점~bbox 거리 / 상한: 점~아무 꼭짓점 거리(각 폴리곤 첫 꼭짓점 중 최소)
+        # → 하한이 상한보다 먼 폴리곤은 최근접일 수 없으므로 변 검사를 생략
+        b = self.bboxes
+        bx = np.maximum(np.maximum(b[:, 0] - x, x - b[:, 2]), 0.0) * kx
+        by = np.maximum(np.maximum(b[:, 1] - y, y - b[:, 3]), 0.0)
+        lower = np.hypot(bx, by)
+        first = self.coords[np.minimum(self.ring_offsets[self.polygon_offsets[:-1]], len(self.coords) - 1)]
+        upper = np.hypot((first[:, 0] - x) * kx, first[:, 1] - y).min()
+        candidates = lower <= upper
+
+        i = np.flatnonzero(candidates[self._vertex_poly])
+        j = self._next[i]
+        px, py = self.coords[i, 0] * kx, self.coords[i, 1]
+        dx, dy = self.coords[j, 0] * kx - px, self.coords[j, 1] - py
+        seg2 = dx * dx + dy * dy
+        t = np.zeros_like(seg2)
+        np.divide((x * kx - px) * dx + (y - py) * dy, seg2, out=t, where=seg2 > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+        dist = np.hypot(px + t * dx - x * kx, py + t * dy - y)
+        np.minimum.at(out, self._vertex_poly[i], dist)
+        return out
+
+    def locate(self, x: float, y: float) -> int | None:
+        """점을 포함하는 폴리곤 인덱스. 없으면 경계가 가장 가까운 폴리곤, 폴리곤이 없으면 None."""
+        if len(self) == 0:
+            return None
+        hits = np.flatnonzero(self.contains(x, y))
+        if len(hits):
+            return int(hits[0])  # 겹치면 입력 순서상 첫 폴리곤
+        distances = self.edge_distances(x, y)
+        if not np.isfinite(distances).any():
+            return None
+        return int(np.argmin(distances))
+
+    @property
+    def tree(self) -> STRtree:
+        """폴리곤 bbox STRtree (처음 쓸 때 한 번 생성)."""
+        if self._tree is None:
+            self._tree = STRtree(self.bboxes)
+        return self._tree
+
+    def locate_many(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """점마다 포함하는 폴리곤 인덱스 (겹치면 번호가 작은 폴리곤, 없으면 -1). 최근접 대체는 하지 않습니다.
+
+        유효한 폴리곤(구멍이 외곽선 안에 있고 서로 겹치지 않음)이라면 모든 ring의 교차 수를 합한 홀짝이
+        "외곽선 안 & 구멍 밖"과 같으므로, (점, 폴리곤) 쌍마다 변 전체의 교차 수만 셉니다.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        out = np.full(len(xs), -1, dtype=np.int64)
+        if len(self) == 0 or len(xs) == 0:
+            return out
+        pts, polys = self.tree.query_points(xs, ys)
+        if not len(pts):
+            return out
+
+        vstart = self.ring_offsets[self.polygon_offsets[:-1]]
+        vend = self.ring_offsets[self.polygon_offsets[1:]]
+        counts = vend[polys] - vstart[polys]
+        first = np.cumsum(counts) - counts
+        i = np.repeat(vstart[polys] - first, counts) + np.arange(int(counts.sum()))
+        j = self._next[i]
+        pair = np.repeat(np.arange(len(pts)), counts)
+        x, y = xs[pts][pair], ys[pts][pair]
+        xi, yi = self.coords[i, 0], self.coords[i, 1]
+        xj, yj = self.coords[j, 0], self.coords[j, 1]
+
+        straddle = (yi > y) != (yj > y)
+        x_cross = np.zeros_like(xi)
+        np.divide((xj - xi) * (y - yi), (yj - yi), out=x_cross, where=straddle)
+        x_cross += xi
+        crossing = straddle & (x < x_cross)
+        inside = (np.bincount(pair, weights=crossing, minlength=len(pts)) % 2) == 1
+
+        hit_pts, hit_polys = pts[inside], polys[inside]
+        best = np.full(len(xs), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(best, hit_pts, hit_polys)
+        found = best != np.iinfo(np.int64).max
+        out[found] = best[found]
+        return out
@@ -0,0 +1,227 @@
+"""Lightweight tracing: nested spans with monotonic timers.
+
+    with span("rooftop.wfs_attempt"):
+        ...
+
+    @traced("scenario.compute")
+    def compute(...): ...
+
+- span은 contextvars로 부모를 찾아 중첩되며 (스레드/asyncio 작업마다 독립), 끝날 때
+  단계(stage) 이름별 히스토그램에 소요 시간을 누적합니다 (프로세스 단위, stage_histograms()).
+- trace(name) 블록 안에서 끝난 span은 요청 단위 Trace에도 모입니다 (페이지 rerun / HTTP 요청 하나).
+  최근 Trace 몇 개는 recent_traces()로 볼 수 있습니다.
+- settings.tracing(OKSSANGIMONG_TRACING=0)으로 끄면 span()은 아무것도 하지 않는 공용 객체를 돌려줍니다.
+
+span 하나의 비용은 1µs 안팎이라 ms 단위 단계(지오코딩, WFS, 리포트 생성)에 붙여도 부담이 없습니다.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any, Callable, TypeVar
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 히스토그램 버킷 상한 (초). 마지막 버킷은 +Inf
+BUCKETS_S: tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+_enabled = settings.tracing
+_current_span: ContextVar["Span | None"] = ContextVar("okssangimong_span", default=None)
+_current_trace: ContextVar["Trace | None"] = ContextVar("okssangimong_trace", default=None)
+
+
+class Histogram:
+    """고정 버킷 누적 히스토그램 (count/sum/버킷별 개수). thread-safe."""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "_lock")
+
+    def __init__(self, bounds: tuple[float, ...] = BUCKETS_S):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수 (+Inf 버킷이면 마지막 상한)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds[min(i, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {"count": self.count, "sum": self.sum, "counts": list(self.counts)}
+
+
+_histograms: dict[str, Histogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def stage_histogram(name: str) -> Histogram:
+    h = _histograms.get(name)
+    if h is None:
+        with _histograms_lock:
+            h = _histograms.setdefault(name, Histogram())
+    return h
+
+
+def stage_histograms() -> dict[str, Histogram]:
+    """단계 이름 → 소요 시간(초) 히스토그램."""
+    return dict(_histograms)
+
+
+class Span:
+    __slots__ = ("name", "depth", "start_ns", "duration_ns", "_token")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.depth = 0
+        self.start_ns = 0
+        self.duration_ns = 0
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None:
+            self.depth = parent.depth + 1
+        self._token = _current_span.set(self)
+        self.start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        self.duration_ns = perf_counter_ns() - self.start_ns
+        _current_span.reset(self._token)
+        stage_histogram(self.name).observe(self.duration_ns * 1e-9)
+        trace_ = _current_trace.get()
+        if trace_ is not None:
+            trace_.spans.append(self)
+        return False
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str) -> Span | _NullSpan:
+    return Span(name) if _enabled else _NULL_SPAN
+
+
+def traced(name: str, *, only_in_trace: bool = False) -> Callable[[F], F]:
+    """함수 전체를 span으로 감싸는 데코레이터.
+
+    only_in_trace=True면 요청 Trace 안에서 불릴 때만 기록합니다. 수 µs짜리 함수(시나리오 계산)를
+    루프에서 대량 호출할 때 span 비용(~1µs)이 호출 시간에 비해 커지지 않도록 하기 위한 옵션입니다.
+    """
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled or (only_in_trace and _current_trace.get() is None):
+                return fn(*args, **kwargs)
+            with Span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+class Trace:
+    """요청 하나 동안 끝난 span 목록 (시작 순서로 정렬해 들여쓰기 트리로 출력)."""
+
+    __slots__ = ("name", "spans", "start_ns", "duration_ns")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.spans: list[Span] = []
+        self.start_ns = perf_counter_ns()
+        self.duration_ns = 0
+
+    def stages(self) -> list[tuple[str, int, float]]:
+        """[(단계 이름, 깊이, ms), ...] 시작 순서."""
+        return [(s.name, s.depth, s.duration_ms) for s in sorted(self.spans, key=lambda s: s.start_ns)]
+
+    def format(self) -> str:
+        lines = [f"{self.name}  {self.duration_ns / 1e6:.1f} ms"]
+        lines += [f"{'  ' * (depth + 1)}{name}  {ms:.1f} ms" for name, depth, ms in self.stages()]
+        return "\n".join(lines)
+
+
+_recent: deque[Trace] = deque(maxlen=32)
+
+
+class trace:  # noqa: N801 - span()과 같은 소문자 컨텍스트 매니저로 사용
+    """요청 단위 Trace 수집. ``with trace("page.step1") as t: ...`` 후 t.format()."""
+
+    __slots__ = ("_trace", "_token")
+
+    def __init__(self, name: str):
+        self._trace = Trace(name)
+
+    def __enter__(self) -> Trace:
+        self._token = _current_trace.set(self._trace)
+        self._trace.start_ns = perf_counter_ns()
+        return self._trace
+
+    def __exit__(self, *exc: Any) -> bool:
+        self._trace.duration_ns = perf_counter_ns() - self._trace.start_ns
+        _current_trace.reset(self._token)
+        if _enabled:
+            _recent.append(self._trace)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("trace\n%s", self._trace.format())
+        return False
+
+
+def recent_traces() -> list[Trace]:
+    return list(_recent)
+
+
+def set_enabled(flag: bool) -> None:
+    """런타임에 켜고 끄기 (벤치마크/테스트용)."""
+    global _enabled
+    _enabled = bool(flag)
+
+
+def reset() -> None:
+    """누적 히스토그램/최근 Trace 비우기."""
+    with _histograms_lock:
+        _histograms.clear()
+    _recent.clear()
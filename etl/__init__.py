@@ -0,0 +1,4 @@
+"""Offline data pipelines (data/raw → data/processed).
+
+앱/서버 런타임에서는 import 하지 않습니다. 예: ``python -m etl.buildings``
+"""
@@ -0,0 +1,153 @@
+"""Road-name address index ETL: data/raw/addresses → data/processed/addresses (오프라인 지오코더 색인).
+
+입력 (data/raw/addresses 아래, 하위 폴더 포함):
+- 도로명주소 + 좌표 DB: ``*.csv`` / ``*.txt`` (``|`` 또는 ``,`` 구분, UTF-8 또는 CP949).
+  헤더 이름은 ADDRESS_KEYS 후보 중 처음 찾은 컬럼을 씁니다. 주소기반산업지원서비스의 위치정보요약DB처럼
+  헤더가 없는 파일은 ``--columns``로 열 순서를 알려 줍니다 (ADDRESS_KEYS 필드 이름, 안 쓰는 열은 ``-``).
+- 좌표가 투영좌표(예: 위치정보요약DB의 UTM-K)면 ``--source-crs EPSG:5179``로 위경도로 바꿉니다.
+
+처리: 행마다 시도/시군구/도로명/건물번호를 core.utils.address 규칙으로 정규화해 키를 만들고,
+core.data_access.address_index 레이아웃(정렬된 키 해시 + 좌표/표시 주소 배열, 모두 .npy)으로 씁니다.
+같은 키(건물 출입구 여러 개 등)는 처음 나온 행만 남깁니다. 원본이 바뀌면 전체를 다시 만듭니다 (전국 수 분).
+
+사용법:
+    python -m etl.addresses
+    python -m etl.addresses --source-crs EPSG:5179 --columns -,sido,sigungu,-,road,underground,main,sub,x,y
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+from core.data_access.address_index import address_index_path, write_address_index
+from core.utils.address import sido_full, sido_short
+from etl.buildings import _inverse_transformer, _sniff
+
+ADDRESS_SUFFIXES = (".csv", ".txt")
+
+# 주소 컬럼 → 후보 헤더 (소문자 비교, 앞에서부터 처음 찾은 컬럼 사용)
+ADDRESS_KEYS: dict[str, tuple[str, ...]] = {
+    "sido": ("sido", "ctp_kor_nm", "시도명"),
+    "sigungu": ("sigungu", "sig_kor_nm", "시군구명"),
+    "road": ("road", "rn", "도로명"),
+    "underground": ("underground", "udrt_yn", "지하여부"),
+    "main": ("main", "buld_mnnm", "건물본번"),
+    "sub": ("sub", "buld_slno", "건물부번"),
+    "x": ("x", "lon", "경도", "ent_x", "x좌표"),
+    "y": ("y", "lat", "위도", "ent_y", "y좌표"),
+}
+_FIELDS = ["sido", "sigungu", "road", "main", "sub", "underground", "lat", "lon", "address"]
+
+
+def _address_columns(header: Iterable[str]) -> dict[str, str]:
+    lowered = {str(h).strip().lower(): h for h in header}
+    out: dict[str, str] = {}
+    for field, keys in ADDRESS_KEYS.items():
+        for key in keys:
+            if key.lower() in lowered:
+                out[lowered[key.lower()]] = field
+                break
+    return out
+
+
+def _read_chunks(path: Path, columns: list[str] | None, chunk_size: int) -> Iterator[pd.DataFrame]:
+    encoding, sep = _sniff(path)
+    if columns:
+        names = [c if c != "-" else f"_skip{i}" for i, c in enumerate(columns)]
+        reader = pd.read_csv(
+            path, sep=sep, encoding=encoding, dtype=str, header=None, names=names,
+            index_col=False, chunksize=chunk_size, keep_default_na=False,
+        )
+    else:
+        reader = pd.read_csv(path, sep=sep, encoding=encoding, dtype=str, chunksize=chunk_size, keep_default_na=False)
+    for chunk in reader:
+        if not columns:
+            chunk = chunk.rename(columns=_address_columns(chunk.columns))
+        missing = {"sido", "road", "main", "x", "y"} - set(chunk.columns)
+        if missing:
+            raise ValueError(f"{path}: missing address columns {sorted(missing)} (use --columns for headerless files)")
+        yield chunk
+
+
+def _normalize(chunk: pd.DataFrame, transformer) -> pd.DataFrame:
+    """원본 행 → _FIELDS (키 정규화 + 위경도 + 표시용 도로명주소). 번호/좌표가 없는 행은 버림."""
+    df = pd.DataFrame(index=chunk.index)
+    df["sido"] = chunk["sido"].str.strip().map(sido_short)
+    df["sigungu"] = chunk.get("sigungu", pd.Series("", index=chunk.index)).str.replace(" ", "", regex=False)
+    df["road"] = chunk["road"].str.replace(" ", "", regex=False)
+    df["main"] = pd.to_numeric(chunk["main"], errors="coerce")
+    df["sub"] = pd.to_numeric(chunk.get("sub", pd.Series("0", index=chunk.index)), errors="coerce").fillna(0)
+    df["underground"] = chunk.get("underground", pd.Series("0", index=chunk.index)).str.strip().isin(("1", "Y", "y", "지하"))
+    x = pd.to_numeric(chunk["x"], errors="coerce").to_numpy(dtype=np.float64)
+    y = pd.to_numeric(chunk["y"], errors="coerce").to_numpy(dtype=np.float64)
+    if transformer is not None:
+        x, y = transformer.transform(x, y)
+    elif np.nanmax(np.abs(x), initial=0.0) > 180:
+        raise ValueError("coordinates look projected; pass --source-crs (e.g. EPSG:5179)")
+    df["lon"], df["lat"] = x, y
+    df = df[df["main"].notna() & (df["road"] != "") & np.isfinite(df["lat"]) & np.isfinite(df["lon"])]
+    df = df.astype({"main": "int64", "sub": "int64"})
+
+    sigungu = chunk.loc[df.index].get("sigungu", pd.Series("", index=df.index)).str.strip()
+    number = np.where(df["sub"] > 0, df["main"].astype(str) + "-" + df["sub"].astype(str), df["main"].astype(str))
+    parts = [
+        df["sido"].map(sido_full),
+        sigungu,
+        chunk.loc[df.index, "road"].str.strip(),
+        np.where(df["underground"], "지하 ", "") + number,
+    ]
+    df["address"] = [" ".join(p for p in row if p) for row in zip(*parts)]
+    return df[_FIELDS]
+
+
+def run(
+    raw_dir: Path,
+    out_dir: Path,
+    *,
+    columns: list[str] | None = None,
+    source_crs: str | None = None,
+    chunk_size: int = 200_000,
+) -> dict[str, int]:
+    """ETL 실행. 반환: {"sources": 파일 수, "read": 읽은 행 수, "rows": 색인 행 수}."""
+    transformer = _inverse_transformer(source_crs)
+    sources = sorted(p for p in raw_dir.rglob("*") if p.is_file() and p.suffix.lower() in ADDRESS_SUFFIXES)
+    frames = [
+        _normalize(chunk, transformer) for path in sources for chunk in _read_chunks(path, columns, chunk_size)
+    ]
+    rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=_FIELDS)
+    written = write_address_index(rows, out_dir, sources=[str(p.relative_to(raw_dir)) for p in sources])
+    return {"sources": len(sources), "read": int(len(rows)), "rows": written}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--raw", type=Path, default=Path(settings.data_dir) / "raw" / "addresses")
+    parser.add_argument("--out", type=Path, default=address_index_path())
+    parser.add_argument("--columns", default=None, help="헤더 없는 파일의 열 순서 (쉼표 구분, 안 쓰는 열은 -)")
+    parser.add_argument("--source-crs", default=None, help="좌표가 투영좌표일 때 원본 CRS (예: EPSG:5179)")
+    parser.add_argument("--chunk-size", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    report = run(
+        args.raw,
+        args.out,
+        columns=args.columns.split(",") if args.columns else None,
+        source_crs=args.source_crs,
+        chunk_size=args.chunk_size,
+    )
+    print(f"sources : {report['sources']} files, {report['read']} rows read")
+    print(f"index   : {report['rows']} addresses -> {args.out}")
+    print(f"elapsed : {time.perf_counter() - t0:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
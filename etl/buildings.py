@@ -0,0 +1,518 @@
+"""Building table ETL: data/raw → data/processed/buildings.parquet (시군구 파티션).
+
+입력 (data/raw 아래, 하위 폴더 포함):
+- 건물 footprint 덤프: ``*.geojsonl`` / ``*.geojsonseq`` / ``*.ndjson`` (한 줄에 feature 하나, 스트리밍)
+  또는 ``*.geojson`` (FeatureCollection, 파일 단위로 읽음). 속성 키는 core.footprint.PROPERTY_KEYS 기준.
+- 건축물대장: ``*.csv`` / ``*.txt`` (헤더 포함, ``|`` 또는 ``,`` 구분, UTF-8 또는 CP949).
+  footprint와는 building_id(건물관리번호)로 연결하며, 위경도 컬럼이 있으면 footprint 없이도 행을 만듭니다.
+
+처리 단계:
+1) staging: 바뀐 원본 파일만 chunk 단위로 읽어 정규화(좌표 순서/CRS, 대표점, footprint 면적 일괄 계산)한 뒤
+   data/interim/buildings/ 아래 파일별 parquet으로 저장. manifest.json에 (크기, mtime, 포함 시군구)를 기록.
+2) merge: 바뀐 원본이 걸친 시군구 파티션만 다시 만듭니다. footprint ⟕ 대장, 위경도 Z-order로 정렬해
+   row group마다 lat/lon min/max 통계 범위가 좁도록 씁니다 (bbox 조회 시 row group 단위 pruning).
+   파티션별 행 수/bbox는 ``_partitions.json``에 기록해 조회 시 파티션도 건너뛸 수 있게 합니다.
+   옥상/녹화 가능 면적도 현재 α/β로 함께 채웁니다 (etl.roof_areas).
+3) suggest: 파티션이 바뀌면 name/address 두 컬럼만 읽어 검색창 자동완성 색인
+   (core.data_access.building_suggest, buildings.parquet 옆 buildings_suggest/)을 다시 만듭니다.
+
+--full은 새 버전 디렉터리(buildings.parquet.<시각>/)에 전체를 다시 쓴 뒤 buildings.parquet 링크만 바꿉니다
+(core.utils.publish). 실행 중인 앱은 그동안 이전 테이블을 계속 읽습니다.
+
+사용법:
+    python -m etl.buildings
+    python -m etl.buildings --full --source-crs EPSG:5186
+"""
+
+from __future__ import annotations
+
+import argparse
+import codecs
+import hashlib
+import json
+import os
+import shutil
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from core.config import settings
+from core.data_access.building_suggest import META_FILE, BuildingSuggestIndex, buildings_suggest_path
+from core.data_access.loaders import BUILDINGS_COLUMNS, PARTITION_INDEX, PARTITION_KEY, buildings_path
+from core.footprint import PROPERTY_KEYS
+from core.services.rooftop_service import roof_coefficients
+from core.utils.geometry import geojson_polygons, pack_geojson, polygon_areas_m2
+from core.utils.polycodec import decode_many, encode_polygon
+from core.utils.publish import publish_dir
+from etl.roof_areas import with_roof_areas
+
+FOOTPRINT_SUFFIXES = (".geojsonl", ".geojsonseq", ".ndjson", ".geojson")
+REGISTER_SUFFIXES = (".csv", ".txt")
+SKIP_RAW_DIRS = ("addresses",)  # 다른 ETL 입력 (etl.addresses: 도로명주소 DB)
+
+# 대장 컬럼 → 후보 헤더 (소문자 비교, 앞에서부터 처음 찾은 컬럼 사용)
+REGISTER_KEYS: dict[str, tuple[str, ...]] = {
+    "building_id": ("building_id", "bd_mgt_sn", "건물관리번호", "mgm_bldrgst_pk", "관리건축물대장pk"),
+    "name": ("name", "bld_nm", "건물명"),
+    "address": ("address", "new_plat_plc", "도로명대지위치", "plat_plc", "대지위치"),
+    "sigungu_cd": ("sigungu_cd", "시군구코드"),
+    "pnu": ("pnu",),
+    "use": ("use", "main_purps_cd_nm", "주용도코드명"),
+    "ground_floors": ("ground_floors", "grnd_flr_cnt", "지상층수"),
+    "height_m": ("height_m", "heit", "높이"),
+    "building_area_m2": ("building_area_m2", "arch_area", "건축면적"),
+    "roof_area_m2": ("roof_area_m2",),
+    "lat": ("lat", "위도"),
+    "lon": ("lon", "경도"),
+}
+
+STAGING_SCHEMA = pa.schema(
+    [
+        ("building_id", pa.string()),
+        ("name", pa.string()),
+        ("address", pa.string()),
+        ("lat", pa.float64()),
+        ("lon", pa.float64()),
+        ("roof_area_m2", pa.float64()),
+        ("footprint_area_m2", pa.float64()),
+        ("building_area_m2", pa.float64()),
+        ("use", pa.string()),
+        ("ground_floors", pa.float64()),  # 결측 때문에 float (최종 테이블에서 Int32)
+        ("height_m", pa.float64()),
+        ("pnu", pa.string()),
+        ("footprint", pa.binary()),  # core.utils.polycodec 인코딩 (MultiPolygon이면 가장 큰 폴리곤)
+        (PARTITION_KEY, pa.string()),
+    ]
+)
+_STR_COLUMNS = [f.name for f in STAGING_SCHEMA if pa.types.is_string(f.type)]
+_NUM_COLUMNS = [f.name for f in STAGING_SCHEMA if pa.types.is_floating(f.type)]
+UNKNOWN_SIGUNGU = "00000"
+
+
+# ---------------------------------------------------------------- helpers
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _sigungu(df: pd.DataFrame) -> pd.Series:
+    """시군구코드: 명시 컬럼 → PNU 앞 5자리 → 건물관리번호 앞 5자리."""
+    out = df[PARTITION_KEY].where(df[PARTITION_KEY].str.fullmatch(r"\d{5}", na=False))
+    for col in ("pnu", "building_id"):
+        prefix = df[col].str.slice(0, 5)
+        out = out.fillna(prefix.where(prefix.str.fullmatch(r"\d{5}", na=False)))
+    return out.fillna(UNKNOWN_SIGUNGU)
+
+
+def _finish(df: pd.DataFrame) -> pa.Table:
+    for col in STAGING_SCHEMA.names:
+        if col not in df.columns:
+            df[col] = None
+    for col in _STR_COLUMNS:
+        df[col] = df[col].astype("string").str.strip().replace("", pd.NA)
+    for col in _NUM_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df[PARTITION_KEY] = _sigungu(df)
+    return pa.Table.from_pandas(df[STAGING_SCHEMA.names], schema=STAGING_SCHEMA, preserve_index=False)
+
+
+def _inverse_transformer(source_crs: str | None):
+    if not source_crs:
+        return None
+    from pyproj import Transformer
+
+    return Transformer.from_crs(source_crs, "EPSG:4326", always_xy=True)
+
+
+# ---------------------------------------------------------------- footprints
+def _iter_features(path: Path) -> Iterator[dict]:
+    if path.suffix.lower() == ".geojson":
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+        yield from data.get("features") or []
+        return
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip().lstrip("\x1e")  # GeoJSON text sequence(RFC 8142) 구분자
+            if line:
+                yield json.loads(line)
+
+
+def _properties_frame(features: list[dict]) -> pd.DataFrame:
+    """feature properties → Footprint 속성 컬럼 (core.footprint.parse_properties의 컬럼 단위 버전)."""
+    raw = pd.DataFrame.from_records([f.get("properties") or {} for f in features], index=range(len(features)))
+    raw = raw.replace("", None)
+    by_key: dict[str, list[str]] = {}
+    for col in raw.columns:
+        by_key.setdefault(str(col).lower(), []).append(col)  # 대소문자 무시 (BD_MGT_SN / bd_mgt_sn)
+    df = pd.DataFrame(index=raw.index)
+    for field, keys in PROPERTY_KEYS.items():
+        value = pd.Series(None, index=raw.index, dtype=object)
+        for key in keys:
+            for col in by_key.get(key, ()):
+                value = value.combine_first(raw[col])
+        df[field] = value
+    ids = pd.Series([f.get("id") for f in features], index=raw.index, dtype=object)
+    df["building_id"] = df["building_id"].combine_first(ids)
+    for col in ("building_id", "pnu", "name", "use"):
+        df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def footprint_chunk(features: list[dict], *, transformer=None) -> pa.Table:
+    """feature 목록 → staging 행 (feature 하나 = 건물 하나, MultiPolygon 면적은 합산)."""
+    geometries = [f.get("geometry") for f in features]
+    n_parts = np.fromiter((len(geojson_polygons(g)) for g in geometries), dtype=np.int64, count=len(features))
+    coords, ring_offsets, polygon_offsets = pack_geojson(geometries)
+
+    if transformer is not None and len(coords):
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        coords = np.column_stack([x, y])
+
+    n_polys = len(polygon_offsets) - 1
+    # 폴리곤별 외곽선 꼭짓점 평균 (대표점) — 위경도 순서가 뒤집힌 폴리곤은 여기서 바로잡음
+    ext_start = ring_offsets[polygon_offsets[:-1]]
+    ext_count = ring_offsets[polygon_offsets[:-1] + 1] - ext_start
+    # 닫힌 ring의 마지막 꼭짓점(= 첫 꼭짓점)은 평균에서 제외
+    has_ring = ext_count > 1
+    closed = np.zeros(n_polys, dtype=bool)
+    closed[has_ring] = (coords[ext_start[has_ring]] == coords[(ext_start + ext_count - 1)[has_ring]]).all(axis=1)
+    ext_count = ext_count - closed
+    ext_poly = np.repeat(np.arange(n_polys), ext_count)
+    ext_index = np.arange(int(ext_count.sum())) - np.repeat(np.cumsum(ext_count) - ext_count, ext_count) + np.repeat(ext_start, ext_count)
+    counts = np.maximum(ext_count, 1)
+    cx = np.bincount(ext_poly, weights=coords[ext_index, 0], minlength=n_polys) / counts
+    cy = np.bincount(ext_poly, weights=coords[ext_index, 1], minlength=n_polys) / counts
+    swapped = (cx < 90.0) & (cy > 90.0)
+    cx, cy = np.where(swapped, cy, cx), np.where(swapped, cx, cy)
+
+    areas = polygon_areas_m2(coords, ring_offsets, polygon_offsets, precise=settings.precise_area, crs=settings.area_crs)
+
+    feature_of_poly = np.repeat(np.arange(len(features)), n_parts)
+    feature_area = np.bincount(feature_of_poly, weights=areas, minlength=len(features))
+    weights = np.where(areas > 0, areas, 1e-12)
+    wsum = np.bincount(feature_of_poly, weights=weights, minlength=len(features))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        lon = np.bincount(feature_of_poly, weights=cx * weights, minlength=len(features)) / wsum
+        lat = np.bincount(feature_of_poly, weights=cy * weights, minlength=len(features)) / wsum
+
+    df = _properties_frame(features)
+    df["lat"] = lat
+    df["lon"] = lon
+    df["footprint_area_m2"] = feature_area
+    df["footprint"] = _encode_largest(coords, ring_offsets, polygon_offsets, areas, swapped, feature_of_poly, len(features))
+    df = df[n_parts > 0]
+    return _finish(df)
+
+
+def _encode_largest(coords, ring_offsets, polygon_offsets, areas, swapped, feature_of_poly, n_features) -> list[bytes | None]:
+    """feature마다 면적이 가장 큰 폴리곤을 polycodec으로 인코딩 (포함 판정용 footprint)."""
+    out: list[bytes | None] = [None] * n_features
+    order = np.lexsort((-areas, feature_of_poly))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = feature_of_poly[order][1:] != feature_of_poly[order][:-1]
+    for p in order[first].tolist():
+        r0, r1 = polygon_offsets[p], polygon_offsets[p + 1]
+        v0, v1 = ring_offsets[r0], ring_offsets[r1]
+        ring = coords[v0:v1]
+        if swapped[p]:
+            ring = ring[:, ::-1]
+        out[feature_of_poly[p]] = encode_polygon(ring, ring_offsets[r0:r1 + 1] - v0)
+    return out
+
+
+# ---------------------------------------------------------------- register
+def _sniff(path: Path) -> tuple[str, str]:
+    with path.open("rb") as f:
+        head = f.read(1 << 16)
+    try:
+        # 64 KB 경계에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+        text = codecs.getincrementaldecoder("utf-8-sig")().decode(head, final=False)
+        encoding = "utf-8-sig"
+    except UnicodeDecodeError:
+        text = head.decode("cp949", errors="replace")
+        encoding = "cp949"
+    first = text.splitlines()[0] if text else ""
+    return encoding, "|" if first.count("|") > first.count(",") else ","
+
+
+def _register_columns(header: Iterable[str]) -> dict[str, str]:
+    lowered = {str(h).strip().lower(): h for h in header}
+    out: dict[str, str] = {}
+    for field, keys in REGISTER_KEYS.items():
+        for key in keys:
+            if key.lower() in lowered:
+                out[lowered[key.lower()]] = field
+                break
+    return out
+
+
+def register_chunks(path: Path, chunk_size: int) -> Iterator[pa.Table]:
+    encoding, sep = _sniff(path)
+    reader = pd.read_csv(path, sep=sep, encoding=encoding, dtype=str, chunksize=chunk_size, keep_default_na=False)
+    for chunk in reader:
+        renamed = chunk.rename(columns=_register_columns(chunk.columns))
+        yield _finish(renamed.loc[:, ~renamed.columns.duplicated()].copy())
+
+
+# ---------------------------------------------------------------- staging
+def _source_kind(path: Path) -> str | None:
+    suffix = path.suffix.lower()
+    if suffix in FOOTPRINT_SUFFIXES:
+        return "footprint"
+    if suffix in REGISTER_SUFFIXES:
+        return "register"
+    return None
+
+
+def stage_source(path: Path, staged: Path, kind: str, *, chunk_size: int, transformer=None) -> tuple[int, list[str]]:
+    """원본 파일 하나 → staging parquet (chunk 단위로 써서 메모리는 chunk 크기만큼만)."""
+    tmp = staged.with_suffix(".tmp")
+    rows = 0
+    sigungu: set[str] = set()
+    with pq.ParquetWriter(tmp, STAGING_SCHEMA, compression="zstd") as writer:
+        if kind == "footprint":
+            tables = (footprint_chunk(c, transformer=transformer) for c in _chunks(_iter_features(path), chunk_size))
+        else:
+            tables = register_chunks(path, chunk_size)
+        for table in tables:
+            writer.write_table(table)
+            rows += table.num_rows
+            sigungu.update(table.column(PARTITION_KEY).unique().to_pylist())
+    os.replace(tmp, staged)
+    return rows, sorted(sigungu)
+
+
+# ---------------------------------------------------------------- merge
+def _part1by1(v: np.ndarray) -> np.ndarray:
+    v = v & 0xFFFF
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def zorder_key(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """위경도 Z-order(Morton) 키. 인접한 건물이 같은 row group에 모이도록 정렬할 때 사용."""
+    qy = np.clip((np.asarray(lat) - 33.0) / 6.0 * 65535, 0, 65535).astype(np.uint64)
+    qx = np.clip((np.asarray(lon) - 124.0) / 8.0 * 65535, 0, 65535).astype(np.uint64)
+    return (_part1by1(qy) << np.uint64(1)) | _part1by1(qx)
+
+
+def _read_partition(files: list[Path], code: str) -> pd.DataFrame:
+    if not files:
+        return pd.DataFrame(columns=STAGING_SCHEMA.names)
+    dataset = ds.dataset([str(f) for f in files], schema=STAGING_SCHEMA, format="parquet")
+    return dataset.to_table(filter=ds.field(PARTITION_KEY) == code).to_pandas()
+
+
+def merge_partition(
+    footprint_files: list[Path], register_files: list[Path], code: str, *, alpha: float, beta: float
+) -> pd.DataFrame:
+    fp = _read_partition(footprint_files, code)
+    reg = _read_partition(register_files, code)
+    reg = reg[reg["building_id"].notna()].drop_duplicates("building_id", keep="last")
+
+    keyed = fp["building_id"].notna()
+    fp = pd.concat([fp[keyed].drop_duplicates("building_id", keep="last"), fp[~keyed]], ignore_index=True)
+    merged = fp.merge(reg, on="building_id", how="left", suffixes=("", "_reg"))
+    for col in STAGING_SCHEMA.names:
+        if col != "building_id" and f"{col}_reg" in merged.columns:
+            merged[col] = merged[col].combine_first(merged.pop(f"{col}_reg"))
+
+    # footprint가 없지만 대장에 좌표가 있는 건물
+    extra = reg[~reg["building_id"].isin(fp["building_id"]) & reg["lat"].notna() & reg["lon"].notna()]
+    out = pd.concat([merged, extra], ignore_index=True)
+    out = out[out["lat"].notna() & out["lon"].notna()]
+    order = np.argsort(zorder_key(out["lat"].to_numpy(), out["lon"].to_numpy()), kind="stable")
+    out = out.iloc[order].reset_index(drop=True)
+    out["ground_floors"] = out["ground_floors"].round().astype("Int32")
+    return with_roof_areas(out, alpha=alpha, beta=beta)[BUILDINGS_COLUMNS]
+
+
+def _partition_bbox(df: pd.DataFrame) -> list[float]:
+    """대표점과 footprint 꼭짓점을 모두 덮는 bbox [min_lon, min_lat, max_lon, max_lat]."""
+    coords, _, _ = decode_many(df["footprint"].dropna())
+    xs = np.concatenate([df["lon"].to_numpy(dtype=float), coords[:, 0]])
+    ys = np.concatenate([df["lat"].to_numpy(dtype=float), coords[:, 1]])
+    return [float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())]
+
+
+def write_partition(df: pd.DataFrame, out_dir: Path, code: str, *, row_group_size: int) -> None:
+    part_dir = out_dir / f"{PARTITION_KEY}={code}"
+    if df.empty:
+        shutil.rmtree(part_dir, ignore_errors=True)
+        return
+    part_dir.mkdir(parents=True, exist_ok=True)
+    tmp = part_dir / "part-0.parquet.tmp"
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        # 파티션 안에서 값이 모두 결측인 컬럼도 null 타입 대신 원래 타입으로 (파티션끼리 타입이 다르면 dataset 조회 실패)
+        if pa.types.is_null(field.type) and field.name in STAGING_SCHEMA.names:
+            typ = STAGING_SCHEMA.field(field.name).type
+            table = table.set_column(i, pa.field(field.name, typ), table.column(i).cast(typ))
+    pq.write_table(
+        table,
+        tmp,
+        row_group_size=row_group_size,
+        compression="zstd",
+        write_statistics=True,
+    )
+    os.replace(tmp, part_dir / "part-0.parquet")
+
+
+def write_suggest_index(out_dir: Path) -> int:
+    """파티션 테이블의 name/address 컬럼만 읽어 자동완성 색인을 만듭니다. 반환: 건물 수."""
+    partitioning = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+    dataset = ds.dataset(out_dir, format="parquet", partitioning=partitioning, exclude_invalid_files=True)
+    table = dataset.to_table(columns=["name", "address"], filter=ds.field("address").is_valid())
+    names = [name or None for name in table.column("name").to_pylist()]
+    BuildingSuggestIndex.build(names, table.column("address").to_pylist()).save(buildings_suggest_path(out_dir))
+    return table.num_rows
+
+
+def _write_partitions(
+    out_dir: Path, codes: Iterable[str], index: dict, files: dict[str, list[Path]], *, row_group_size: int
+) -> None:
+    """codes 파티션을 다시 만들고 _partitions.json(index)을 마지막에 갱신 (loaders는 이 파일로 테이블 버전을 봄)."""
+    alpha, beta = roof_coefficients()
+    for code in sorted(codes):
+        df = merge_partition(files["footprint"], files["register"], code, alpha=alpha, beta=beta)
+        write_partition(df, out_dir, code, row_group_size=row_group_size)
+        if df.empty:
+            index.pop(code, None)
+        else:
+            index[code] = {"rows": len(df), "bbox": _partition_bbox(df)}
+    _dump_json(out_dir / PARTITION_INDEX, index)
+
+
+# ---------------------------------------------------------------- pipeline
+def _load_json(path: Path) -> dict:
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {}
+
+
+def _dump_json(path: Path, data: dict) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def run(
+    raw_dir: Path,
+    out_dir: Path,
+    staging_dir: Path,
+    *,
+    full: bool = False,
+    source_crs: str | None = None,
+    chunk_size: int = 50_000,
+    row_group_size: int = 16_384,
+) -> dict[str, Any]:
+    """ETL 실행. 반환: {"staged": [...], "removed": [...], "partitions": [...]} (다시 만든 것만)."""
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = staging_dir / "manifest.json"
+    previous: dict[str, dict] = _load_json(manifest_path).get("sources", {})
+    # 예전 단일 parquet 파일 테이블은 파티션 디렉터리로 전체 재생성
+    full = full or (out_dir.exists() and not out_dir.is_dir())
+    manifest: dict[str, dict] = {} if full else dict(previous)
+    transformer = _inverse_transformer(source_crs)
+
+    sources = {
+        str(p.relative_to(raw_dir)): p
+        for p in sorted(raw_dir.rglob("*"))
+        if p.is_file() and _source_kind(p) and p.name.lower() != "readme.md"
+        and p.relative_to(raw_dir).parts[0] not in SKIP_RAW_DIRS
+    }
+    affected: set[str] = set()
+    staged_now: list[str] = []
+
+    removed = [rel for rel in manifest if rel not in sources]
+    for rel in removed:
+        entry = manifest.pop(rel)
+        affected.update(entry["sigungu"])
+        (staging_dir / entry["staged"]).unlink(missing_ok=True)
+
+    for rel, path in sources.items():
+        stat = path.stat()
+        entry = manifest.get(rel)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            continue
+        kind = _source_kind(path)
+        staged_name = f"{kind}-{hashlib.sha1(rel.encode('utf-8')).hexdigest()[:12]}.parquet"
+        rows, sigungu = stage_source(path, staging_dir / staged_name, kind, chunk_size=chunk_size, transformer=transformer)
+        if entry:
+            affected.update(entry["sigungu"])
+        affected.update(sigungu)
+        manifest[rel] = {
+            "kind": kind,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "staged": staged_name,
+            "rows": rows,
+            "sigungu": sigungu,
+        }
+        staged_now.append(rel)
+
+    files = {
+        kind: [staging_dir / e["staged"] for e in manifest.values() if e["kind"] == kind]
+        for kind in ("footprint", "register")
+    }
+    if full:
+        # 전체 재생성은 새 버전 디렉터리에 다 쓴 뒤 링크만 바꿈: 실행 중인 프로세스는 그동안 이전 테이블을 읽고,
+        # 중간에 실패해도 이전 테이블이 그대로 남음 (core.utils.publish)
+        with publish_dir(out_dir) as tmp:
+            _write_partitions(tmp, affected, {}, files, row_group_size=row_group_size)
+        # 이전 manifest에만 있던 staging 파일 정리 (같은 원본은 같은 이름으로 다시 씀)
+        for name in {e["staged"] for e in previous.values()} - {e["staged"] for e in manifest.values()}:
+            (staging_dir / name).unlink(missing_ok=True)
+    else:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        _write_partitions(
+            out_dir, affected, _load_json(out_dir / PARTITION_INDEX), files, row_group_size=row_group_size
+        )
+
+    if affected or not (buildings_suggest_path(out_dir) / META_FILE).is_file():
+        write_suggest_index(out_dir)
+    _dump_json(manifest_path, {"sources": manifest})
+    return {"staged": staged_now, "removed": removed, "partitions": sorted(affected)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--raw", type=Path, default=Path(settings.data_dir) / "raw")
+    parser.add_argument("--out", type=Path, default=buildings_path())
+    parser.add_argument("--staging", type=Path, default=Path(settings.data_dir) / "interim" / "buildings")
+    parser.add_argument("--full", action="store_true", help="manifest를 무시하고 전체 재처리")
+    parser.add_argument("--source-crs", default=None, help="footprint 좌표가 투영좌표일 때 원본 CRS (예: EPSG:5186)")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--row-group-size", type=int, default=16_384)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    report = run(
+        args.raw,
+        args.out,
+        args.staging,
+        full=args.full,
+        source_crs=args.source_crs,
+        chunk_size=args.chunk_size,
+        row_group_size=args.row_group_size,
+    )
+    print(f"staged sources : {len(report['staged'])}  (removed {len(report['removed'])})")
+    print(f"partitions     : {len(report['partitions'])} rebuilt -> {args.out}")
+    print(f"elapsed        : {time.perf_counter() - t0:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+"""Precompute roof / greenable areas in the processed buildings table (α/β 버전 관리).
+
+건물마다
+- roof_area_m2      : 대장에 실측 옥상면적이 있으면 그대로("register"), 없으면 α × footprint 면적("footprint")
+                      또는 footprint가 없을 때 α × 대장 건축면적 building_area_m2("building_area")
+- greenable_area_m2 : β × roof_area_m2
+- roof_version      : 계산에 쓴 α/β (rooftop_service.roof_table_version)
+를 채워 둡니다. 옥상 면적 추정은 이 값을 후보 테이블에서 바로 읽으므로 WFS 호출이 필요 없습니다.
+
+etl.buildings가 파티션을 다시 만들 때도 같은 계산을 적용하므로, 이 명령은 α/β 설정을 바꾼 뒤
+버전이 다른 파티션만 다시 쓰는 용도입니다.
+
+사용법:
+    python -m etl.roof_areas
+    python -m etl.roof_areas --alpha 0.8 --beta 0.55 --full
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.data_access.loaders import buildings_path
+from core.data_access.repositories import PRECOMPUTED_FLOOR_COLUMNS
+from core.services.rooftop_service import roof_coefficients, roof_table_version
+
+
+def with_roof_areas(df: pd.DataFrame, *, alpha: float, beta: float) -> pd.DataFrame:
+    """roof_area_m2 / greenable_area_m2 / roof_area_source / roof_version 컬럼을 (다시) 계산."""
+    df = df.copy()
+    roof = pd.to_numeric(df.get("roof_area_m2"), errors="coerce") if "roof_area_m2" in df else pd.Series(np.nan, index=df.index)
+    source = df["roof_area_source"] if "roof_area_source" in df else pd.Series(pd.NA, index=df.index, dtype="string")
+    # 실측값: 이미 register로 표시됐거나, 출처 표시 없이 원본에서 들어온 roof_area_m2
+    measured = (source == "register").fillna(False) | (source.isna() & roof.notna())
+
+    # 바닥면적: footprint 면적, 없으면 대장 건축면적. 출처 라벨은 실제로 쓴 컬럼 (PRECOMPUTED_FLOOR_COLUMNS)
+    floor = pd.Series(np.nan, index=df.index)
+    floor_source = pd.Series(None, index=df.index, dtype="object")
+    for label, col in PRECOMPUTED_FLOOR_COLUMNS.items():
+        if col in df:
+            values = pd.to_numeric(df[col], errors="coerce")
+            fill = floor.isna() & (values > 0)
+            floor = floor.where(~fill, values)
+            floor_source = floor_source.where(~fill, label)
+
+    df["roof_area_m2"] = roof.where(measured, alpha * floor).clip(lower=0.0)
+    df["roof_area_source"] = pd.Series(np.where(measured, "register", floor_source), index=df.index, dtype="string")
+    df["greenable_area_m2"] = beta * df["roof_area_m2"]
+    df["roof_version"] = pd.Series(roof_table_version(alpha, beta), index=df.index, dtype="string")
+    return df
+
+
+def _table_files(path: Path) -> list[Path]:
+    if path.is_dir():
+        return sorted(path.rglob("*.parquet"))
+    return [path] if path.exists() else []
+
+
+def _current_versions(path: Path) -> set[Any]:
+    schema = pq.read_schema(path)
+    if "roof_version" not in schema.names:
+        return {None}
+    return set(pq.read_table(path, columns=["roof_version"]).column(0).unique().to_pylist())
+
+
+def run(
+    path: Path | None = None, *, alpha: float | None = None, beta: float | None = None, full: bool = False
+) -> dict[str, Any]:
+    """버전이 다른 parquet 파일만 다시 씁니다. 반환: {"version", "updated": [...], "skipped": n}."""
+    default_alpha, default_beta = roof_coefficients()
+    alpha = default_alpha if alpha is None else alpha
+    beta = default_beta if beta is None else beta
+    version = roof_table_version(alpha, beta)
+    path = path or buildings_path()
+
+    updated: list[str] = []
+    skipped = 0
+    for file in _table_files(path):
+        if not full and _current_versions(file) == {version}:
+            skipped += 1
+            continue
+        parquet = pq.ParquetFile(file)
+        row_group_size = parquet.metadata.row_group(0).num_rows if parquet.metadata.num_row_groups else None
+        df = with_roof_areas(parquet.read().to_pandas(), alpha=alpha, beta=beta)
+        tmp = file.with_suffix(".parquet.tmp")
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False),
+            tmp,
+            row_group_size=row_group_size,
+            compression="zstd",
+            write_statistics=True,
+        )
+        os.replace(tmp, file)
+        updated.append(str(file.relative_to(path)) if path.is_dir() else file.name)
+    return {"version": version, "updated": updated, "skipped": skipped}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", type=Path, default=buildings_path())
+    parser.add_argument("--alpha", type=float, default=None, help="기본값: settings의 α")
+    parser.add_argument("--beta", type=float, default=None, help="기본값: settings의 β")
+    parser.add_argument("--full", action="store_true", help="버전이 같아도 전체 재계산")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    report = run(args.path, alpha=args.alpha, beta=args.beta, full=args.full)
+    print(f"version : {report['version']}")
+    print(f"files   : {len(report['updated'])} updated, {report['skipped']} up to date")
+    print(f"elapsed : {time.perf_counter() - t0:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
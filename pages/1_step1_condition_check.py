@@ -4,6 +4,7 @@ from components.common.footer import render_footer
 from components.common.header import render_header
 from core.services.analyze_service import AnalyzeService
 from core.state import get_state, set_state
+from core.utils.tracing import trace
 from ui.area_confirm_ui import render_area_confirm_ui
 
 st.set_page_config(page_title="면적확인 | 옥상이몽", page_icon="📐", layout="wide")
@@ -20,7 +21,8 @@ if not loc:
     st.stop()
 
 svc = AnalyzeService()
-estimate = svc.estimate_rooftop_area(loc)
+with trace("page.step1"):
+    estimate = svc.estimate_rooftop_area(loc)
 
 suggested_area = estimate.roof_area_m2_suggested
 
@@ -34,29 +36,31 @@ address_title = loc.get("input_address") or "선택한 주소"
 address_caption = loc.get("normalized_address") or address_title
 
 
-ui_state = render_area_confirm_ui(
-    address_title=address_title,
-    address_caption=address_caption,
-    floor_area=floor_area,
-    suggested_area=suggested_area,
-    availability_ratio=availability_ratio,
-    default_area=default_area,
-)
-
-if ui_state["apply_clicked"]:
+def apply_area(raw_value: str) -> None:
+    # 면적 입력 fragment 안에서 호출됩니다 (페이지 전체 rerun 없이 검증/저장)
     try:
-        parsed_area = float(ui_state["roof_area_value"].replace(",", "")) if ui_state["roof_area_value"] else 0.0
+        parsed_area = float(raw_value.replace(",", "")) if raw_value else 0.0
     except ValueError:
         parsed_area = -1
-        
+
     if parsed_area <= 0:
         st.error("유효한 면적 값을 입력해주세요.")
     else:
         svc.confirm_area(parsed_area)
         set_state("roof_area_m2_confirmed", parsed_area)
         st.success("면적 값을 적용했습니다.")
-        
-        
+
+
+ui_state = render_area_confirm_ui(
+    address_title=address_title,
+    address_caption=address_caption,
+    floor_area=floor_area,
+    suggested_area=suggested_area,
+    availability_ratio=availability_ratio,
+    default_area=default_area,
+    on_apply=apply_area,
+)
+
 if ui_state["prev_clicked"]:
     st.switch_page("app.py")
 
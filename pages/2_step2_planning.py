@@ -4,8 +4,8 @@ from components.common.footer import render_footer
 from components.common.header import render_header
 from core.models import ScenarioInput
 from core.services.analyze_service import AnalyzeService
-from core.services.scenario_service import ScenarioService
 from core.state import get_state, set_state
+from core.utils.tracing import trace
 from ui.planning_ui import render_planning_ui
 
 st.set_page_config(page_title="녹화계획 | 옥상이몽", page_icon="🌿", layout="wide")
@@ -32,17 +32,23 @@ active_type = st.session_state.get("planning_selected_type", default_type)
 slider_default = int(round(default_ratio * 100))
 active_ratio = (st.session_state.get("planning_slider", slider_default) or 0) / 100
 
-scenario_service = ScenarioService()
-preview_scenario = ScenarioInput(greening_type=active_type, coverage_ratio=active_ratio)
-preview_result = scenario_service.compute(roof_area_m2=roof_area, scenario=preview_scenario)
+svc = AnalyzeService()
+
+
+def preview(greening_type: str, ratio: float):
+    # 유형/슬라이더 변경 시 planning fragment 안에서만 다시 계산됩니다
+    with trace("page.step2.preview"):
+        return svc.scenario.compute(
+            roof_area_m2=roof_area,
+            scenario=ScenarioInput(greening_type=greening_type, coverage_ratio=ratio),
+        )
+
 
 ui_state = render_planning_ui(
     roof_area=roof_area,
     selected_type=active_type,
     coverage_ratio=active_ratio,
-    green_area_m2=preview_result.green_area_m2,
-    co2_absorption_kg=preview_result.co2_absorption_kg_per_year,
-    temp_reduction_c=preview_result.temp_reduction_c,
+    preview=preview,
 )
 
 selected_type = ui_state["selected_type"]
@@ -50,8 +56,6 @@ coverage_ratio = ui_state["coverage_ratio"]
 
 scenario = ScenarioInput(greening_type=selected_type, coverage_ratio=coverage_ratio)
 
-svc = AnalyzeService()
-
 if ui_state["save_clicked"]:
     svc.set_scenario(scenario)
     set_state("scenario", scenario.model_dump())
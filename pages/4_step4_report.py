@@ -4,7 +4,7 @@ from components.common.footer import render_footer
 from components.common.header import render_header
 from core.models import SimulationResult
 from core.services.analyze_service import AnalyzeService
-from core.state import get_state
+from core.state import get_state, set_state
 from ui.report_ui import render_report_ui
 
 st.set_page_config(page_title="리포트 | 옥상이몽", page_icon="📄", layout="wide")
@@ -51,7 +51,20 @@ if actions.get("home_clicked"):
     st.switch_page("app.py")
 
 if actions.get("share_image_clicked"):
-    st.toast("이미지 저장 기능은 준비 중입니다.")
+    # 다운로드 버튼을 누르면 다시 실행되므로 미리보기 표시 여부는 상태에 남김
+    set_state("share_image_open", True)
+
+if state.get("share_image_open"):
+    image_bytes, image_filename = svc.export_image()
+    st.image(image_bytes, use_container_width=True)
+    st.download_button(
+        "🖼️ 요약 이미지 다운로드",
+        data=image_bytes,
+        file_name=image_filename,
+        mime="image/png",
+        key="report_image_download",
+        use_container_width=True,
+    )
 
 if actions.get("share_link_clicked"):
     st.toast("링크 공유 기능은 곧 제공될 예정입니다.")
@@ -0,0 +1,4 @@
+"""HTTP API (FastAPI).
+
+실행 예) uvicorn server.main:app --host 0.0.0.0 --port 8000
+"""
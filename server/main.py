@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import math
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+from fastapi import FastAPI, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from core.config import settings
+from core.exceptions import (
+    AddressNotFoundError,
+    BuildingNotFoundError,
+    InvalidScenarioError,
+    OkssangimongError,
+    QuotaExceededError,
+    RooftopAreaUnavailableError,
+    UpstreamUnavailableError,
+)
+from core.models import (
+    AddressSuggestion,
+    BuildingCandidate,
+    LocationResult,
+    RooftopAreaEstimate,
+    ScenarioInput,
+    SimulationResult,
+)
+from core.services.container import get_services
+from core.utils import metrics
+from core.utils.tracing import trace
+from server.schemas import ErrorResponse, GeocodeRequest, ReportKind, ScenarioRequest
+
+REPORT_CONTENT_TYPES: dict[str, str] = {
+    "pdf": "application/pdf",
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "image": "image/png",
+}
+
+ERROR_STATUS: dict[type[OkssangimongError], int] = {
+    AddressNotFoundError: 404,
+    BuildingNotFoundError: 404,
+    RooftopAreaUnavailableError: 404,
+    InvalidScenarioError: 422,
+    UpstreamUnavailableError: 503,
+    QuotaExceededError: 503,  # 서비스가 감싸지 않고 올라온 경우 (예: WFS)
+}
+# 도메인 오류 응답 본문 (_domain_error_handler) — OpenAPI 문서에 노출. 422는 FastAPI 입력 검증 스키마를 그대로 둠
+ERROR_RESPONSES: dict[int | str, dict] = {code: {"model": ErrorResponse} for code in (400, 404)}
+ERROR_RESPONSES[503] = {
+    "model": ErrorResponse,
+    "description": "외부 API 호출 한도 초과/연결 실패. 잠시 후 다시 시도",
+    "headers": {"Retry-After": {"description": "다시 시도할 때까지 기다릴 초", "schema": {"type": "integer"}}},
+}
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # core 서비스는 동기(requests/reportlab)이므로 스레드풀에서 실행합니다.
+    # 기본 40개 제한을 늘려 한 프로세스가 수백 개의 동시 요청을 받을 수 있게 합니다.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.api_max_concurrency
+    # 커넥션 풀/캐시를 가진 공유 서비스를 미리 만들어 둠 (첫 요청 지연 방지)
+    services = get_services()
+    # 자동완성 색인도 미리 만들어 둬야 /autocomplete를 이벤트 루프에서 바로 처리할 수 있음
+    await run_in_threadpool(lambda: services.autocomplete)
+    yield
+
+
+app = FastAPI(title="옥상이몽 API", version=settings.engine_version, lifespan=lifespan)
+
+
+@app.middleware("http")
+async def _trace_request(request: Request, call_next):
+    # 요청 하나를 Trace로 묶고 단계별 소요 시간을 Server-Timing 헤더로 노출 (브라우저 devtools에서 확인 가능)
+    # run_in_threadpool은 contextvars를 복사하므로 스레드풀에서 끝난 span도 이 Trace에 모입니다.
+    metrics.HTTP_IN_FLIGHT.inc()
+    try:
+        with trace(f"{request.method} {request.url.path}") as t:
+            response = await call_next(request)
+    finally:
+        metrics.HTTP_IN_FLIGHT.dec()
+    totals: dict[str, float] = {}
+    for name, _depth, ms in t.stages():
+        totals[name] = totals.get(name, 0.0) + ms
+    timings = [f"{name};dur={ms:.1f}" for name, ms in totals.items()]
+    timings.append(f"total;dur={t.duration_ns / 1e6:.1f}")
+    response.headers["Server-Timing"] = ", ".join(timings)
+    return response
+
+
+@app.exception_handler(OkssangimongError)
+async def _domain_error_handler(_: Request, exc: OkssangimongError) -> JSONResponse:
+    status = next((code for cls, code in ERROR_STATUS.items() if isinstance(exc, cls)), 400)
+    body = ErrorResponse(error=type(exc).__name__, detail=str(exc))
+    headers = {}
+    retry_after = getattr(exc, "retry_after_s", None)
+    if retry_after is not None:
+        headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return JSONResponse(status_code=status, content=body.model_dump(), headers=headers)
+
+
+@app.get("/health")
+async def health() -> dict:
+    return {"status": "ok", "engine_version": settings.engine_version}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.post("/geocode", response_model=LocationResult, responses=ERROR_RESPONSES)
+async def geocode(body: GeocodeRequest) -> LocationResult:
+    return await run_in_threadpool(get_services().geocoding.geocode, body.address)
+
+
+@app.get("/autocomplete", response_model=list[AddressSuggestion])
+async def autocomplete(q: str = Query(..., max_length=200), k: int = Query(8, ge=1, le=20)) -> list[AddressSuggestion]:
+    # 키 입력마다 호출되는 ms 미만 조회 → 스레드 전환 없이 이벤트 루프에서 바로 실행
+    return get_services().autocomplete.suggest(q, k)
+
+
+@app.get("/candidates", response_model=list[BuildingCandidate], responses=ERROR_RESPONSES)
+async def candidates(lat: float = Query(...), lon: float = Query(...)) -> list[BuildingCandidate]:
+    return await run_in_threadpool(get_services().buildings.find_candidates, lat, lon)
+
+
+@app.get("/rooftop/estimate", response_model=RooftopAreaEstimate, responses=ERROR_RESPONSES)
+async def rooftop_estimate(lat: float = Query(...), lon: float = Query(...)) -> RooftopAreaEstimate:
+    return await run_in_threadpool(get_services().estimate_rooftop_area, lat, lon)
+
+
+@app.post("/scenario/compute", response_model=SimulationResult, responses=ERROR_RESPONSES)
+async def scenario_compute(body: ScenarioRequest) -> SimulationResult:
+    scenario = ScenarioInput(greening_type=body.greening_type, coverage_ratio=body.coverage_ratio)
+    # 순수 계산이라 스레드 전환 비용이 더 큼 → 이벤트 루프에서 바로 실행
+    return get_services().scenario.compute(roof_area_m2=body.roof_area_m2, scenario=scenario)
+
+
+@app.post("/report/{kind}", responses=ERROR_RESPONSES)
+async def report_export(kind: ReportKind, result: SimulationResult) -> Response:
+    report = get_services().report
+    builders = {"pdf": report.build_pdf, "excel": report.build_excel, "image": report.build_image}
+    data, filename = await run_in_threadpool(builders[kind], result)
+    return Response(
+        content=data,
+        media_type=REPORT_CONTENT_TYPES[kind],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
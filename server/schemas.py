@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from core.models import ScenarioInput
+
+
+class GeocodeRequest(BaseModel):
+    address: str = Field(min_length=1)
+
+
+class ScenarioRequest(ScenarioInput):
+    roof_area_m2: float = Field(gt=0)
+
+
+ReportKind = Literal["pdf", "excel", "image"]
+
+
+class ErrorResponse(BaseModel):
+    error: str
+    detail: str
@@ -6,3 +6,19 @@ def test_scenario_compute_runs():
     res = svc.compute(roof_area_m2=1000.0, scenario=ScenarioInput(greening_type="sedum", coverage_ratio=0.5))
     assert res.green_area_m2 == 500.0
     assert res.co2_absorption_kg_per_year > 0
+
+
+def test_footprint_miss_is_cached_briefly(monkeypatch):
+    from dataclasses import replace
+
+    import api.vworld_wfs
+    from core.services import rooftop_service
+
+    calls = []
+    monkeypatch.setattr(rooftop_service, "settings", replace(rooftop_service.settings, vworld_api_key="k"))
+    monkeypatch.setattr(api.vworld_wfs, "get_building_footprint", lambda *a, **kw: calls.append(a))
+    svc = rooftop_service.RooftopService()
+    for _ in range(3):
+        assert svc.footprint_bytes(37.5, 127.0) is None
+        assert svc.cached_footprint_bytes(37.5, 127.0) is None
+    assert len(calls) == 1
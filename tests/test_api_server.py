@@ -0,0 +1,71 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from server.main import app
+
+
+def test_scenario_compute_and_image_report():
+    with TestClient(app) as client:
+        res = client.post(
+            "/scenario/compute",
+            json={"roof_area_m2": 1000.0, "greening_type": "sedum", "coverage_ratio": 0.5},
+        )
+        assert res.status_code == 200
+        result = res.json()
+        assert result["green_area_m2"] == 500.0
+
+        img = client.post("/report/image", json=result)
+        assert img.status_code == 200
+        assert img.headers["content-type"] == "image/png"
+        assert "report.image;dur=" in img.headers["server-timing"]
+
+        text = client.get("/metrics").text
+        assert 'okssangimong_report_bytes_count{kind="image"}' in text
+
+
+def test_invalid_scenario_is_422():
+    with TestClient(app) as client:
+        res = client.post(
+            "/scenario/compute",
+            json={"roof_area_m2": 1000.0, "greening_type": "moss", "coverage_ratio": 0.5},
+        )
+        assert res.status_code == 422
+        schema = client.get("/openapi.json").json()
+        assert "ErrorResponse" in schema["components"]["schemas"]
+
+
+def test_autocomplete_suggests_sample_building():
+    with TestClient(app) as client:
+        res = client.get("/autocomplete", params={"q": "Sejong"})
+        assert res.status_code == 200
+        assert res.json()[0]["address"] == "110 Sejong-daero"
+
+
+def test_quota_exhaustion_is_503_with_retry_after():
+    from core.exceptions import QuotaExceededError
+    from core.services.container import get_services
+    from core.services.geocoding_service import GeocodingService
+
+    class _Throttled:
+        name = "kakao"
+
+        def geocode(self, address):
+            raise QuotaExceededError("kakao", retry_after_s=2.5)
+
+    with TestClient(app) as client:
+        services = get_services()
+        previous = services._instances.get("geocoding")
+        services._instances["geocoding"] = GeocodingService(provider=_Throttled())
+        try:
+            res = client.post("/geocode", json={"address": "서울특별시 중구 세종대로 110"})
+        finally:
+            services._instances["geocoding"] = previous
+        assert res.status_code == 503 and res.headers["retry-after"] == "3"
+        assert res.json()["error"] == "UpstreamUnavailableError"
+        doc = client.get("/openapi.json").json()["paths"]["/geocode"]["post"]["responses"]
+        assert "Retry-After" in doc["503"]["headers"]
+
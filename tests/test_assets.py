@@ -0,0 +1,31 @@
+from components.common.assets import load_css, minify_css, minify_html, prune_css
+
+
+def test_minify_css_keeps_value_spacing():
+    css = """
+    /* comment */
+    .a , .b > .c {
+        width: calc(100% - 20px);
+        font-family: "Noto Sans KR", sans-serif;
+    }
+    """
+    assert minify_css(css) == '.a,.b>.c{width:calc(100% - 20px);font-family:"Noto Sans KR",sans-serif}'
+
+
+def test_prune_unused_css_only_in_self_contained_fragments():
+    html = '<style>*{margin:0} .used{color:red} .unused{color:blue} @media (max-width:1px){.unused{x:y}}</style><div class="used">x</div>'
+    pruned = minify_html(html, prune_unused_css=True)
+    assert ".unused" not in pruned and ".used{color:red}" in pruned and "*{margin:0}" in pruned
+    assert ".unused" in minify_html(html)
+
+
+def test_prune_css_respects_functional_pseudo_classes():
+    css = ".x:not(.unused){a:b} :is(.x,.gone) p{c:d} .gone:not(.x){e:f} [data-k=\"a,b\"],.gone{g:h}"
+    assert prune_css(css, {"x"}) == '.x:not(.unused){a:b}:is(.x,.gone) p{c:d}[data-k="a,b"]{g:h}'
+
+
+def test_load_css_is_cached_and_fingerprinted():
+    asset = load_css("index.css")
+    assert asset is load_css("index.css")
+    assert len(asset.fingerprint) == 12 and asset.size <= asset.raw_size
+    assert prune_css(asset.content, set()).startswith("*{")
@@ -0,0 +1,53 @@
+import time
+
+import pandas as pd
+
+from core.data_access.address_index import AddressIndex, write_address_index
+from core.services.autocomplete_service import AutocompleteService
+from core.utils.prefix_index import PrefixIndex, entry_keys
+
+
+def test_prefix_index_matches_token_boundaries_in_short_first_order():
+    assert entry_keys("서울특별시 중구 세종대로 110") == ["서울중구세종대로110", "중구세종대로110", "세종대로110"]
+    index = PrefixIndex.build(["서울특별시 중구 세종대로 110", "서울시청", "서울특별시 중구 세종대로 11", None])
+    assert index.search("세종대로 11") == [2, 0]
+    assert index.search("서울시 중구") == [2, 0]  # 시도 약칭 정규화
+    assert index.search("서울시청") == [1]
+    assert index.search("서울", limit=1) == [1]
+    assert index.search("부산") == [] and index.search(" ") == []
+
+    # 사전 순으로는 긴 키("서울가나다라마바사")가 앞서도 짧은 이어짐("서울나")이 먼저
+    index = PrefixIndex.build(["서울 가나다라마바사", "서울 나"])
+    assert index.search("서울", limit=1) == [1] and index.search("서울") == [1, 0]
+
+
+def test_autocomplete_merges_buildings_and_address_index(tmp_path):
+    rows = pd.DataFrame(
+        {
+            "sido": ["서울", "서울", "부산"],
+            "sigungu": ["중구", "중구", "해운대구"],
+            "road": ["세종대로", "세종대로", "센텀중앙로"],
+            "main": [110, 11, 5],
+            "sub": [0, 0, 0],
+            "underground": [False, False, False],
+            "lat": [37.5663, 37.5650, 35.17],
+            "lon": [126.9779, 126.9770, 129.13],
+            "address": ["서울특별시 중구 세종대로 110", "서울특별시 중구 세종대로 11", "부산광역시 해운대구 센텀중앙로 5"],
+        }
+    )
+    write_address_index(rows, tmp_path / "index")
+    buildings = pd.DataFrame({"name": ["서울시청", None], "address": ["서울특별시 중구 세종대로 110", None]})
+    svc = AutocompleteService.from_frame(buildings, AddressIndex(tmp_path / "index"))
+
+    assert [(s.source, s.label) for s in svc.suggest("서울시청")] == [
+        ("building", "서울시청 · 서울특별시 중구 세종대로 110")
+    ]
+    # 건물 주소와 같은 도로명주소는 한 번만
+    assert [s.address for s in svc.suggest("세종대로 1")] == ["서울특별시 중구 세종대로 110", "서울특별시 중구 세종대로 11"]
+    assert [s.address for s in svc.suggest("해운대구 센텀")] == ["부산광역시 해운대구 센텀중앙로 5"]
+    assert svc.suggest("서") == []  # 두 글자 미만은 조회하지 않음
+
+    start = time.perf_counter()
+    for _ in range(200):
+        svc.suggest("서울 중구 세종")
+    assert (time.perf_counter() - start) / 200 < 0.005
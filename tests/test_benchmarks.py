@@ -0,0 +1,34 @@
+from benchmarks.suite import Result, _box_deg, _ORIGIN, compare, synthetic_buildings_table, use_buildings_table
+from core.data_access.repositories import find_nearby_buildings
+
+
+def test_compare_flags_only_slowdowns_over_threshold():
+    baselines = {"results": {"a": {"median_s": 1.0, "min_s": 1.0}, "b": {"median_s": 1.0, "min_s": 1.0}}}
+    # 중앙값이 튀어도 최솟값이 그대로면 회귀가 아님
+    results = [Result("a", 3.0, 1.2, 1), Result("b", 2.0, 2.0, 1), Result("new", 5.0, 5.0, 1)]
+    flagged = [(r.name, ratio, bad) for r, ratio, bad in compare(results, baselines, threshold=1.5)]
+    assert flagged == [("a", 1.2, False), ("b", 2.0, True), ("new", None, False)]
+
+
+def test_synthetic_table_is_queryable(tmp_path):
+    path = synthetic_buildings_table(1_000, root=tmp_path)
+    dlat, dlon = _box_deg(1_000)
+    with use_buildings_table(path):
+        found = find_nearby_buildings(_ORIGIN[0] + dlat / 2, _ORIGIN[1] + dlon / 2, radius_m=200.0)
+    assert found and all(c.distance_m <= 200.0 for c in found)
+
+
+def test_load_report_percentiles_and_capacity():
+    from benchmarks.load import LoadReport, WorkerReport, max_sustainable, percentile
+
+    assert percentile([0.4, 0.1, 0.2, 0.3, 0.5], 50) == 0.3
+    assert abs(percentile([0.0, 1.0], 95) - 0.95) < 1e-9
+
+    worker = WorkerReport(0, sessions=2, samples={"step": [0.1, 0.2, 0.9]}, cpu_s=1.0, actions=20)
+    small = LoadReport(users=2, procs=1, workers=[worker])
+    # 세션당 CPU 0.5초, 동작 10번 × 체류 1초 → (0.5 + 10) / 0.5
+    assert small.sessions_per_core(think_s=1.0) == 21.0
+
+    slow = LoadReport(users=8, procs=1, workers=[WorkerReport(0, sessions=8, samples={"step": [3.0]}, cpu_s=4.0)])
+    assert max_sustainable([small, slow], slo_s=1.0) is small
+    assert max_sustainable([slow], slo_s=1.0) is None
@@ -0,0 +1,243 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from core.data_access.building_suggest import BuildingSuggestIndex, buildings_suggest_path
+from etl.buildings import run
+
+
+def _square(lon, lat, d=0.0005):
+    return [[[lon, lat], [lon + d, lat], [lon + d, lat + d], [lon, lat + d], [lon, lat]]]
+
+
+def _write_raw(raw):
+    raw.mkdir()
+    features = [
+        {"geometry": {"type": "Polygon", "coordinates": _square(126.978, 37.566)}, "properties": {"BD_MGT_SN": "1114010300100010000000001"}},
+        # 위경도 순서가 뒤집힌 좌표
+        {"geometry": {"type": "Polygon", "coordinates": [[[y, x] for x, y in _square(126.979, 37.567)[0]]]}, "properties": {"bd_mgt_sn": "1114010300100020000000001"}},
+        {"geometry": {"type": "Polygon", "coordinates": _square(129.075, 35.180)}, "properties": {"bd_mgt_sn": "2635010500100010000000001", "bld_nm": "부산 건물"}},
+    ]
+    (raw / "footprints.geojsonl").write_text("\n".join(json.dumps(f, ensure_ascii=False) for f in features), encoding="utf-8")
+    (raw / "register.txt").write_text(
+        "건물관리번호|건물명|도로명대지위치|지상층수|위도|경도\n"
+        "1114010300100010000000001|시청|세종대로 110|13||\n"
+        "1114010300100090000000001|좌표만 있는 건물|세종대로 1|2|37.5700|126.9770\n",
+        encoding="cp949",
+    )
+
+
+def test_etl_builds_partitions_and_reprocesses_only_changed_sources(tmp_path):
+    raw, out, staging = tmp_path / "raw", tmp_path / "buildings.parquet", tmp_path / "staging"
+    _write_raw(raw)
+
+    report = run(raw, out, staging, chunk_size=2, row_group_size=2)
+    assert sorted(report["partitions"]) == ["11140", "26350"]
+
+    df = pd.read_parquet(out).sort_values("building_id").reset_index(drop=True)
+    assert len(df) == 4
+    city_hall = df[df["building_id"] == "1114010300100010000000001"].iloc[0]
+    assert (city_hall["name"], city_hall["ground_floors"]) == ("시청", 13)
+    assert city_hall["footprint_area_m2"] == pytest.approx(2450, rel=0.02)
+    assert df["lat"].between(35, 38).all() and df["lon"].between(126, 130).all()
+    assert json.loads((out / "_partitions.json").read_text())["26350"]["rows"] == 1
+    suggest = BuildingSuggestIndex.load(buildings_suggest_path(out))
+    assert suggest.search("시청") == [("시청", "세종대로 110")]
+
+    assert run(raw, out, staging) == {"staged": [], "removed": [], "partitions": []}
+
+    busan = raw / "footprints.geojsonl"
+    busan.write_text(busan.read_text(encoding="utf-8").replace("부산 건물", "부산 빌딩"), encoding="utf-8")
+    os.utime(busan, ns=(1, 1))
+    report = run(raw, out, staging)
+    assert report["staged"] == ["footprints.geojsonl"]
+    assert "부산 빌딩" in set(pd.read_parquet(out)["name"].dropna())
+
+
+def test_bbox_query_reads_only_matching_partitions(tmp_path, monkeypatch):
+    from core.data_access import loaders
+    from core.data_access.repositories import find_nearby_buildings
+
+    raw, out = tmp_path / "raw", tmp_path / "buildings.parquet"
+    _write_raw(raw)
+    run(raw, out, tmp_path / "staging")
+    monkeypatch.setattr(loaders, "buildings_path", lambda: out)
+    try:
+        busan = loaders.query_buildings_bbox(35.0, 129.0, 35.3, 129.2)
+        assert list(busan["name"]) == ["부산 건물"] and set(busan["sigungu_cd"]) == {"26350"}
+        assert loaders.query_buildings_bbox(33.0, 124.0, 33.1, 124.1).empty
+
+        (nearest, *_) = find_nearby_buildings(37.56625, 126.97825, radius_m=200)
+        assert (nearest.building_id, nearest.name) == ("1114010300100010000000001", "시청")
+        assert nearest.extra["roof_area_source"] == "footprint"
+        assert nearest.extra["roof_area_m2"] == pytest.approx(nearest.extra["footprint_area_m2"])
+    finally:
+        loaders.clear_table_caches()
+
+
+def test_queries_see_rebuilt_table_without_restart(tmp_path, monkeypatch):
+    from core.data_access import loaders
+
+    raw, out, staging = tmp_path / "raw", tmp_path / "buildings.parquet", tmp_path / "staging"
+    _write_raw(raw)
+    run(raw, out, staging)
+    monkeypatch.setattr(loaders, "buildings_path", lambda: out)
+    try:
+        assert loaders.query_buildings_bbox(35.8, 128.5, 35.9, 128.7).empty
+
+        daegu = {"geometry": {"type": "Polygon", "coordinates": _square(128.6, 35.87)}, "properties": {"bd_mgt_sn": "2711010100100010000000001", "bld_nm": "대구 건물"}}
+        (raw / "daegu.geojsonl").write_text(json.dumps(daegu, ensure_ascii=False), encoding="utf-8")
+        os.utime(out / "_partitions.json", ns=(1, 1))  # 같은 ns에 다시 쓰여도 버전이 바뀌도록
+        assert run(raw, out, staging)["partitions"] == ["27110"]
+        # _partitions.json이 바뀌면 캐시한 데이터셋/파티션 bbox를 다시 읽음 (새 파티션도 보임)
+        assert list(loaders.query_buildings_bbox(35.8, 128.5, 35.9, 128.7)["name"]) == ["대구 건물"]
+    finally:
+        loaders.clear_table_caches()
+
+def test_roof_areas_are_versioned_and_used_without_network(tmp_path, monkeypatch):
+    from core.services.rooftop_service import RooftopService, roof_table_version
+    from etl import roof_areas
+
+    raw, out = tmp_path / "raw", tmp_path / "buildings.parquet"
+    _write_raw(raw)
+    run(raw, out, tmp_path / "staging")
+    assert roof_areas.run(out)["updated"] == []
+
+    report = roof_areas.run(out, alpha=0.8, beta=0.5)
+    assert report["version"] == roof_table_version(0.8, 0.5) and len(report["updated"]) == 2
+    df = pd.read_parquet(out).dropna(subset=["footprint_area_m2"])
+    assert list(df["roof_area_m2"]) == pytest.approx(list(0.8 * df["footprint_area_m2"]))
+    assert list(df["greenable_area_m2"]) == pytest.approx(list(0.4 * df["footprint_area_m2"]))
+
+    from core.data_access.repositories import find_nearby_buildings
+    from core.data_access import loaders
+
+    monkeypatch.setattr(loaders, "buildings_path", lambda: out)
+    try:
+        candidates = find_nearby_buildings(37.56625, 126.97825, radius_m=200)
+    finally:
+        loaders.clear_table_caches()
+
+    service = RooftopService()
+    monkeypatch.setattr(service, "get_footprint", lambda lat, lon: pytest.fail("WFS should not be called"))
+    estimate = service.estimate_area(candidates, lat=37.56625, lon=126.97825)
+    floor = candidates[0].extra["footprint_area_m2"]
+    # 테이블 버전(α=0.8)이 현재 설정(α=1.0, β=0.55)과 다르면 footprint로 다시 계산
+    assert estimate.floor_area_m2 == pytest.approx(floor)
+    assert estimate.roof_area_m2_suggested == pytest.approx(0.55 * floor)
+
+
+def test_point_is_matched_to_containing_footprint_not_nearest_centroid(tmp_path, monkeypatch):
+    from core.data_access import loaders
+    from core.services.building_service import BuildingService
+
+    raw, out = tmp_path / "raw", tmp_path / "buildings.parquet"
+    raw.mkdir()
+    long_block = [[[126.970, 37.560], [126.975, 37.560], [126.975, 37.5605], [126.970, 37.5605], [126.970, 37.560]]]
+    kiosk = _square(126.9745, 37.5606, d=0.0001)
+    features = [
+        {"geometry": {"type": "Polygon", "coordinates": long_block}, "properties": {"bd_mgt_sn": "11140-long", "bld_nm": "긴 건물"}},
+        {"geometry": {"type": "Polygon", "coordinates": kiosk}, "properties": {"bd_mgt_sn": "11140-kiosk", "bld_nm": "작은 건물"}},
+    ]
+    (raw / "fp.geojsonl").write_text("\n".join(json.dumps(f, ensure_ascii=False) for f in features), encoding="utf-8")
+    run(raw, out, tmp_path / "staging")
+    monkeypatch.setattr(loaders, "buildings_path", lambda: out)
+    try:
+        service = BuildingService()
+        candidates = service.find_candidates(37.5603, 126.9746)
+        assert [c.name for c in candidates] == ["긴 건물", "작은 건물"]
+        assert service.choose_best(candidates).extra["contains_point"] is True
+        # 한 점 조회는 주변 footprint만 읽음 (시군구 전체 색인을 만들어 두지 않음)
+        assert loaders._footprint_index.cache_info().currsize == 0
+
+        matched = service.match_points([(37.5603, 126.9746), (37.56065, 126.97455), (37.58, 126.99)])
+        assert [m.name if m else None for m in matched] == ["긴 건물", "작은 건물", None]
+    finally:
+        loaders.clear_table_caches()
+
+
+def test_sniff_keeps_utf8_when_head_cuts_a_character(tmp_path):
+    from etl.buildings import _sniff
+
+    header = "건물관리번호|건물명|도로명대지위치\n".encode("utf-8")
+    rest = (1 << 16) - len(header)
+    assert rest % 3  # 64 KB 경계가 한글(3 bytes) 중간에 옴
+    path = tmp_path / "register.txt"
+    path.write_bytes(header + ("가" * (rest // 3 + 1)).encode("utf-8"))
+    assert _sniff(path) == ("utf-8-sig", "|")
+
+
+def test_register_building_area_is_labelled_and_used_as_precomputed_floor(monkeypatch):
+    from core.models import BuildingCandidate
+    from core.services.rooftop_service import RooftopService, roof_table_version
+    from etl.roof_areas import with_roof_areas
+
+    df = with_roof_areas(
+        pd.DataFrame({"footprint_area_m2": [100.0, None], "building_area_m2": [90.0, 200.0]}), alpha=0.8, beta=0.5
+    )
+    assert list(df["roof_area_source"]) == ["footprint", "building_area"]
+    assert list(df["roof_area_m2"]) == pytest.approx([80.0, 160.0])
+
+    # 테이블 버전이 현재 α/β와 달라도 대장 건축면적으로 다시 계산하고 WFS는 부르지 않음
+    row = df.iloc[1]
+    candidate = BuildingCandidate(
+        building_id="b", extra={col: None if pd.isna(row[col]) else row[col] for col in df.columns}
+    )
+    assert candidate.extra["roof_version"] == roof_table_version(0.8, 0.5)
+    service = RooftopService()
+    monkeypatch.setattr(service, "get_footprint", lambda lat, lon: pytest.fail("WFS should not be called"))
+    estimate = service.estimate_area([candidate], lat=37.5, lon=127.0)
+    assert estimate.floor_area_m2 == pytest.approx(200.0)
+    assert estimate.roof_area_m2_suggested == pytest.approx(0.55 * 200.0)
+    assert "건축물대장 건축면적" in estimate.note
+
+
+def test_full_rebuild_swaps_in_a_new_table(tmp_path):
+    raw, out, staging = tmp_path / "raw", tmp_path / "buildings.parquet", tmp_path / "staging"
+    _write_raw(raw)
+    # 예전 레이아웃: 단일 parquet 파일
+    pd.DataFrame({"building_id": ["old"], "lat": [37.0], "lon": [127.0]}).to_parquet(out)
+    run(raw, out, staging)
+    assert out.is_symlink() and len(pd.read_parquet(out)) == 4
+    before = out.resolve()
+
+    (raw / "register.txt").unlink()
+    staged = set(p.name for p in staging.glob("*.parquet"))
+    report = run(raw, out, staging, full=True)
+    assert sorted(report["partitions"]) == ["11140", "26350"]
+    # 이전 버전 디렉터리는 그대로 남아 있다가 새 버전으로 링크만 바뀜
+    assert out.resolve() != before and before.is_dir()
+    assert len(pd.read_parquet(out)) == 3
+    assert set(p.name for p in staging.glob("*.parquet")) < staged  # 없어진 원본의 staging 파일 정리
+
+
+def test_cached_rooftop_estimate_follows_rebuilt_table(tmp_path, monkeypatch):
+    from core.data_access import loaders
+    from core.services.container import ServiceContainer
+    from core.services.rooftop_service import RooftopService
+
+    raw, out, staging = tmp_path / "raw", tmp_path / "buildings.parquet", tmp_path / "staging"
+    _write_raw(raw)
+    run(raw, out, staging)
+    monkeypatch.setattr(loaders, "buildings_path", lambda: out)
+    rooftop = RooftopService()
+    monkeypatch.setattr(rooftop, "get_footprint", lambda lat, lon: pytest.fail("WFS should not be called"))
+    services = ServiceContainer(rooftop=rooftop)
+    try:
+        before = services.estimate_rooftop_area(37.56625, 126.97825).floor_area_m2
+        assert services.estimate_rooftop_area(37.56625, 126.97825).floor_area_m2 == before  # 캐시
+
+        # 시청 footprint를 가로세로 두 배로 바꿔 다시 ETL → 같은 좌표 추정치가 바뀜
+        fp = raw / "footprints.geojsonl"
+        lines = fp.read_text(encoding="utf-8").splitlines()
+        first = json.loads(lines[0])
+        first["geometry"]["coordinates"] = _square(126.978, 37.566, d=0.001)
+        fp.write_text("\n".join([json.dumps(first, ensure_ascii=False), *lines[1:]]), encoding="utf-8")
+        os.utime(out / "_partitions.json", ns=(1, 1))
+        run(raw, out, staging)
+        assert services.estimate_rooftop_area(37.56625, 126.97825).floor_area_m2 == pytest.approx(4 * before, rel=0.01)
+    finally:
+        loaders.clear_table_caches()
+
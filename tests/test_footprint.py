@@ -0,0 +1,68 @@
+import pytest
+
+import api.vworld_wfs as wfs
+from core.footprint import Footprint
+
+OUTER = [[127.0, 37.5], [127.001, 37.5], [127.001, 37.501], [127.0, 37.501], [127.0, 37.5]]
+HOLE = [[127.0004, 37.5004], [127.0006, 37.5004], [127.0006, 37.5006], [127.0004, 37.5006], [127.0004, 37.5004]]
+NEIGHBOR = [[127.002, 37.5], [127.003, 37.5], [127.003, 37.501], [127.002, 37.501], [127.002, 37.5]]
+
+FEATURES = [
+    {
+        "id": "lt_c_bldginfo.2",
+        "geometry": {"type": "Polygon", "coordinates": [NEIGHBOR]},
+        "properties": {"bld_nm": "옆 건물"},
+    },
+    {
+        "id": "lt_c_bldginfo.1",
+        "geometry": {"type": "MultiPolygon", "coordinates": [[OUTER, HOLE]]},
+        "properties": {"BD_MGT_SN": "1111012345", "bld_nm": "중정 건물", "grnd_flr": "5", "height": "17.5", "etc": "x"},
+    },
+]
+
+
+def test_footprint_keeps_holes_and_typed_attributes():
+    (fp,) = Footprint.from_feature(FEATURES[1])
+
+    assert fp.building_id == "1111012345"
+    assert (fp.name, fp.ground_floors, fp.height_m) == ("중정 건물", 5, 17.5)
+    assert len(fp.holes) == 1
+    assert fp.area_m2() == pytest.approx(Footprint.from_rings([OUTER]).area_m2() * 0.96, rel=1e-3)
+    assert "etc" not in fp.attributes()
+
+
+class _FakeResponse:
+    status_code = 200
+    headers = {"Content-Type": "application/json"}
+    url = "mock://wfs"
+    text = ""
+
+    def json(self):
+        return {"features": FEATURES}
+
+
+def test_fetch_footprint_returns_containing_feature(monkeypatch):
+    monkeypatch.setattr(wfs._SESSION, "get", lambda *a, **kw: _FakeResponse())
+
+    fp = wfs._fetch_footprint_once(lat=37.5002, lon=127.0002, api_key="k", radius_m=30, timeout_s=1, domain=None)
+
+    assert fp.building_id == "1111012345"
+    assert fp.exterior_list()[0] == (127.0, 37.5)
+    # 구멍 안의 점은 포함되지 않으므로 경계가 가장 가까운 폴리곤(같은 건물)을 고름
+    fp = wfs._fetch_footprint_once(lat=37.5005, lon=127.0005, api_key="k", radius_m=30, timeout_s=1, domain=None)
+    assert fp.building_id == "1111012345"
+
+
+def test_footprint_bytes_round_trip_is_compact_and_zero_copy():
+    from core.utils.polycodec import decode_polygon
+
+    (fp,) = Footprint.from_feature(FEATURES[1])
+    encoded = fp.to_bytes()
+    view = decode_polygon(encoded)
+    restored = Footprint.from_bytes(encoded)
+
+    assert view.quantized.base is not None and not view.quantized.flags.writeable  # buffer view, no copy
+    assert len(encoded) < 40 + 8 * len(fp.coords) + 4 * len(fp.ring_offsets) + 120
+    assert abs(restored.coords - fp.coords).max() < 1e-7
+    assert restored.attributes() == fp.attributes()
+    assert restored.area_m2() == pytest.approx(fp.area_m2(), rel=1e-5)
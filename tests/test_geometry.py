@@ -0,0 +1,33 @@
+import pytest
+
+from core.utils.geometry import pack_polygons, polygon_area_m2, polygon_areas_m2
+
+SQUARE = [(127.0, 37.5), (127.001, 37.5), (127.001, 37.501), (127.0, 37.501)]
+HOLE = [(127.0002, 37.5002), (127.0004, 37.5002), (127.0004, 37.5004), (127.0002, 37.5004)]
+
+
+def test_batch_area_matches_single_polygon_area():
+    triangle_latlon = [(37.5, 127.0), (37.5, 127.001), (37.501, 127.001)]
+    areas = polygon_areas_m2(*pack_polygons([SQUARE, SQUARE + [SQUARE[0]], triangle_latlon]))
+
+    assert areas[0] == pytest.approx(polygon_area_m2(SQUARE))
+    assert areas[1] == pytest.approx(polygon_area_m2(SQUARE + [SQUARE[0]]))
+    assert areas[2] == pytest.approx(polygon_area_m2(triangle_latlon))
+
+
+def test_batch_area_subtracts_holes_and_handles_degenerate():
+    areas = polygon_areas_m2(*pack_polygons([[SQUARE, HOLE], [SQUARE[:2]], []]))
+
+    assert areas[0] == pytest.approx(polygon_area_m2(SQUARE) - polygon_area_m2(HOLE))
+    assert list(areas[1:]) == [0.0, 0.0]
+
+
+def test_precise_area_matches_geodesic_area():
+    pyproj = pytest.importorskip("pyproj")
+    geod = pyproj.Geod(ellps="GRS80")
+    east = [(129.3, 35.5), (129.301, 35.5), (129.301, 35.501), (129.3, 35.501)]
+
+    for ring in (SQUARE, east):
+        truth = abs(geod.polygon_area_perimeter(*zip(*ring))[0])
+        assert polygon_area_m2(ring, precise=True) == pytest.approx(truth, rel=1e-6)
+        assert polygon_area_m2(ring, precise=True, crs="EPSG:5179") == pytest.approx(truth, rel=1e-6)
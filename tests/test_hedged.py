@@ -0,0 +1,95 @@
+import time
+
+import requests
+
+from api.hedged import CircuitBreaker, HedgedGeocodingProvider
+from core.models import LocationResult
+from core.utils import metrics
+
+
+class _Provider:
+    def __init__(self, name, delay_s=0.0, fail=False, found=True):
+        self.name, self.delay_s, self.fail, self.found = name, delay_s, fail, found
+        self.calls = 0
+
+    def geocode(self, address):
+        self.calls += 1
+        time.sleep(self.delay_s)
+        if self.fail:
+            raise requests.ConnectionError(f"{self.name} down")
+        if not self.found:
+            return None
+        return LocationResult(
+            input_address=address, normalized_address=address, point={"lat": 37.5, "lon": 127.0}, provider=self.name
+        )
+
+
+def test_slow_primary_is_hedged_after_p95_delay():
+    metrics.reset()
+    slow, fast = _Provider("kakao", delay_s=0.5), _Provider("vworld", delay_s=0.01)
+    hedged = HedgedGeocodingProvider([slow, fast], min_samples=3, min_delay_s=0.01)
+    # 최근 응답이 모두 ~20ms였다면 p95도 그 근처 → 그보다 늦으면 바로 hedge
+    for _ in range(3):
+        hedged.latency[0].observe(0.02)
+    assert hedged.hedge_delay_s(0) == 0.02
+
+    start = time.perf_counter()
+    result = hedged.geocode("서울특별시 중구 세종대로 110")
+    elapsed = time.perf_counter() - start
+
+    assert result.provider == "vworld"
+    assert elapsed < 0.3
+    assert metrics.GEOCODE_HEDGES.value("vworld") == 1
+
+
+def test_fast_primary_is_not_hedged():
+    metrics.reset()
+    primary, secondary = _Provider("kakao", delay_s=0.01), _Provider("vworld")
+    hedged = HedgedGeocodingProvider([primary, secondary], initial_delay_s=0.5)
+    assert all(hedged.geocode(f"주소 {i}").provider == "kakao" for i in range(5))
+    assert secondary.calls == 0
+
+
+def test_failures_fail_over_and_trip_the_breaker():
+    broken, backup = _Provider("kakao", fail=True), _Provider("vworld")
+    hedged = HedgedGeocodingProvider([broken, backup], failure_threshold=3, reset_timeout_s=60.0)
+
+    for i in range(5):
+        assert hedged.geocode(f"주소 {i}").provider == "vworld"
+    # 연속 3번 실패 뒤로는 회로가 열려 더 보내지 않음
+    assert broken.calls == 3
+    assert hedged.breakers[0].state == "open"
+
+
+def test_not_found_answer_wins_over_errors():
+    hedged = HedgedGeocodingProvider([_Provider("kakao", found=False), _Provider("vworld", fail=True)])
+    assert hedged.geocode("없는 주소") is None
+
+
+def test_breaker_half_open_allows_a_single_trial():
+    breaker = CircuitBreaker("x", failure_threshold=1, reset_timeout_s=0.0)
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow() and breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_quota_error_during_half_open_trial_reopens_breaker():
+    from core.exceptions import QuotaExceededError
+
+    class _Limited(_Provider):
+        def geocode(self, address):
+            self.calls += 1
+            if self.calls == 1:
+                raise QuotaExceededError("kakao", retry_after_s=1.0)
+            return super().geocode(address)
+
+    limited = _Limited("kakao")
+    hedged = HedgedGeocodingProvider([limited, _Provider("vworld")], failure_threshold=1, reset_timeout_s=0.0)
+    hedged.breakers[0].record_failure()
+    assert hedged.geocode("a").provider == "vworld"  # 시험 호출이 한도 초과 → vworld
+    assert hedged.breakers[0].state == "open"
+    assert hedged.geocode("a").provider == "kakao"  # 다음 시험 호출은 다시 허용
+    assert hedged.breakers[0].state == "closed"
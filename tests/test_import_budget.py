@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from benchmarks.importtime import default_targets, measure
+
+# 시간 예산은 기기/부하에 따라 흔들리므로 요청할 때만 확인 (평소에는 python -m benchmarks.importtime)
+CHECK_TIME_BUDGET = os.getenv("OKSSANGIMONG_IMPORT_BUDGET", "0").lower() not in ("0", "false", "no")
+
+
+@pytest.mark.parametrize("target", default_targets())
+def test_page_does_not_import_heavy_modules(target):
+    report = measure(target, runs=1)
+    assert not report.loaded_heavy, f"{target} imports heavy modules eagerly: {report.loaded_heavy}"
+
+
+@pytest.mark.skipif(not CHECK_TIME_BUDGET, reason="set OKSSANGIMONG_IMPORT_BUDGET=1 to check wall-clock budgets")
+@pytest.mark.parametrize("target", default_targets())
+def test_page_cold_start_within_budget(target):
+    report = measure(target, runs=3)
+    assert report.incremental_ms <= report.budget_ms, f"{target}: {report.incremental_ms:.0f}ms"
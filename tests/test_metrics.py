@@ -0,0 +1,38 @@
+import requests
+
+from api.metered import MeteredHTTPAdapter
+from core.utils import metrics
+from core.utils.cache import LRUCache
+
+
+def test_render_counters_histograms_and_caches():
+    c = metrics.counter("test_events_total", "test", ("kind",))
+    h = metrics.histogram("test_bytes", "test", ("kind",), buckets=(10.0, 100.0))
+    c.inc("a")
+    c.inc("a", amount=2)
+    h.observe("a", value=50)
+    cache = LRUCache(maxsize=4)
+    cache.set("k", 1)
+    cache.get("k")
+    cache.get("missing")
+    metrics.track_cache("test", cache)
+
+    text = metrics.render()
+    assert 'okssangimong_test_events_total{kind="a"} 3' in text
+    assert 'okssangimong_test_bytes_bucket{kind="a",le="10"} 0' in text
+    assert 'okssangimong_test_bytes_bucket{kind="a",le="+Inf"} 1' in text
+    assert 'okssangimong_cache_hits_total{cache="test"} 1' in text
+    assert 'okssangimong_cache_misses_total{cache="test"} 1' in text
+
+
+def test_local_endpoint_and_metered_adapter():
+    server = metrics.serve(0)
+    url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+    session = requests.Session()
+    session.mount("http://", MeteredHTTPAdapter("test_upstream"))
+
+    assert session.get(url, timeout=5).status_code == 200
+    res = session.get(url, timeout=5)
+    assert res.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert 'okssangimong_upstream_requests_total{upstream="test_upstream",status="200"} 1' in res.text
+    assert metrics.UPSTREAM_LATENCY.labels("test_upstream").count == 2
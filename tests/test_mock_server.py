@@ -0,0 +1,50 @@
+import pytest
+
+from api import vworld_wfs
+from api.kakao_api import KakaoGeocodingProvider
+from api.mock_server import MockConfig, geocode_point, parse_wfs_bbox, serve_mock
+from api.vworld_api import VWorldGeocodingProvider
+from core.utils import metrics
+
+ADDRESS = "서울특별시 중구 세종대로 110"
+
+
+def test_geocoders_and_wfs_against_mock(monkeypatch):
+    with serve_mock() as upstream:
+        expected = geocode_point(ADDRESS, {})
+        for provider in (
+            VWorldGeocodingProvider("mock", base_url=upstream.base_url),
+            KakaoGeocodingProvider("mock", base_url=upstream.base_url),
+        ):
+            loc = provider.geocode(ADDRESS)
+            assert loc.point.lat == pytest.approx(expected["lat"])
+            assert loc.point.lon == pytest.approx(expected["lon"])
+
+        monkeypatch.setattr(vworld_wfs, "VWORLD_WFS_URL", f"{upstream.base_url}/req/wfs")
+        footprint = vworld_wfs.get_building_footprint((expected["lat"], expected["lon"]), api_key="mock")
+        assert footprint is not None and footprint.building_id.startswith("mock-")
+        assert footprint.area_m2() > 50
+
+
+def test_injected_errors_are_retried_and_counted():
+    config = MockConfig(fail_first=1, error_mix={"503": 1.0})
+    with serve_mock(config) as upstream:
+        before = metrics.UPSTREAM_RETRIES.value("vworld_geocode")
+        loc = VWorldGeocodingProvider("mock", base_url=upstream.base_url).geocode(ADDRESS)
+        assert loc is not None
+        assert upstream.stats[("vworld_geocode", "503")] == 1
+        assert upstream.stats[("vworld_geocode", "200")] == 1
+        assert metrics.UPSTREAM_RETRIES.value("vworld_geocode") == before + 1
+
+
+def test_service_exception_report_is_not_parsed_as_features(monkeypatch):
+    config = MockConfig(error_rate=1.0, error_mix={"exception": 1.0})
+    with serve_mock(config) as upstream:
+        monkeypatch.setattr(vworld_wfs, "VWORLD_WFS_URL", f"{upstream.base_url}/req/wfs")
+        assert vworld_wfs.get_building_footprint((37.5663, 126.9779), api_key="mock", max_attempts=1) is None
+        assert upstream.stats[("wfs", "exception")] == 1
+
+
+def test_wfs_bbox_axis_order():
+    assert parse_wfs_bbox("37.1,127.2,37.3,127.4") == (127.2, 37.1, 127.4, 37.3)
+    assert parse_wfs_bbox("127.2,37.1,127.4,37.3,EPSG:4326") == (127.2, 37.1, 127.4, 37.3)
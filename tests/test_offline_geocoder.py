@@ -0,0 +1,89 @@
+from api.offline_geocoder import OfflineGeocodingProvider
+from core.data_access.address_index import AddressIndex
+from core.models import LocationResult
+from core.services.geocoding_service import GeocodingService
+from core.utils.address import parse_road_address
+from etl import addresses
+
+ROWS = """시도명|시군구명|도로명|지하여부|건물본번|건물부번|경도|위도
+서울특별시|중구|세종대로|0|110|0|126.9779|37.5663
+서울특별시|중구|세종대로|0|110|0|126.9781|37.5664
+경기도|수원시 장안구|정조로|0|1|2|127.0100|37.2900
+서울특별시|중구|중앙로|0|1|0|126.9900|37.5600
+대전광역시|서구|중앙로|0|1|0|127.3800|36.3500
+부산광역시|해운대구|센텀중앙로|1|5|0|129.1300|35.1700
+"""
+
+
+class _Remote:
+    name = "kakao"
+
+    def __init__(self):
+        self.calls = []
+
+    def geocode(self, address):
+        self.calls.append(address)
+        return LocationResult(
+            input_address=address, normalized_address=address, point={"lat": 37.0, "lon": 127.0}, provider=self.name
+        )
+
+
+def _build(tmp_path):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    (raw / "addresses.txt").write_text(ROWS, encoding="utf-8")
+    report = addresses.run(raw, tmp_path / "index")
+    assert report == {"sources": 1, "read": 6, "rows": 5}  # 같은 건물 출입구 두 개는 하나로
+    return AddressIndex(tmp_path / "index")
+
+
+def test_parse_road_address_normalizes_variants():
+    expected = "서울|중구|세종대로|110|0|0"
+    for text in ("서울특별시 중구 세종대로 110", "서울시 중구 세종대로110 (태평로1가)", "서울  중구, 세종대로 110 3층"):
+        assert parse_road_address(text).key() == expected
+    assert parse_road_address("서울 강남구 강남대로94길 20").road == "강남대로94길"
+    assert parse_road_address("부산 해운대구 센텀중앙로 지하 5").underground
+    assert parse_road_address("서울 중구 태평로1가 31") is None  # 지번 주소
+
+
+def test_offline_index_exact_and_near_matches(tmp_path):
+    index = _build(tmp_path)
+    remote = _Remote()
+    provider = OfflineGeocodingProvider(index, fallback=remote)
+
+    hit = provider.geocode("서울시 중구 세종대로110")
+    assert hit.provider == "offline" and hit.extra["match"] == "exact"
+    assert hit.normalized_address == "서울특별시 중구 세종대로 110"
+    assert (hit.point.lat, hit.point.lon) == (37.5663, 126.9779)
+
+    assert provider.geocode("경기 수원시 장안구 정조로 1-2").normalized_address == "경기도 수원시 장안구 정조로 1-2"
+    # 지역 생략/일부: 도로명+번호가 한 곳뿐이면 근사 일치
+    assert provider.geocode("장안구 정조로 1-2").extra["match"] == "road"
+    assert provider.geocode("세종대로 110").normalized_address == "서울특별시 중구 세종대로 110"
+    assert provider.geocode("대전 중앙로 1").point.lat == 36.35
+    assert provider.geocode("센텀중앙로 지하 5").provider == "offline"
+    assert remote.calls == []
+
+    # 모호하거나(중앙로 1은 두 곳) 색인에 없으면 외부 provider로
+    assert provider.geocode("중앙로 1").provider == "kakao"
+    assert provider.geocode("서울 중구 세종대로 111").provider == "kakao"
+    assert provider.geocode("서울 중구 태평로1가 31").provider == "kakao"
+    assert len(remote.calls) == 3
+
+
+def test_geocoding_service_uses_index_before_remote(tmp_path):
+    remote = _Remote()
+    svc = GeocodingService(provider=OfflineGeocodingProvider(_build(tmp_path), fallback=remote))
+    assert svc.geocode("서울 중구 세종대로 110").provider == "offline"
+    assert svc.geocode("서울 종로구 종로 1").provider == "kakao"
+    assert remote.calls == ["서울 종로구 종로 1"]
+
+
+def test_rebuild_does_not_touch_open_index(tmp_path):
+    index = _build(tmp_path)
+    before = index.lookup(parse_road_address("서울 중구 세종대로 110"))
+    (tmp_path / "raw" / "addresses.txt").write_text(ROWS.replace("37.5663", "37.0000"), encoding="utf-8")
+    addresses.run(tmp_path / "raw", tmp_path / "index")
+    # 이미 연 색인은 이전 버전을 그대로 읽고, 새로 연 색인만 바뀐 값을 봄
+    assert index.lookup(parse_road_address("서울 중구 세종대로 110")) == before
+    assert AddressIndex(tmp_path / "index").lookup(parse_road_address("서울 중구 세종대로 110")).lat == 37.0
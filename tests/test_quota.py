@@ -0,0 +1,72 @@
+import math
+
+import pytest
+
+from api.hedged import HedgedGeocodingProvider
+from api.kakao_api import KakaoGeocodingProvider
+from api.mock_server import MockConfig, serve_mock
+from api.vworld_api import VWorldGeocodingProvider
+from core.exceptions import QuotaExceededError
+from core.utils import metrics
+from core.utils.quota import QuotaLimit, QuotaManager, parse_quota, set_quota_manager
+
+
+def test_parse_quota():
+    assert parse_quota("10/s,40000/d") == QuotaLimit(10.0, 40000)
+    assert parse_quota("5/s") == QuotaLimit(5.0, None)
+    assert parse_quota("") is None
+    with pytest.raises(ValueError):
+        parse_quota("10/m")
+
+
+def test_bucket_is_shared_between_managers(tmp_path):
+    # 같은 파일을 여는 매니저 둘 = 워커 프로세스 둘
+    limits = {"kakao": QuotaLimit(rate_per_s=2, daily=3)}
+    a = QuotaManager(tmp_path / "quota.sqlite", limits)
+    b = QuotaManager(tmp_path / "quota.sqlite", limits)
+    now = 1_000_000.0
+
+    assert a.try_acquire("kakao", now) == 0
+    assert b.try_acquire("kakao", now) == 0
+    assert a.try_acquire("kakao", now) == pytest.approx(0.5)  # burst 2 소진 → 토큰 1개 = 0.5초
+    assert b.try_acquire("kakao", now + 0.5) == 0
+    assert math.isinf(a.try_acquire("kakao", now + 10))  # 일일 한도 3 소진
+    assert b.try_acquire("other", now) == 0  # 한도 없는 키
+
+
+def test_429_blocks_key_and_fails_over_to_next_provider(tmp_path):
+    metrics.reset()
+    limits = {"kakao": QuotaLimit(100, None), "vworld": QuotaLimit(100, None)}
+    previous = set_quota_manager(QuotaManager(tmp_path / "quota.sqlite", limits, max_wait_s=0.0))
+    try:
+        with serve_mock(MockConfig(error_rate=1.0, error_mix={"429": 1.0})) as limited, serve_mock() as healthy:
+            provider = HedgedGeocodingProvider([
+                KakaoGeocodingProvider(api_key="test", base_url=limited.base_url),
+                VWorldGeocodingProvider(api_key="test", base_url=healthy.base_url),
+            ])
+            first = provider.geocode("서울특별시 중구 세종대로 110")
+            second = provider.geocode("서울특별시 중구 세종대로 111")
+            limited_calls = sum(limited.stats.values())
+
+        assert first.provider == second.provider == "vworld"
+        # 429는 재시도하지 않고, Retry-After 동안 키를 막아 두 번째 조회는 Kakao로 보내지도 않음
+        assert limited_calls == 1
+        assert metrics.UPSTREAM_FAILOVERS.value("kakao") == 2
+        assert metrics.QUOTA_REJECTED.value("kakao", "rate") == 1
+        assert 'okssangimong_quota_tokens{key="vworld"}' in metrics.render()
+
+        with pytest.raises(QuotaExceededError):
+            KakaoGeocodingProvider(api_key="test", base_url=limited.base_url).geocode("부산")
+    finally:
+        set_quota_manager(previous)
+
+
+def test_quotas_are_off_unless_configured(tmp_path, monkeypatch):
+    from dataclasses import replace
+
+    from core.utils import quota
+
+    db = tmp_path / "quota.sqlite"
+    monkeypatch.setattr(quota, "settings", replace(quota.settings, kakao_quota="", vworld_quota="", quota_db=str(db)))
+    monkeypatch.setattr(quota, "_manager", quota._UNSET)
+    assert quota.get_quota_manager() is None and not db.exists()
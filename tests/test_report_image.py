@@ -0,0 +1,24 @@
+from core.models import ScenarioInput
+from core.services.report_service import ReportService
+from core.services.scenario_service import ScenarioService
+
+
+def _result(roof_area_m2: float = 1000.0):
+    return ScenarioService().compute(
+        roof_area_m2=roof_area_m2, scenario=ScenarioInput(greening_type="sedum", coverage_ratio=0.5)
+    )
+
+
+def test_build_image_is_png_and_cached():
+    svc = ReportService()
+    png, filename = svc.build_image(_result())
+    assert png.startswith(b"\x89PNG")
+    assert filename.endswith(".png")
+    # 같은 결과는 같은 바이트 객체(캐시)를 돌려줌
+    assert svc.build_image(_result())[0] is png
+
+
+def test_build_thumbnails_keeps_order():
+    results = [_result(100.0 * (i + 1)) for i in range(4)]
+    thumbs = ReportService().build_thumbnails(results, width=240)
+    assert [name for _, name in thumbs] == [ReportService().build_image(r, width=240)[1] for r in results]
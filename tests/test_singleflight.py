@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from core.models import LocationResult
+from core.services.geocoding_service import GeocodingService
+from core.utils import metrics
+from core.utils.singleflight import SingleFlight
+
+
+def _run_concurrently(n, fn):
+    barrier = threading.Barrier(n)
+    results, errors = [None] * n, [None] * n
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = fn()
+        except Exception as exc:
+            errors[i] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+class _SlowProvider:
+    def __init__(self):
+        self.calls = 0
+
+    def geocode(self, address):
+        self.calls += 1
+        time.sleep(0.2)
+        return LocationResult(
+            input_address=address, normalized_address=address, point={"lat": 37.5, "lon": 127.0}, provider="slow"
+        )
+
+
+def test_concurrent_geocodes_share_one_provider_call():
+    metrics.reset()
+    provider = _SlowProvider()
+    svc = GeocodingService(provider=provider)
+
+    results, errors = _run_concurrently(8, lambda: svc.geocode("서울특별시 중구 세종대로 110"))
+
+    assert errors == [None] * 8
+    assert provider.calls == 1
+    assert all(r == results[0] for r in results)
+    assert metrics.SINGLEFLIGHT_CALLS.value("geocode", "leader") == 1
+    assert metrics.SINGLEFLIGHT_CALLS.value("geocode", "shared") == 7
+    assert svc.flight.in_flight() == 0
+
+
+def test_followers_receive_the_leaders_exception():
+    flight = SingleFlight("test")
+
+    def fail():
+        time.sleep(0.1)
+        raise ValueError("upstream down")
+
+    _, errors = _run_concurrently(4, lambda: flight.do("k", fail))
+    assert all(isinstance(e, ValueError) for e in errors)
+    # 실패는 공유만 하고 남기지 않음: 다음 호출은 다시 실행
+    assert flight.do("k", lambda: 42) == 42
+
+
+def test_shared_dir_coalesces_across_instances(tmp_path):
+    pytest.importorskip("fcntl")
+    # 같은 디렉터리를 쓰는 인스턴스 둘 = 프로세스 둘 (flock은 open마다 따로 잠김)
+    first = SingleFlight("wfs", shared_dir=tmp_path, dumps=str.encode, loads=bytes.decode)
+    second = SingleFlight("wfs", shared_dir=tmp_path, dumps=str.encode, loads=bytes.decode)
+    started, calls = threading.Event(), []
+
+    def slow():
+        calls.append("first")
+        started.set()
+        time.sleep(0.2)
+        return "polygon"
+
+    leader = threading.Thread(target=lambda: first.do("37.5,127.0", slow))
+    leader.start()
+    started.wait()
+    value = second.do("37.5,127.0", lambda: calls.append("second") or "other")
+    leader.join()
+
+    assert value == "polygon"
+    assert calls == ["first"]
+
+
+def test_shared_dir_does_not_block_unrelated_keys(tmp_path):
+    pytest.importorskip("fcntl")
+    first = SingleFlight("wfs", shared_dir=tmp_path, dumps=str.encode, loads=bytes.decode)
+    second = SingleFlight("wfs", shared_dir=tmp_path, dumps=str.encode, loads=bytes.decode)
+    started, release = threading.Event(), threading.Event()
+
+    def blocked():
+        started.set()
+        release.wait(5)
+        return "a"
+
+    leader = threading.Thread(target=lambda: first.do("key-a", blocked))
+    leader.start()
+    started.wait()
+    try:
+        # 다른 키는 key-a leader가 끝나기를 기다리지 않음
+        t0 = time.perf_counter()
+        assert second.do("key-b", lambda: "b") == "b"
+        assert time.perf_counter() - t0 < 1.0
+    finally:
+        release.set()
+        leader.join()
+    assert list((tmp_path / "locks").iterdir()) == []  # 끝난 키의 잠금 파일은 남지 않음
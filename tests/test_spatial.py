@@ -0,0 +1,64 @@
+import random
+
+from api.vworld_wfs import _point_in_polygon
+from core.utils.geometry import pack_geojson
+from core.utils.spatial import PolygonIndex
+
+OUTER = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+HOLE = [(3.0, 3.0), (6.0, 3.0), (6.0, 6.0), (3.0, 6.0)]
+RIGHT = [(20.0, 0.0), (30.0, 0.0), (30.0, 10.0), (20.0, 10.0)]
+
+
+def test_locate_handles_holes_and_nearest_edge():
+    index = PolygonIndex.from_polygons([[OUTER, HOLE], RIGHT])
+
+    assert list(index.contains(1, 1)) == [True, False]
+    assert list(index.contains(4, 4)) == [False, False]  # 구멍 안
+    assert index.locate(25, 5) == 1
+    assert index.locate(4, 4) == 0  # 포함 폴리곤이 없으면 경계가 가장 가까운 폴리곤
+    assert index.locate(18, 5) == 1
+    assert PolygonIndex.from_polygons([]).locate(0, 0) is None
+
+
+def test_contains_matches_scalar_crossing_number():
+    rng = random.Random(7)
+    polygons = [
+        [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(rng.randint(3, 12))]
+        for _ in range(60)
+    ]
+    index = PolygonIndex.from_polygons(polygons)
+    for _ in range(300):
+        x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+        assert list(index.contains(x, y)) == [_point_in_polygon((x, y), p) for p in polygons]
+
+
+def test_pack_geojson_keeps_rings_and_ignores_other_geometries():
+    geometries = [
+        {"type": "Polygon", "coordinates": [[list(p) for p in OUTER], [list(p) for p in HOLE]]},
+        {"type": "MultiPolygon", "coordinates": [[[[x, y, 0.0] for x, y in RIGHT]]]},
+        {"type": "Point", "coordinates": [1.0, 2.0]},
+    ]
+    coords, ring_offsets, polygon_offsets = pack_geojson(geometries)
+
+    assert coords.shape == (12, 2)
+    assert list(ring_offsets) == [0, 4, 8, 12]
+    assert list(polygon_offsets) == [0, 2, 3]
+
+
+def test_locate_many_matches_per_point_contains():
+    rng = random.Random(7)
+    polygons = []
+    for _ in range(500):
+        x, y, d = rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0.5, 4)
+        outer = [(x, y), (x + d, y), (x + d, y + d), (x, y + d)]
+        polygons.append([outer, [(x + d / 4, y + d / 4), (x + d / 2, y + d / 4), (x + d / 2, y + d / 2)]] if rng.random() < 0.3 else outer)
+    index = PolygonIndex.from_polygons(polygons)
+    xs = [rng.uniform(0, 100) for _ in range(2000)]
+    ys = [rng.uniform(0, 100) for _ in range(2000)]
+
+    expected = []
+    for x, y in zip(xs, ys):
+        hits = index.contains(x, y).nonzero()[0]
+        expected.append(int(hits[0]) if len(hits) else -1)
+    assert list(index.locate_many(xs, ys)) == expected
+    assert list(PolygonIndex.from_polygons([]).locate_many([1.0], [1.0])) == [-1]
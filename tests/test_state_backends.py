@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+from core.models import ScenarioInput
+from core.services.analyze_service import AnalyzeService
+from core.state import InMemoryStateBackend, SqliteStateBackend, get_state
+
+
+@pytest.mark.parametrize("make_backend", ["memory", "sqlite"])
+def test_analyze_flow_without_streamlit(make_backend, tmp_path):
+    if make_backend == "memory":
+        backend = InMemoryStateBackend()
+    else:
+        backend = SqliteStateBackend(tmp_path / "state.sqlite3", session_id="job-1")
+
+    svc = AnalyzeService(state=backend)
+    assert get_state(backend)["result"] is None
+
+    svc.confirm_area(1000.0)
+    svc.set_scenario(ScenarioInput(greening_type="sedum", coverage_ratio=0.5))
+    result = svc.compute()
+
+    assert result.green_area_m2 == 500.0
+    assert get_state(backend)["result"]["green_area_m2"] == 500.0
+    pdf_bytes, _ = svc.export_pdf()
+    assert pdf_bytes.startswith(b"%PDF")
+
+
+def test_sqlite_backend_shares_state_and_keeps_bytes(tmp_path):
+    path = tmp_path / "state.sqlite3"
+    SqliteStateBackend(path, session_id="a").set("blob", {"data": b"\x00\x01"})
+    assert SqliteStateBackend(path, session_id="a").get("blob") == {"data": b"\x00\x01"}
+    assert SqliteStateBackend(path, session_id="b").get("blob") is None
+
+    SqliteStateBackend(path, session_id="a").set("footprint", b"FP\x01\x00")
+    row = SqliteStateBackend(path, session_id="a")._conn().execute(
+        "SELECT typeof(value) FROM state WHERE key = 'footprint'"
+    ).fetchone()
+    assert row == ("blob",)
+    assert SqliteStateBackend(path, session_id="a").get("footprint") == b"FP\x01\x00"
+
+
+def test_analyze_service_import_does_not_load_streamlit():
+    code = "import sys, core.services.analyze_service; print('streamlit' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
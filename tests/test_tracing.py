@@ -0,0 +1,38 @@
+from core.utils import tracing
+from core.utils.tracing import span, stage_histograms, trace, traced
+
+
+def test_nested_spans_are_collected_into_trace():
+    tracing.reset()
+    with trace("request") as t:
+        with span("outer"):
+            with span("inner"):
+                pass
+            with span("inner"):
+                pass
+    assert [(name, depth) for name, depth, _ in t.stages()] == [("outer", 0), ("inner", 1), ("inner", 1)]
+    assert stage_histograms()["inner"].count == 2
+    assert tracing.recent_traces()[-1] is t
+
+
+def test_only_in_trace_and_disabled():
+    tracing.reset()
+
+    @traced("cheap", only_in_trace=True)
+    def cheap(x):
+        return x + 1
+
+    assert cheap(1) == 2
+    assert "cheap" not in stage_histograms()
+    with trace("request"):
+        cheap(1)
+    assert stage_histograms()["cheap"].count == 1
+
+    tracing.set_enabled(False)
+    try:
+        with trace("request") as t:
+            with span("outer"):
+                cheap(1)
+        assert t.spans == [] and stage_histograms()["cheap"].count == 1
+    finally:
+        tracing.set_enabled(True)
@@ -1,5 +1,9 @@
+from typing import Callable
+
 import streamlit as st
 
+from components.common.assets import minify_html
+
 
 def _format_number(value: float | None) -> str:
     if value is None:
@@ -13,6 +17,52 @@ def _format_ratio(value: float | None) -> str:
     return f"{value:.0f}"
 
 
+@st.fragment
+def _render_area_editor(
+    default_area: float,
+    suggested_area: float | None,
+    on_apply: Callable[[str], None] | None,
+) -> None:
+    """면적 입력 + '값 적용' 버튼.
+
+    st.fragment라서 입력/적용 시 이 부분만 다시 실행됩니다 (면적 추정/헤더/CSS 재전송 없음).
+    """
+    st.markdown('<div class="edit-row">', unsafe_allow_html=True)
+    input_col, button_col = st.columns([3, 1], gap="small")
+    with input_col:
+        st.markdown(
+            minify_html("""
+            <div class="input">
+              <div class="input-label">옥상 가용면적(㎡)</div>
+            """),
+            unsafe_allow_html=True,
+        )
+        roof_area_value = st.text_input(
+            "옥상 가용면적(㎡)",
+            value=f"{default_area:.0f}" if default_area else "",
+            placeholder=f"{suggested_area:.0f}" if suggested_area else "",
+            key="roof_area_input",
+            label_visibility="collapsed",
+        )
+        st.markdown("</div>", unsafe_allow_html=True)
+    with button_col:
+        apply_clicked = st.button("값 적용", use_container_width=True, key="area_apply")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown(
+        minify_html("""
+          <div class="edit-help">
+            가용면적은 옥상 구조·설비에 따라 달라질 수 있습니다.
+          </div>
+        </div>
+        """),
+        unsafe_allow_html=True,
+    )
+
+    if apply_clicked and on_apply is not None:
+        on_apply(roof_area_value)
+
+
 def render_area_confirm_ui(
     *,
     address_title: str,
@@ -21,9 +71,10 @@ def render_area_confirm_ui(
     suggested_area: float | None,
     availability_ratio: float | None,
     default_area: float,
+    on_apply: Callable[[str], None] | None = None,
 ) -> dict:
     st.markdown(
-        """
+        minify_html("""
         <style>
         * { box-sizing: border-box; margin: 0; padding: 0; }
         .app-header { position: sticky; top: 0; z-index: 50; }
@@ -235,7 +286,7 @@ def render_area_confirm_ui(
           .edit-row { flex-direction: column; align-items: stretch; }
         }
         </style>
-        """,
+        """),
         unsafe_allow_html=True,
     )
 
@@ -244,7 +295,7 @@ def render_area_confirm_ui(
     # st.markdown('<div class="content-1120">', unsafe_allow_html=True)
 
     st.markdown(
-        """
+        minify_html("""
         <section class="section-header">
           <div class="eyebrow">SIMULATION · STEP 1</div>
           <h1 class="h2">옥상 조건 확인</h1>
@@ -252,12 +303,12 @@ def render_area_confirm_ui(
             주소를 기반으로 시뮬레이션에 사용할 면적 정보를 확인합니다.
           </p>
         </section>
-        """,
+        """),
         unsafe_allow_html=True,
     )
 
     st.markdown(
-        """
+        minify_html("""
         <section class="stepper" aria-label="simulation steps">
           <div class="step active">
             <div class="dot"></div>
@@ -279,7 +330,7 @@ def render_area_confirm_ui(
             <div class="label">리포트</div>
           </div>
         </section>
-        """,
+        """),
         unsafe_allow_html=True,
     )
 
@@ -327,37 +378,7 @@ def render_area_confirm_ui(
             unsafe_allow_html=True,
         )
 
-        st.markdown('<div class="edit-row">', unsafe_allow_html=True)
-        input_col, button_col = st.columns([3, 1], gap="small")
-        with input_col:
-            st.markdown(
-                """
-                <div class="input">
-                  <div class="input-label">옥상 가용면적(㎡)</div>
-                """,
-                unsafe_allow_html=True,
-            )
-            roof_area_value = st.text_input(
-                "",
-                value=f"{default_area:.0f}" if default_area else "",
-                placeholder=f"{suggested_area:.0f}" if suggested_area else "",
-                key="roof_area_input",
-                label_visibility="collapsed",
-            )
-            st.markdown("</div>", unsafe_allow_html=True)
-        with button_col:
-            apply_clicked = st.button("값 적용", use_container_width=True)
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown(
-            """
-              <div class="edit-help">
-                가용면적은 옥상 구조·설비에 따라 달라질 수 있습니다.
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        _render_area_editor(default_area, suggested_area, on_apply)
 
         st.markdown('<div class="cta-row">', unsafe_allow_html=True)
         prev_col, next_col = st.columns([1, 1], gap="small")
@@ -369,7 +390,7 @@ def render_area_confirm_ui(
 
     with right_col:
         st.markdown(
-            """
+            minify_html("""
             <section class="card">
               <div class="card-title">왜 면적 확인이 필요한가요?</div>
               <ul class="bullets">
@@ -382,15 +403,14 @@ def render_area_confirm_ui(
 
               <a class="link" href="#">데이터 근거 보기 →</a>
             </section>
-            """,
+            """),
             unsafe_allow_html=True,
         )
 
     # st.markdown("</div></div></main>", unsafe_allow_html=True)
 
     return {
-        "roof_area_value": roof_area_value,
-        "apply_clicked": apply_clicked,
+        "roof_area_value": st.session_state.get("roof_area_input", ""),
         "prev_clicked": prev_clicked,
         "next_clicked": next_clicked,
     }
\ No newline at end of file
@@ -1,35 +1,24 @@
+from functools import lru_cache
+
 import streamlit as st
 import streamlit.components.v1 as components
-import os
 
 # 공통 헤더 컴포넌트 import
+from components.common.assets import load_css, minify_html
 from components.common.header import render_header
 from core.services.analyze_service import AnalyzeService
 from core.state import set_state
 
 def load_css_content(file_name):
-    """CSS 파일 내용을 문자열로 반환합니다."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(current_dir)
-    css_path = os.path.join(project_root, "design", "okssang_imong", file_name)
-    
-    with open(css_path, "r", encoding="utf-8") as f:
-        return f.read()
+    """CSS 파일 내용(압축본)을 문자열로 반환합니다. 파일은 프로세스당 한 번만 읽습니다."""
+    return load_css(file_name).content
 
-def render_landing_page():
-    """랜딩 페이지를 렌더링합니다."""
-    
+
+@lru_cache(maxsize=4)
+def _hero_fragment(css_fingerprint: str) -> str:
+    """Hero 섹션 HTML. CSS 지문(fingerprint)별로 한 번만 만들어 캐시합니다."""
     css_content = load_css_content("index.css")
-    
-    # ========================================
-    # 1. 공통 헤더 (컴포넌트 호출)
-    # ========================================
-    render_header()
-    
-    # ========================================
-    # 2. Hero 섹션
-    # ========================================
-    hero_html = f"""
+    return minify_html(f"""
     <style>
     {css_content}
     body {{ margin: 0; padding: 0; }}
@@ -51,46 +40,14 @@ def render_landing_page():
         </p>
       </div>
     </section>
-    """
-    components.html(hero_html, height=320, scrolling=False)
-    
-    # ========================================
-    # 3. 검색바 (Streamlit 위젯 - 인터랙션 필요)
-    # ========================================
-    _, col_search, _ = st.columns([1, 2.5, 1])
-    
-    with col_search:
-        c1, c2 = st.columns([2.5, 1.5])
-        with c1:
-            address = st.text_input(
-                "Address", 
-                placeholder="예) 서울시 중구 세종대로 110 (서울시청) 입력...", 
-                label_visibility="collapsed"
-            )
-        with c2:
-            if st.button("시뮬레이션 시작", type="primary", use_container_width=True):
-              if not address:
-                    st.error("주소를 입력해주세요.")
-              else:
-                    svc = AnalyzeService()
-                    try:
-                        loc = svc.set_address(address)
-                        set_state("location", loc.model_dump())
-                        st.switch_page("pages/1_step1_condition_check.py")
-                    except Exception as exc:
-                        st.error(f"주소 처리 실패: {exc}")
-        
-        st.markdown(
-            "<p style='text-align:center; font-size:12px; color:#718096; margin-top:8px;'>"
-            "실제 서비스에서는 공공데이터와 분석 모델을 활용해 건물별 옥상녹화·태양광 통합 효과를 계산합니다."
-            "</p>",
-            unsafe_allow_html=True
-        )
-    
-    # ========================================
-    # 4. 하단 영역: Features + Project + Use Cases + Footer (통합!)
-    # ========================================
-    bottom_html = f"""
+    """, prune_unused_css=True)
+
+
+@lru_cache(maxsize=4)
+def _bottom_fragment(css_fingerprint: str) -> str:
+    """하단 영역(Features + Project + Use Cases + Footer) HTML."""
+    css_content = load_css_content("index.css")
+    return minify_html(f"""
     <style>
     {css_content}
     body {{ margin: 0; padding: 0; background: #f4f6f9; }}
@@ -230,5 +187,84 @@ def render_landing_page():
         </div>
       </div>
     </footer>
-    """
-    components.html(bottom_html, height=1150, scrolling=False)
+    """, prune_unused_css=True)
+
+
+def _pick_address(address: str) -> None:
+    # 위젯이 그려지기 전(콜백)에만 값을 바꿀 수 있음
+    st.session_state["landing_address"] = address
+
+
+def _render_suggestions(address: str) -> None:
+    """입력과 접두어가 맞는 건물/도로명주소 추천. 고르면 검색창을 채워서 없는 주소로 지오코딩하지 않게 합니다."""
+    if not address:
+        return
+    suggestions = AnalyzeService().suggest_addresses(address)
+    if not suggestions or any(s.address == address.strip() for s in suggestions):
+        return
+    st.caption("혹시 이 주소인가요?")
+    for i, suggestion in enumerate(suggestions):
+        st.button(
+            suggestion.label,
+            key=f"landing_suggestion_{i}",
+            on_click=_pick_address,
+            args=(suggestion.address,),
+            use_container_width=True,
+        )
+
+
+def render_landing_page():
+    """랜딩 페이지를 렌더링합니다."""
+
+    css_fingerprint = load_css("index.css").fingerprint
+
+    # ========================================
+    # 1. 공통 헤더 (컴포넌트 호출)
+    # ========================================
+    render_header()
+
+    # ========================================
+    # 2. Hero 섹션
+    # ========================================
+    components.html(_hero_fragment(css_fingerprint), height=320, scrolling=False)
+    
+    # ========================================
+    # 3. 검색바 (Streamlit 위젯 - 인터랙션 필요)
+    # ========================================
+    _, col_search, _ = st.columns([1, 2.5, 1])
+    
+    with col_search:
+        c1, c2 = st.columns([2.5, 1.5])
+        with c1:
+            address = st.text_input(
+                "Address", 
+                placeholder="예) 서울시 중구 세종대로 110 (서울시청) 입력...", 
+                label_visibility="collapsed",
+                key="landing_address",
+            )
+        with c2:
+            if st.button("시뮬레이션 시작", type="primary", use_container_width=True):
+              if not address:
+                    st.error("주소를 입력해주세요.")
+              else:
+                    svc = AnalyzeService()
+                    try:
+                        loc = svc.set_address(address)
+                        set_state("location", loc.model_dump())
+                        st.switch_page("pages/1_step1_condition_check.py")
+                    except Exception as exc:
+                        st.error(f"주소 처리 실패: {exc}")
+
+        _render_suggestions(address)
+
+        st.markdown(
+            "<p style='text-align:center; font-size:12px; color:#718096; margin-top:8px;'>"
+            "실제 서비스에서는 공공데이터와 분석 모델을 활용해 건물별 옥상녹화·태양광 통합 효과를 계산합니다."
+            "</p>",
+            unsafe_allow_html=True
+        )
+    
+    # ========================================
+    # 4. 하단 영역: Features + Project + Use Cases + Footer (통합!)
+    # ========================================
+    components.html(_bottom_fragment(css_fingerprint), height=1150, scrolling=False)
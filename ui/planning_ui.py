@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
 
 import streamlit as st
 
+from components.common.assets import minify_html
+from core.models import SimulationResult
+
 
 @dataclass(frozen=True)
 class GreeningTypeInfo:
@@ -81,17 +86,154 @@ def _format_decimal(value: float) -> str:
     return f"{value:,.1f}"
 
 
+def _select_type(type_code: str) -> None:
+    # on_click 콜백: 버튼 렌더 전에 실행되므로 모든 카드가 같은 선택 상태로 그려집니다.
+    st.session_state["planning_selected_type"] = type_code
+
+
+@st.fragment
+def _render_plan_editor(
+    selected_type: str,
+    coverage_ratio: float,
+    preview: Callable[[str, float], SimulationResult],
+) -> None:
+    """유형 버튼 · 상세 패널 · 비율 슬라이더 · 미리보기.
+
+    st.fragment라서 버튼/슬라이더 조작 시 이 부분만 다시 실행됩니다
+    (헤더/CSS/푸터/서비스 생성 등 페이지 전체 rerun 없음).
+    """
+    st.markdown('<div class="block">', unsafe_allow_html=True)
+    st.markdown('<div class="block-title">녹화 유형 선택</div>', unsafe_allow_html=True)
+    st.markdown('<div class="type-container type-buttons">', unsafe_allow_html=True)
+
+    active_type = st.session_state.get("planning_selected_type", selected_type)
+    cols = st.columns(4, gap="small")
+    for idx, (type_code, info) in enumerate(TYPE_INFOS.items()):
+        with cols[idx]:
+            st.button(
+                f"{info.icon} {info.label}\nCO₂ {info.co2_text}\n{info.subtext}",
+                key=f"type_{type_code}",
+                use_container_width=True,
+                on_click=_select_type,
+                args=(type_code,),
+            )
+            st.markdown(_type_card_html(type_code, active_type == type_code), unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    selected_info = TYPE_INFOS.get(active_type, TYPE_INFOS["sedum"])
+
+    st.markdown('<div class="block">', unsafe_allow_html=True)
+    st.markdown('<div class="block-title">선택 유형 상세</div>', unsafe_allow_html=True)
+    st.markdown(_detail_panel_html(selected_info.code), unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown('<div class="block">', unsafe_allow_html=True)
+    st.markdown('<div class="block-title">녹화 비율</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="slider-row slider-holder">', unsafe_allow_html=True)
+    slider_col, pct_col = st.columns([9, 1], gap="small")
+    with slider_col:
+        slider_value = st.slider(
+            "녹화 비율(%)",
+            min_value=0,
+            max_value=100,
+            step=5,
+            value=int(round(coverage_ratio * 100)),
+            label_visibility="collapsed",
+            key="planning_slider",
+        )
+    with pct_col:
+        st.markdown(
+            f'<div class="slider-pill"><strong>{slider_value}%</strong></div>',
+            unsafe_allow_html=True,
+        )
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    result = preview(selected_info.code, slider_value / 100)
+    st.markdown(
+        f"""
+        <div class="preview">
+          <div class="preview-item">
+            <div class="k">녹지 면적</div>
+            <div class="v">{_format_number(result.green_area_m2)}㎡</div>
+          </div>
+          <div class="preview-item">
+            <div class="k">예상 CO₂ 흡수</div>
+            <div class="v">{_format_decimal(result.co2_absorption_kg_per_year)}kg/년</div>
+          </div>
+          <div class="preview-item">
+            <div class="k">예상 온도 저감</div>
+            <div class="v">{_format_decimal(result.temp_reduction_c)}℃</div>
+          </div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+
+@lru_cache(maxsize=16)
+def _type_card_html(type_code: str, is_selected: bool) -> str:
+    info = TYPE_INFOS[type_code]
+    badge_html = f'<div class="type-badge">{info.badge}</div>' if info.badge else ""
+    return minify_html(
+        f"""
+        <div class="type-card {'selected' if is_selected else ''}">
+          {badge_html}
+          <div class="type-icon">{info.icon}</div>
+          <div class="type-name">{info.label}</div>
+          <div class="type-meta"><span>CO₂</span><strong>{info.co2_text}</strong></div>
+          <div class="type-sub">{info.subtext}</div>
+        </div>
+        """
+    )
+
+
+@lru_cache(maxsize=8)
+def _detail_panel_html(type_code: str) -> str:
+    info = TYPE_INFOS[type_code]
+    return minify_html(
+        f"""
+        <div class="detail-panel">
+          <div class="detail-head">
+            <div class="detail-title">
+              <span class="detail-icon">{info.icon}</span>
+              <span>{info.label}</span>
+            </div>
+            <div class="detail-tag">상세 패널</div>
+          </div>
+          <div class="detail-grid">
+            <div class="detail-item">
+              <div class="k">추천 식물</div>
+              <div class="v">{info.detail_recommendation}</div>
+            </div>
+            <div class="detail-item">
+              <div class="k">CO₂ 흡수량</div>
+              <div class="v">{info.detail_co2}</div>
+            </div>
+            <div class="detail-item">
+              <div class="k">온도 저감</div>
+              <div class="v">{info.detail_temp}</div>
+            </div>
+            <div class="detail-item">
+              <div class="k">특징</div>
+              <div class="v">{info.detail_feature}</div>
+            </div>
+          </div>
+        </div>
+        """
+    )
+
+
 def render_planning_ui(
     *,
     roof_area: float,
     selected_type: str,
     coverage_ratio: float,
-    green_area_m2: float,
-    co2_absorption_kg: float,
-    temp_reduction_c: float,
+    preview: Callable[[str, float], SimulationResult],
 ) -> dict:
     st.markdown(
-        """
+        minify_html("""
         <style>
         * { box-sizing: border-box; margin: 0; padding: 0; }
         body {
@@ -236,7 +378,7 @@ def render_planning_ui(
           .cta-row .stButton > button { width: 100%; }
         }
         </style>
-        """,
+        """),
         unsafe_allow_html=True,
     )
 
@@ -245,18 +387,18 @@ def render_planning_ui(
     st.markdown('<div class="content-1120">', unsafe_allow_html=True)
 
     st.markdown(
-        """
+        minify_html("""
         <section class="section-header">
           <div class="eyebrow">SIMULATION · STEP 2</div>
           <h1 class="h2">녹화 계획 설정</h1>
           <p class="subtitle">녹화 유형과 비율을 선택해 내 건물에 맞는 시나리오를 구성합니다.</p>
         </section>
-        """,
+        """),
         unsafe_allow_html=True,
     )
 
     st.markdown(
-        """
+        minify_html("""
         <section class="stepper" aria-label="simulation steps">
           <div class="step done">
             <div class="dot"></div>
@@ -278,7 +420,7 @@ def render_planning_ui(
             <div class="label">리포트</div>
           </div>
         </section>
-        """,
+        """),
         unsafe_allow_html=True,
     )
 
@@ -296,117 +438,7 @@ def render_planning_ui(
             unsafe_allow_html=True,
         )
 
-        st.markdown('<div class="block">', unsafe_allow_html=True)
-        st.markdown('<div class="block-title">녹화 유형 선택</div>', unsafe_allow_html=True)
-        st.markdown('<div class="type-container type-buttons">', unsafe_allow_html=True)
-
-        cols = st.columns(4, gap="small")
-        for idx, (type_code, info) in enumerate(TYPE_INFOS.items()):
-            with cols[idx]:
-                clicked = st.button(
-                    f"{info.icon} {info.label}\nCO₂ {info.co2_text}\n{info.subtext}",
-                    key=f"type_{type_code}",
-                    use_container_width=True,
-                )
-                if clicked:
-                    st.session_state["planning_selected_type"] = type_code
-                is_selected = st.session_state.get("planning_selected_type", selected_type) == type_code
-                badge_html = f'<div class="type-badge">{info.badge}</div>' if info.badge else ""
-                st.markdown(
-                    f"""
-                    <div class="type-card {'selected' if is_selected else ''}">
-                      {badge_html}
-                      <div class="type-icon">{info.icon}</div>
-                      <div class="type-name">{info.label}</div>
-                      <div class="type-meta"><span>CO₂</span><strong>{info.co2_text}</strong></div>
-                      <div class="type-sub">{info.subtext}</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
-        st.markdown("</div>", unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        selected_type_code = st.session_state.get("planning_selected_type", selected_type)
-        selected_info = TYPE_INFOS.get(selected_type_code, TYPE_INFOS["sedum"])
-
-        st.markdown('<div class="block">', unsafe_allow_html=True)
-        st.markdown('<div class="block-title">선택 유형 상세</div>', unsafe_allow_html=True)
-        st.markdown(
-            f"""
-            <div class="detail-panel">
-              <div class="detail-head">
-                <div class="detail-title">
-                  <span class="detail-icon">{selected_info.icon}</span>
-                  <span>{selected_info.label}</span>
-                </div>
-                <div class="detail-tag">상세 패널</div>
-              </div>
-              <div class="detail-grid">
-                <div class="detail-item">
-                  <div class="k">추천 식물</div>
-                  <div class="v">{selected_info.detail_recommendation}</div>
-                </div>
-                <div class="detail-item">
-                  <div class="k">CO₂ 흡수량</div>
-                  <div class="v">{selected_info.detail_co2}</div>
-                </div>
-                <div class="detail-item">
-                  <div class="k">온도 저감</div>
-                  <div class="v">{selected_info.detail_temp}</div>
-                </div>
-                <div class="detail-item">
-                  <div class="k">특징</div>
-                  <div class="v">{selected_info.detail_feature}</div>
-                </div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown('<div class="block">', unsafe_allow_html=True)
-        st.markdown('<div class="block-title">녹화 비율</div>', unsafe_allow_html=True)
-
-        st.markdown('<div class="slider-row slider-holder">', unsafe_allow_html=True)
-        slider_col, pct_col = st.columns([9, 1], gap="small")
-        with slider_col:
-            slider_value = st.slider(
-                "녹화 비율(%)",
-                min_value=0,
-                max_value=100,
-                step=5,
-                value=int(round(coverage_ratio * 100)),
-                label_visibility="collapsed",
-                key="planning_slider",
-            )
-        with pct_col:
-            st.markdown(
-                f'<div class="slider-pill"><strong>{slider_value}%</strong></div>',
-                unsafe_allow_html=True,
-            )
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown(
-            f"""
-            <div class="preview">
-              <div class="preview-item">
-                <div class="k">녹지 면적</div>
-                <div class="v">{_format_number(green_area_m2)}㎡</div>
-              </div>
-              <div class="preview-item">
-                <div class="k">예상 CO₂ 흡수</div>
-                <div class="v">{_format_decimal(co2_absorption_kg)}kg/년</div>
-              </div>
-              <div class="preview-item">
-                <div class="k">예상 온도 저감</div>
-                <div class="v">{_format_decimal(temp_reduction_c)}℃</div>
-              </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        _render_plan_editor(selected_type, coverage_ratio, preview)
 
         st.markdown('<div class="cta-row">', unsafe_allow_html=True)
         prev_col, save_col, next_col = st.columns([1, 1, 1], gap="small")
@@ -420,7 +452,7 @@ def render_planning_ui(
 
     with right_col:
         st.markdown(
-            """
+            minify_html("""
             <section class="card">
               <div class="card-title">도움말</div>
               <ul class="bullets">
@@ -431,12 +463,12 @@ def render_planning_ui(
               <div class="divider"></div>
               <a class="link" href="#">데이터 근거 보기 →</a>
             </section>
-            """,
+            """),
             unsafe_allow_html=True,
         )
 
         st.markdown(
-            """
+            minify_html("""
             <section class="card">
               <div class="card-title">다음 단계</div>
               <div class="mini">
@@ -446,13 +478,15 @@ def render_planning_ui(
               <div class="divider"></div>
               <a class="btn btn-secondary" href="#" style="width:100%;">결과 페이지 미리보기</a>
             </section>
-            """,
+            """),
             unsafe_allow_html=True,
         )
 
     st.markdown("</div></div></main>", unsafe_allow_html=True)
 
-    active_ratio = st.session_state.get("planning_slider", slider_value) / 100
+    # 프래그먼트는 값을 반환하지 않으므로 위젯 상태(session_state)에서 최종 선택값을 읽습니다.
+    selected_type_code = st.session_state.get("planning_selected_type", selected_type)
+    active_ratio = st.session_state.get("planning_slider", int(round(coverage_ratio * 100))) / 100
 
     return {
         "selected_type": selected_type_code,
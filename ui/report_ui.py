@@ -5,6 +5,8 @@ import html
 
 import streamlit as st
 
+from components.common.assets import minify_html
+
 
 GREENING_LABELS = {
     "grass": "잔디",
@@ -64,7 +66,7 @@ def render_report_ui(
     # )
 
     st.html(
-        """
+        minify_html("""
 <style>
 *{box-sizing:border-box;margin:0;padding:0}
 html,body{height:100%}
@@ -205,7 +207,7 @@ button,input{font:inherit}
   .cta-row .stButton>button{width:100%}
 }
 </style>
-"""
+""")
     )
 
     st.html('<main class="page">')
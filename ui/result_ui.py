@@ -4,6 +4,8 @@ import html
 
 import streamlit as st
 
+from components.common.assets import minify_html
+
 
 GREENING_LABELS = {
     "grass": "잔디",
@@ -61,7 +63,7 @@ def render_result_ui(
     pine_factor_text = _format_number(pine_factor_kg_per_year, decimals=1) if pine_factor_kg_per_year is not None else None
 
     st.html(
-        """
+        minify_html("""
 <style>
 /* Component Styles */
 .section-header { padding: 6px 0 10px; }
@@ -180,7 +182,7 @@ def render_result_ui(
 .cta-row .stButton.next > button:hover { background: #2f855a; }
 .cta-row .stButton.prev > button:hover { background: #fff; }
 </style>
-"""
+""")
     )
 
     # st.html('<main class="page">')